@@ -1,30 +1,53 @@
 """FastAPI application for TOON converter."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 import json
 
 from toon_converter import (
-    json_to_toon,
-    toon_to_json,
     validate_json,
     validate_toon,
     get_error_details
 )
+from toon_converter.exceptions import TOONLimitError
+from .limits import DEFAULT_MAX_DEPTH, DEFAULT_MAX_NODES, RequestLimitMiddleware, env_limit
 from .models import (
+    AutoConvertRequest,
+    AutoConvertResponse,
     ConvertRequest,
     ConvertResponse,
     ValidateRequest,
     ValidateResponse,
     ErrorResponse
 )
+from . import workers
+from .workers import ConversionPool, PoolSaturated
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the conversion worker pool (configured from TOON_API_* variables)."""
+    app.state.pool = ConversionPool.from_env()
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown()
+
 
 app = FastAPI(
     title="TOON Converter API",
     description="Convert between JSON and TOON (Token-Oriented Object Notation) formats",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
+# Request limits (TOON_API_MAX_BODY_BYTES, TOON_API_MAX_DEPTH, TOON_API_MAX_NODES)
+app.add_middleware(RequestLimitMiddleware)
+MAX_DEPTH = env_limit("TOON_API_MAX_DEPTH", DEFAULT_MAX_DEPTH)
+MAX_NODES = env_limit("TOON_API_MAX_NODES", DEFAULT_MAX_NODES)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -44,7 +67,8 @@ async def root():
         "endpoints": {
             "convert": {
                 "json_to_toon": "/convert/json-to-toon",
-                "toon_to_json": "/convert/toon-to-json"
+                "toon_to_json": "/convert/toon-to-json",
+                "auto": "/convert/auto"
             },
             "validate": {
                 "json": "/validate/json",
@@ -58,8 +82,14 @@ async def root():
 async def convert_json_to_toon(request: ConvertRequest):
     """Convert JSON to TOON format."""
     try:
-        result = json_to_toon(request.data, indent=request.indent)
+        result = await app.state.pool.run(
+            workers.convert_json_to_toon, request.data, request.indent, MAX_DEPTH, MAX_NODES
+        )
         return ConvertResponse(result=result, format="toon")
+    except PoolSaturated as e:
+        raise _unavailable(e)
+    except TOONLimitError as e:
+        raise HTTPException(status_code=422, detail={"error": str(e)})
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -71,9 +101,33 @@ async def convert_json_to_toon(request: ConvertRequest):
 async def convert_toon_to_json(request: ValidateRequest):
     """Convert TOON to JSON format."""
     try:
-        data = toon_to_json(request.data)
-        result = json.dumps(data, indent=2)
+        result = await app.state.pool.run(
+            workers.convert_toon_to_json, request.data, MAX_DEPTH, MAX_NODES
+        )
         return ConvertResponse(result=result, format="json")
+    except PoolSaturated as e:
+        raise _unavailable(e)
+    except TOONLimitError as e:
+        raise HTTPException(status_code=422, detail={"error": str(e)})
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": str(e), "details": get_error_details(e)}
+        )
+
+
+@app.post("/convert/auto", response_model=AutoConvertResponse)
+async def convert_auto(request: AutoConvertRequest):
+    """Detect JSON, NDJSON or TOON input from its first few KB and convert it."""
+    try:
+        detected, result, output_format = await app.state.pool.run(
+            workers.convert_auto, request.data, request.indent, MAX_DEPTH, MAX_NODES
+        )
+        return AutoConvertResponse(result=result, format=output_format, detected=detected)
+    except PoolSaturated as e:
+        raise _unavailable(e)
+    except TOONLimitError as e:
+        raise HTTPException(status_code=422, detail={"error": str(e)})
     except Exception as e:
         raise HTTPException(
             status_code=400,
@@ -117,4 +171,13 @@ async def validate_toon_endpoint(request: ValidateRequest):
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    pool = app.state.pool
+    return {"status": "healthy", "workers": pool.workers, "pending": pool.pending}
+
+
+def _unavailable(error: PoolSaturated) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail={"error": str(error)},
+        headers={"Retry-After": str(error.retry_after)},
+    )
@@ -0,0 +1,124 @@
+"""Request limits for the API."""
+
+import json
+import os
+from typing import Optional
+
+from toon_converter.exceptions import TOONLimitError
+from toon_converter.limits import JSONShapeScanner
+
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+DEFAULT_MAX_DEPTH = 512
+DEFAULT_MAX_NODES = 1_000_000
+
+
+def env_limit(name: str, default: int) -> Optional[int]:
+    """Read an integer limit from the environment; 0 disables it."""
+    value = int(os.environ.get(name, default))
+    return value or None
+
+
+def _limit(value: Optional[int], name: str, default: int) -> Optional[int]:
+    return env_limit(name, default) if value is None else value or None
+
+
+class RequestLimitMiddleware:
+    """ASGI middleware enforcing body size, nesting depth and value count.
+
+    The declared Content-Length is checked before the body is read.
+    Streamed bodies are counted as they arrive, and JSON bodies are
+    scanned chunk by chunk. An oversized body gets 413 and an overly
+    deep or large document gets 422, both before the app buffers or
+    parses the rest.
+
+    Limits default to TOON_API_MAX_BODY_BYTES, TOON_API_MAX_DEPTH and
+    TOON_API_MAX_NODES; 0 disables a limit.
+    """
+
+    def __init__(
+        self,
+        app,
+        max_bytes: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+    ):
+        self.app = app
+        # None reads the environment; 0 disables a limit, as it does there
+        self.max_bytes = _limit(max_bytes, "TOON_API_MAX_BODY_BYTES", DEFAULT_MAX_BODY_BYTES)
+        self.max_depth = _limit(max_depth, "TOON_API_MAX_DEPTH", DEFAULT_MAX_DEPTH)
+        self.max_nodes = _limit(max_nodes, "TOON_API_MAX_NODES", DEFAULT_MAX_NODES)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        scanner = None
+        for name, value in scope.get("headers", ()):
+            if name == b"content-length" and self.max_bytes is not None:
+                try:
+                    declared = int(value)
+                except ValueError:
+                    declared = 0
+                if declared > self.max_bytes:
+                    await self._reject(send, 413, f"Request body exceeds {self.max_bytes} bytes")
+                    return
+            elif name == b"content-type" and b"json" in value:
+                if self.max_depth is not None or self.max_nodes is not None:
+                    scanner = JSONShapeScanner(self.max_depth, self.max_nodes)
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def limited_receive():
+            # Past a limit, answer the client here and tell the app it left,
+            # so its own body parsing cannot turn the rejection into a 400
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                received += len(chunk)
+                error = None
+                if self.max_bytes is not None and received > self.max_bytes:
+                    error = (413, f"Request body exceeds {self.max_bytes} bytes")
+                elif scanner is not None:
+                    try:
+                        scanner.feed(chunk)
+                    except TOONLimitError as e:
+                        error = (422, str(e))
+                if error is not None:
+                    rejected = True
+                    if not response_started:
+                        await self._reject(send, *error)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except Exception:
+            if not rejected:
+                raise
+
+    async def _reject(self, send, status: int, message: str):
+        body = json.dumps({"detail": {"error": message}}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
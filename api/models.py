@@ -16,6 +16,17 @@ class ConvertResponse(BaseModel):
     format: str = Field(..., description="Output format (json or toon)")
 
 
+class AutoConvertRequest(BaseModel):
+    """Request model for conversion with format detection."""
+    data: str = Field(..., description="JSON, NDJSON or TOON text to convert")
+    indent: int = Field(2, description="Indentation spaces for TOON output", ge=1, le=8)
+
+
+class AutoConvertResponse(ConvertResponse):
+    """Response model for conversion with format detection."""
+    detected: str = Field(..., description="Detected input format (json, ndjson or toon)")
+
+
 class ValidateRequest(BaseModel):
     """Request model for validation."""
     data: str = Field(..., description="Data to validate")
@@ -0,0 +1,53 @@
+"""Production entry point for the TOON converter API.
+
+Two layouts are supported:
+
+* ``--pool-workers N`` (default: one per core): a single uvicorn process
+  handles HTTP and dispatches conversions to N converter processes.
+* ``--workers N --pool-workers 0``: N uvicorn processes, each converting
+  on its own event loop.
+
+Examples:
+    python -m api.server --port 8000 --queue-depth 128
+    python -m api.server --workers 4 --pool-workers 0
+"""
+
+import argparse
+import os
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the TOON converter API")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port (default: 8000)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="uvicorn worker processes (default: 1)")
+    parser.add_argument("--pool-workers", type=int, default=None,
+                        help="Converter processes per uvicorn worker; 0 converts inline (default: CPU count)")
+    parser.add_argument("--queue-depth", type=int, default=None,
+                        help="Conversions in flight before answering 503 (default: 64)")
+    parser.add_argument("--max-body-bytes", type=int, default=None,
+                        help="Largest accepted request body (default: 10 MiB)")
+    parser.add_argument("--max-depth", type=int, default=None,
+                        help="Deepest accepted document nesting (default: 512)")
+    parser.add_argument("--max-nodes", type=int, default=None,
+                        help="Most values accepted in one document (default: 1000000)")
+    args = parser.parse_args(argv)
+
+    # uvicorn workers import the app fresh, so settings travel by environment
+    for name, value in (
+        ("TOON_API_WORKERS", args.pool_workers),
+        ("TOON_API_QUEUE_DEPTH", args.queue_depth),
+        ("TOON_API_MAX_BODY_BYTES", args.max_body_bytes),
+        ("TOON_API_MAX_DEPTH", args.max_depth),
+        ("TOON_API_MAX_NODES", args.max_nodes),
+    ):
+        if value is not None:
+            os.environ[name] = str(value)
+
+    import uvicorn
+    uvicorn.run("api.app:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Conversion worker pool with bounded queueing for the API."""
+
+import asyncio
+import math
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from toon_converter import json_to_toon, toon_to_json
+from toon_converter.deepjson import dumps
+from toon_converter.detect import SNIFF_SIZE, detect_format
+
+DEFAULT_QUEUE_DEPTH = 64
+
+
+class PoolSaturated(Exception):
+    """Raised when the pool already has ``queue_depth`` requests in flight."""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__(f"Conversion pool saturated, retry after {retry_after}s")
+
+
+class ConversionPool:
+    """Runs CPU-bound conversions off the event loop.
+
+    Requests beyond ``queue_depth`` (running plus waiting) are rejected
+    with ``PoolSaturated`` instead of queueing without bound, so the API
+    can answer 503 while the workers catch up.
+
+    Args:
+        workers: Number of worker processes; 0 runs conversions inline on
+            the event loop (the behaviour of a plain ``uvicorn`` worker)
+        queue_depth: Maximum number of requests in flight
+        executor: Executor to use instead of a ``ProcessPoolExecutor``
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+        executor: Optional[Executor] = None,
+    ):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.pending = 0
+        # Moving average of task duration, for Retry-After
+        self._average = 0.0
+        if executor is None and workers > 0:
+            executor = ProcessPoolExecutor(workers)
+        self._executor = executor
+
+    @classmethod
+    def from_env(cls) -> "ConversionPool":
+        """Build a pool from TOON_API_WORKERS and TOON_API_QUEUE_DEPTH."""
+        workers = os.environ.get("TOON_API_WORKERS")
+        return cls(
+            workers=int(workers) if workers else None,
+            queue_depth=int(os.environ.get("TOON_API_QUEUE_DEPTH", DEFAULT_QUEUE_DEPTH)),
+        )
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """Run ``func(*args)`` in a worker.
+
+        Raises:
+            PoolSaturated: If ``queue_depth`` requests are already in flight
+        """
+        if self.pending >= self.queue_depth:
+            raise PoolSaturated(self.retry_after())
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            if self._executor is None:
+                return func(*args)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.pending -= 1
+            elapsed = time.perf_counter() - start
+            self._average = elapsed if not self._average else 0.9 * self._average + 0.1 * elapsed
+
+    def retry_after(self) -> int:
+        """Seconds until the queue is expected to drain, at least 1."""
+        slots = max(self.workers, 1)
+        return max(1, math.ceil(self._average * self.pending / slots))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+# Worker functions run in the pool processes, so they must be importable
+# at module level. JSON is serialized in the worker to keep the front-end
+# process free of CPU-bound work.
+
+def convert_json_to_toon(
+    data: Any, indent: int, max_depth: Optional[int] = None, max_nodes: Optional[int] = None
+) -> str:
+    return json_to_toon(data, indent=indent, max_depth=max_depth, max_nodes=max_nodes)
+
+
+def convert_toon_to_json(
+    toon_str: str, max_depth: Optional[int] = None, max_nodes: Optional[int] = None
+) -> str:
+    return dumps(toon_to_json(toon_str, max_depth=max_depth, max_nodes=max_nodes), indent=2)
+
+
+def convert_auto(
+    text: str, indent: int, max_depth: Optional[int] = None, max_nodes: Optional[int] = None
+) -> Tuple[str, str, str]:
+    """Convert JSON or NDJSON to TOON, or TOON to JSON, by sniffing ``text``.
+
+    Returns:
+        Tuple of (detected format, result, result format)
+    """
+    detected = detect_format(text[:SNIFF_SIZE])
+    if detected == "toon":
+        return detected, convert_toon_to_json(text, max_depth, max_nodes), "json"
+    if detected == "ndjson":
+        # Records become one JSON array, so limits are scanned as usual
+        text = "[" + ",".join(line for line in text.split("\n") if line.strip()) + "]"
+    return detected, json_to_toon(text, indent=indent, max_depth=max_depth, max_nodes=max_nodes), "toon"
@@ -1,75 +1,226 @@
-"""CLI tool for TOON converter."""
+"""CLI tool for TOON converter.
 
-import argparse
+Imports are deferred to the command that needs them: the CLI is often run
+thousands of times from shell scripts, where interpreter startup dominates
+small conversions.
+"""
+
+import os
 import sys
-import json
-from pathlib import Path
-from toon_converter import json_to_toon, toon_to_json, validate_json, validate_toon
 
+# Input format for each file extension (after any compression suffix)
+FORMAT_EXTENSIONS = {'.json': 'json', '.ndjson': 'ndjson', '.jsonl': 'ndjson', '.toon': 'toon'}
 
-def convert_file(input_path: str, output_path: str = None):
-    """Convert file between JSON and TOON formats."""
-    input_file = Path(input_path)
+# Seconds between directory scans in 'toon watch'
+WATCH_INTERVAL = 0.5
+
+# Content hashes of converted sources, kept in the output directory
+WATCH_MANIFEST = '.toon-watch.json'
+
+# Default directory and size bound (bytes) of the conversion cache
+DEFAULT_CACHE_DIR = os.environ.get("TOON_CACHE_DIR")
+CACHE_SIZE = 256 * 1024 * 1024
+
+# Cache size in bytes per cache directory, as last counted by this process
+_cache_usage = {}
+
+# Default socket for 'toon serve' and 'toon --daemon': in the per-user
+# runtime directory, or else in a private (0700) directory under /tmp
+_SOCKET_DIR = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(
+    os.environ.get("TMPDIR") or "/tmp", f"toon-{os.getuid() if hasattr(os, 'getuid') else 0}"
+)
+DEFAULT_SOCKET = os.environ.get("TOON_SOCKET") or os.path.join(_SOCKET_DIR, "toon.sock")
+
+
+def convert_file(input_path: str, output_path: str = None, source_format: str = None,
+                 cache_dir: str = None, cache_size: int = CACHE_SIZE):
+    """Convert file between JSON and TOON formats.
     
-    if not input_file.exists():
+    Compressed files (.gz, .bz2, .xz, .zst) are read and written as
+    streams, so the decompressed text never lands on disk.
+    
+    The input format comes from the file extension, or from
+    ``source_format`` ("json", "ndjson", "toon", or "auto" to sniff the
+    first few KB). NDJSON records are converted as one list.
+    
+    With ``cache_dir``, outputs are cached by input content (see
+    ``_cached_convert``), and an unchanged input is copied from the cache
+    instead of being converted.
+    """
+    from toon_converter.stream import split_compression
+    
+    if not os.path.exists(input_path):
         print(f"Error: File '{input_path}' not found")
         sys.exit(1)
     
-    content = input_file.read_text(encoding='utf-8')
-    
-    # Detect format by extension
-    if input_file.suffix.lower() == '.json':
-        # JSON to TOON
+    # Detect format by extension, ignoring a compression suffix
+    base, codec = split_compression(input_path)
+    stem, suffix = os.path.splitext(base)
+    suffix = suffix.lower()
+    if suffix not in FORMAT_EXTENSIONS:
+        # Extensionless or unknown: "blob" -> "blob.toon"
+        stem = base
+    if source_format == 'auto':
+        from toon_converter.detect import detect_file
+        from toon_converter.exceptions import TOONError
         try:
-            result = json_to_toon(content)
-            output_ext = '.toon'
-        except Exception as e:
-            print(f"Error converting JSON to TOON: {e}")
+            source_format = detect_file(input_path)
+        except TOONError as e:
+            print(f"Error: {e}")
             sys.exit(1)
-    elif input_file.suffix.lower() == '.toon':
-        # TOON to JSON
-        try:
-            data = toon_to_json(content)
-            result = json.dumps(data, indent=2)
-            output_ext = '.json'
-        except Exception as e:
-            print(f"Error converting TOON to JSON: {e}")
+    elif source_format is None:
+        source_format = FORMAT_EXTENSIONS.get(suffix)
+        if source_format is None:
+            print(f"Error: Unsupported file extension '{suffix}'")
+            print("Supported extensions: .json, .ndjson, .jsonl, .toon (optionally .gz, .bz2, .xz, .zst)")
+            print("Use --from auto to detect the format from the file's content")
             sys.exit(1)
+    output_ext = '.json' if source_format == 'toon' else '.toon'
+    
+    # Determine output path, keeping the input's compression by default
+    if output_path:
+        output_file = output_path
     else:
-        print(f"Error: Unsupported file extension '{input_file.suffix}'")
-        print("Supported extensions: .json, .toon")
+        output_file = stem + output_ext + (input_path[len(base):] if codec else '')
+    
+    try:
+        cached = _cached_convert(input_path, output_file, source_format, cache_dir, cache_size)
+    except Exception as e:
+        direction = "TOON to JSON" if source_format == 'toon' else f"{source_format.upper()} to TOON"
+        print(f"Error converting {direction}: {e}")
         sys.exit(1)
     
-    # Determine output path
-    if output_path:
-        output_file = Path(output_path)
+    print(f"✓ Converted '{input_path}' -> '{output_file}'" + (" (cached)" if cached else ""))
+
+
+def _convert_path(input_path: str, output_file: str, source_format: str):
+    """Convert one file whose format is known; raises on failure."""
+    from toon_converter.deepjson import dump, loads
+    from toon_converter.stream import dump_toon, load_toon, open_compressed
+    
+    with open_compressed(input_path) as src:
+        if source_format == 'json':
+            data = loads(src.read())
+        elif source_format == 'ndjson':
+            data = [loads(line) for line in src if line.strip()]
+        else:
+            data = load_toon(src)
+    with open_compressed(output_file, 'w') as dst:
+        if source_format == 'toon':
+            # TOON to JSON
+            dump(data, dst, indent=2)
+        else:
+            # JSON to TOON
+            dump_toon(data, dst)
+
+
+def _cached_convert(input_path: str, output_file: str, source_format: str,
+                    cache_dir: str = None, cache_size: int = CACHE_SIZE, digest: str = None) -> bool:
+    """``_convert_path`` through the on-disk cache; returns whether it was a hit.
+    
+    Entries are output files named by a hash of the input's content
+    (``digest``, its sha256, is computed when not given), the converter
+    and output format versions, the input format and the output's
+    compression. A hit copies
+    the entry and refreshes its mtime; once the cache exceeds
+    ``cache_size`` bytes, the least recently used entries are deleted.
+    """
+    if cache_dir is None:
+        _convert_path(input_path, output_file, source_format)
+        return False
+    
+    import hashlib
+    import shutil
+    from toon_converter import FORMAT_VERSION, __version__
+    from toon_converter.stream import split_compression
+    
+    if digest is None:
+        digest = _file_digest(input_path)
+    codec = split_compression(output_file)[1]
+    key = f"{digest}\0{__version__}\0{FORMAT_VERSION}\0{source_format}\0{codec}"
+    key = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    entry = os.path.join(cache_dir, key[:2], key)
+    
+    try:
+        shutil.copyfile(entry, output_file)
+    except FileNotFoundError:
+        pass
     else:
-        output_file = input_file.with_suffix(output_ext)
+        os.utime(entry)
+        return True
+    
+    _convert_path(input_path, output_file, source_format)
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+    # Entries appear whole, even with several processes sharing the cache
+    temp = f"{entry}.{os.getpid()}.tmp"
+    shutil.copyfile(output_file, temp)
+    os.replace(temp, entry)
     
-    # Write output
-    output_file.write_text(result, encoding='utf-8')
-    print(f"✓ Converted '{input_path}' -> '{output_file}'")
+    usage = _cache_usage.get(cache_dir)
+    if usage is None:
+        usage = sum(size for _, size, _ in _cache_entries(cache_dir))
+    else:
+        usage += os.path.getsize(entry)
+    if usage > cache_size:
+        usage = _evict(cache_dir, cache_size)
+    _cache_usage[cache_dir] = usage
+    return False
+
+
+def _cache_entries(cache_dir: str) -> list:
+    """(mtime, size, path) of every cache entry."""
+    entries = []
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            if name.endswith('.tmp'):
+                continue
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+    return entries
+
+
+def _evict(cache_dir: str, cache_size: int) -> int:
+    """Delete least recently used entries down to 90% of ``cache_size``; returns the new size."""
+    entries = sorted(_cache_entries(cache_dir))
+    usage = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if usage <= cache_size * 0.9:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        usage -= size
+    return usage
 
 
 def validate_file(input_path: str):
     """Validate JSON or TOON file."""
-    input_file = Path(input_path)
+    from toon_converter import validate_json, validate_toon
+    from toon_converter.stream import open_compressed, split_compression
     
-    if not input_file.exists():
+    if not os.path.exists(input_path):
         print(f"Error: File '{input_path}' not found")
         sys.exit(1)
     
-    content = input_file.read_text(encoding='utf-8')
+    suffix = os.path.splitext(split_compression(input_path)[0])[1].lower()
+    if suffix not in ('.json', '.toon'):
+        print(f"Error: Unsupported file extension '{suffix}'")
+        sys.exit(1)
+    
+    with open_compressed(input_path) as f:
+        content = f.read()
     
-    if input_file.suffix.lower() == '.json':
+    if suffix == '.json':
         is_valid, error = validate_json(content)
         format_name = "JSON"
-    elif input_file.suffix.lower() == '.toon':
+    else:
         is_valid, error = validate_toon(content)
         format_name = "TOON"
-    else:
-        print(f"Error: Unsupported file extension '{input_file.suffix}'")
-        sys.exit(1)
     
     if is_valid:
         print(f"✓ Valid {format_name}: '{input_path}'")
@@ -79,8 +230,382 @@ def validate_file(input_path: str):
         sys.exit(1)
 
 
-def main():
+def index_file(input_path: str, output_path: str = None):
+    """Build a line-offset index sidecar for a TOON file."""
+    from pathlib import Path
+    from toon_converter.exceptions import TOONParseError
+    from toon_converter.index import INDEX_SUFFIX, build_index, save_index
+    
+    input_file = Path(input_path)
+    
+    if not input_file.exists():
+        print(f"Error: File '{input_path}' not found")
+        sys.exit(1)
+    
+    if input_file.suffix.lower() != '.toon':
+        print(f"Error: Unsupported file extension '{input_file.suffix}'")
+        print("Supported extensions: .toon")
+        sys.exit(1)
+    
+    try:
+        index = build_index(input_file)
+    except TOONParseError as e:
+        print(f"Error indexing TOON file: {e}")
+        sys.exit(1)
+    
+    index_path = output_path or f"{input_file}{INDEX_SUFFIX}"
+    save_index(index, index_path)
+    print(f"✓ Indexed '{input_path}' ({len(index['keys'])} keys) -> '{index_path}'")
+
+
+def diff_files(old_path: str, new_path: str, as_json: bool = False):
+    """Print the structural differences between two TOON files."""
+    import json
+    from toon_converter import diff_toon
+    from toon_converter.stream import open_compressed
+    
+    for path in (old_path, new_path):
+        if not os.path.exists(path):
+            print(f"Error: File '{path}' not found")
+            sys.exit(1)
+    
+    changed = False
+    with open_compressed(old_path) as old, open_compressed(new_path) as new:
+        for record in diff_toon(old, new):
+            changed = True
+            if as_json:
+                print(json.dumps(record))
+            elif record['op'] == 'add':
+                print(f"+ {record['path']}: {json.dumps(record['new'])}")
+            elif record['op'] == 'remove':
+                print(f"- {record['path']}: {json.dumps(record['old'])}")
+            else:
+                print(f"~ {record['path']}: {json.dumps(record['old'])} -> {json.dumps(record['new'])}")
+    
+    if changed:
+        sys.exit(1)
+
+
+def merge_files(input_paths: list, output_path: str = None, strategy: str = 'deep'):
+    """Merge TOON files into one document."""
+    from toon_converter import merge_toon
+    from toon_converter.stream import open_compressed
+    
+    for path in input_paths:
+        if not os.path.exists(path):
+            print(f"Error: File '{path}' not found")
+            sys.exit(1)
+    
+    fragments = []
+    for path in input_paths:
+        with open_compressed(path) as f:
+            fragments.append(f.read())
+    try:
+        result = merge_toon(fragments, strategy=strategy)
+    except Exception as e:
+        print(f"Error merging TOON files: {e}")
+        sys.exit(1)
+    
+    if output_path:
+        with open_compressed(output_path, 'w') as f:
+            f.write(result)
+        print(f"✓ Merged {len(input_paths)} files -> '{output_path}'")
+    else:
+        print(result)
+
+
+def watch(src_dir: str, out_dir: str, interval: float = WATCH_INTERVAL, workers: int = None, once: bool = False,
+          cache_dir: str = None, cache_size: int = CACHE_SIZE):
+    """Mirror a directory of JSON/NDJSON/TOON files, re-converting changed files.
+    
+    The source tree is polled every ``interval`` seconds. Only files whose
+    size or modification time changed are read, and only those whose
+    content hash differs from the last conversion are converted, in a
+    process pool of ``workers`` processes. Touched-but-unchanged files
+    are therefore skipped. Hashes are saved to ``WATCH_MANIFEST`` in
+    ``out_dir``, so a restarted watch only converts what changed while it
+    was stopped. Outputs of deleted sources are removed. ``out_dir`` may
+    be inside ``src_dir`` but must not be it or contain it; hidden files
+    and directories are not watched. ``cache_dir`` enables the conversion
+    cache, as for ``convert_file``.
+    """
+    import json
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+    from toon_converter import FORMAT_VERSION, __version__
+    
+    version = f"{__version__}/{FORMAT_VERSION}"
+    if not os.path.isdir(src_dir):
+        print(f"Error: Directory '{src_dir}' not found")
+        sys.exit(1)
+    # Outputs inside the watched tree would be converted back over their sources
+    real_out = os.path.realpath(out_dir)
+    if os.path.commonpath([real_out, os.path.realpath(src_dir)]) == real_out:
+        print(f"Error: Output directory '{out_dir}' must not be or contain '{src_dir}'")
+        sys.exit(1)
+    os.makedirs(out_dir, exist_ok=True)
+    
+    manifest_path = os.path.join(out_dir, WATCH_MANIFEST)
+    hashes = {}
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == version:
+            hashes = manifest['files']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    stats = {}
+    
+    print(f"✓ Watching '{src_dir}' -> '{out_dir}'" + ("" if once else " (Ctrl+C to stop)"))
+    sys.stdout.flush()
+    with ProcessPoolExecutor(workers) as pool:
+        try:
+            while True:
+                if _sync_tree(src_dir, out_dir, stats, hashes, pool, cache_dir, cache_size):
+                    with open(manifest_path, 'w', encoding='utf-8') as f:
+                        json.dump({'version': version, 'files': hashes}, f, indent=2, sort_keys=True)
+                sys.stdout.flush()
+                if once:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+
+def _sync_tree(src_dir: str, out_dir: str, stats: dict, hashes: dict, pool,
+               cache_dir: str = None, cache_size: int = CACHE_SIZE) -> bool:
+    """Convert new and changed files once; returns whether ``hashes`` changed.
+    
+    ``stats`` maps relative source paths to (mtime_ns, size) from the
+    previous scan and ``hashes`` to the content hash of their last
+    successful conversion. Both are updated in place.
+    """
+    from toon_converter.stream import split_compression
+    
+    skip_dir = os.path.realpath(out_dir)
+    current = {}
+    for root, dirs, files in os.walk(src_dir):
+        # Hidden directories, and the output directory when it is inside the source
+        dirs[:] = [d for d in dirs if not d.startswith('.') and os.path.realpath(os.path.join(root, d)) != skip_dir]
+        for name in files:
+            # Hidden files, WATCH_MANIFEST among them, are never sources
+            if name.startswith('.') or os.path.splitext(split_compression(name)[0])[1].lower() not in FORMAT_EXTENSIONS:
+                continue
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            current[os.path.relpath(path, src_dir)] = (st.st_mtime_ns, st.st_size)
+    
+    changed = False
+    jobs = []
+    for rel, stat in sorted(current.items()):
+        if stats.get(rel) == stat:
+            continue
+        stats[rel] = stat
+        path = os.path.join(src_dir, rel)
+        output_file, source_format = _watch_output(out_dir, rel)
+        try:
+            digest = _file_digest(path)
+        except OSError:
+            continue
+        if hashes.get(rel) == digest and os.path.exists(output_file):
+            continue
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        jobs.append((rel, digest, output_file, pool.submit(
+            _cached_convert, path, output_file, source_format, cache_dir, cache_size, digest)))
+    
+    # Sources deleted since the last scan, or while no watch was running
+    for rel in sorted((stats.keys() | hashes.keys()) - current.keys()):
+        stats.pop(rel, None)
+        if hashes.pop(rel, None) is not None:
+            changed = True
+            output_file = _watch_output(out_dir, rel)[0]
+            if os.path.exists(output_file):
+                os.unlink(output_file)
+            print(f"✓ Removed '{output_file}'")
+    
+    for rel, digest, output_file, job in jobs:
+        changed = True
+        try:
+            cached = job.result()
+        except Exception as e:
+            # Retried once the file changes again
+            hashes.pop(rel, None)
+            print(f"✗ Error converting '{os.path.join(src_dir, rel)}': {e}")
+        else:
+            hashes[rel] = digest
+            print(f"✓ Converted '{os.path.join(src_dir, rel)}' -> '{output_file}'" + (" (cached)" if cached else ""))
+    return changed
+
+
+def _file_digest(path: str) -> str:
+    """sha256 of a file's bytes, read in 1 MiB chunks."""
+    import hashlib
+    
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _watch_output(out_dir: str, rel: str) -> tuple:
+    """Output path and source format for a source path relative to the watched directory."""
+    from toon_converter.stream import split_compression
+    
+    base, codec = split_compression(rel)
+    stem, suffix = os.path.splitext(base)
+    source_format = FORMAT_EXTENSIONS[suffix.lower()]
+    output_ext = '.json' if source_format == 'toon' else '.toon'
+    return os.path.join(out_dir, stem + output_ext + rel[len(base):]), source_format
+
+
+def serve(socket_path: str = DEFAULT_SOCKET):
+    """Run a warm CLI worker that executes commands sent by 'toon --daemon'.
+    
+    Each request is handled in a forked child of the warm process (where
+    fork is available), so imports are paid once and requests cannot leak
+    working directory or output state into each other.
+    """
+    import io
+    import socketserver
+    from contextlib import redirect_stderr, redirect_stdout
+    
+    # Warm up the modules commands need
+    import json, pathlib, toon_converter.stream, toon_converter.validator, toon_converter.index  # noqa: F401
+    
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            cwd, _, argv = self.rfile.read().decode('utf-8').partition('\0')
+            stdout, stderr = io.StringIO(), io.StringIO()
+            code = 0
+            try:
+                os.chdir(cwd)
+                with redirect_stdout(stdout), redirect_stderr(stderr):
+                    main(argv.split('\0') if argv else [])
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:
+                stderr.write(f"Error: {e}\n")
+                code = 1
+            out = stdout.getvalue().encode('utf-8')
+            err = stderr.getvalue().encode('utf-8')
+            self.wfile.write(f"{code} {len(out)}\n".encode('ascii') + out + err)
+    
+    if hasattr(os, 'fork'):
+        class Server(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+            pass
+    else:
+        Server = socketserver.UnixStreamServer
+    
+    if socket_path == os.path.join(_SOCKET_DIR, "toon.sock"):
+        try:
+            os.mkdir(_SOCKET_DIR, 0o700)
+        except FileExistsError:
+            pass
+        if not _is_private_dir(_SOCKET_DIR):
+            print(f"Error: '{_SOCKET_DIR}' is not a directory only you can access; use --socket")
+            sys.exit(1)
+    if os.path.lexists(socket_path):
+        # Only replace a stale socket of our own, never another file
+        import stat
+        st = os.lstat(socket_path)
+        if not stat.S_ISSOCK(st.st_mode) or (hasattr(os, 'getuid') and st.st_uid != os.getuid()):
+            print(f"Error: '{socket_path}' exists and is not a socket owned by you")
+            sys.exit(1)
+        os.unlink(socket_path)
+    with Server(socket_path, Handler) as server:
+        print(f"✓ Serving on '{socket_path}'")
+        sys.stdout.flush()
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def _is_private_dir(path: str) -> bool:
+    """Whether ``path`` is a real directory owned by this user and closed to others."""
+    import stat
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if hasattr(os, 'getuid') and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & 0o077
+
+
+def run_client(argv: list, socket_path: str = DEFAULT_SOCKET) -> int:
+    """Send a command to a running 'toon serve' worker.
+    
+    Falls back to running the command in this process when no worker is
+    listening, or when the default socket's directory is not private to
+    this user. Returns the command's exit code.
+    """
+    import socket
+    
+    payload = '\0'.join([os.getcwd()] + argv).encode('utf-8')
+    try:
+        if socket_path == os.path.join(_SOCKET_DIR, "toon.sock") and not _is_private_dir(_SOCKET_DIR):
+            # Someone else could be listening there
+            raise FileNotFoundError(socket_path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(socket_path)
+            conn.sendall(payload)
+            conn.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except (FileNotFoundError, ConnectionRefusedError):
+        try:
+            main(argv)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        return 0
+    
+    response = b''.join(chunks)
+    header, _, body = response.partition(b'\n')
+    code, out_len = (int(part) for part in header.split())
+    sys.stdout.buffer.write(body[:out_len])
+    sys.stdout.flush()
+    sys.stderr.buffer.write(body[out_len:])
+    sys.stderr.flush()
+    return code
+
+
+def _add_cache_arguments(parser):
+    """Add the conversion cache options to a subcommand parser."""
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help='Reuse outputs of unchanged inputs from this directory (default: $TOON_CACHE_DIR)')
+    parser.add_argument('--cache-size', type=lambda mb: int(float(mb) * 1024 * 1024), default=CACHE_SIZE,
+                        metavar='MB', help=f'Cache size limit in MB (default: {CACHE_SIZE // (1024 * 1024)})')
+
+
+def main(argv: list = None):
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Thin client: skip argparse and the converter entirely
+    if argv[:1] == ['--daemon']:
+        argv = argv[1:]
+        socket_path = DEFAULT_SOCKET
+        if argv[:1] == ['--socket'] and len(argv) > 1:
+            socket_path, argv = argv[1], argv[2:]
+        sys.exit(run_client(argv, socket_path))
+    
+    import argparse
+    from toon_converter.merge import MERGE_STRATEGIES
+    
     parser = argparse.ArgumentParser(
         description='TOON Converter - Convert between JSON and TOON formats',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -88,7 +613,15 @@ def main():
 Examples:
   toon convert input.json -o output.toon
   toon convert input.toon -o output.json
+  toon convert archive.json.gz -o archive.toon.xz
+  toon convert --from auto blob
+  toon watch fixtures/ --out prompts/
   toon validate input.toon
+  toon index archive.toon
+  toon diff old.toon new.toon
+  toon merge base.toon extra.toon -o merged.toon
+  toon serve &
+  toon --daemon convert input.json
         """
     )
     
@@ -98,21 +631,68 @@ Examples:
     convert_parser = subparsers.add_parser('convert', help='Convert between formats')
     convert_parser.add_argument('input', help='Input file path')
     convert_parser.add_argument('-o', '--output', help='Output file path (optional)')
+    convert_parser.add_argument('--from', dest='source_format', choices=('auto', 'json', 'ndjson', 'toon'),
+                                help='Input format (default: from the extension; auto: detect from content)')
+    
+    _add_cache_arguments(convert_parser)
     
     # Validate command
     validate_parser = subparsers.add_parser('validate', help='Validate file format')
     validate_parser.add_argument('input', help='Input file path')
     
-    args = parser.parse_args()
+    # Index command
+    index_parser = subparsers.add_parser('index', help='Build a random-access index for a TOON file')
+    index_parser.add_argument('input', help='Input TOON file path')
+    index_parser.add_argument('-o', '--output', help='Index file path (default: INPUT.idx)')
+    
+    # Diff command
+    diff_parser = subparsers.add_parser('diff', help='Show path-level differences between two TOON files')
+    diff_parser.add_argument('old', help='Old TOON file path')
+    diff_parser.add_argument('new', help='New TOON file path')
+    diff_parser.add_argument('--json', action='store_true', help='Print one JSON record per line')
+    
+    # Merge command
+    merge_parser = subparsers.add_parser('merge', help='Merge TOON files')
+    merge_parser.add_argument('inputs', nargs='+', help='Input TOON file paths')
+    merge_parser.add_argument('-o', '--output', help='Output file path (default: stdout)')
+    merge_parser.add_argument('--strategy', choices=MERGE_STRATEGIES, default='deep',
+                              help='How to resolve keys defined in several files (default: deep)')
+    
+    # Watch command
+    watch_parser = subparsers.add_parser('watch', help='Mirror a directory, re-converting files as they change')
+    watch_parser.add_argument('source', help='Directory of .json/.ndjson/.jsonl/.toon files')
+    watch_parser.add_argument('--out', required=True, help='Output directory')
+    watch_parser.add_argument('--interval', type=float, default=WATCH_INTERVAL,
+                              help=f'Seconds between scans (default: {WATCH_INTERVAL})')
+    watch_parser.add_argument('--workers', type=int, help='Conversion processes (default: CPU count)')
+    watch_parser.add_argument('--once', action='store_true', help='Convert what changed, then exit')
+    _add_cache_arguments(watch_parser)
+    
+    # Serve command
+    serve_parser = subparsers.add_parser('serve', help='Run a warm worker for --daemon clients')
+    serve_parser.add_argument('--socket', default=DEFAULT_SOCKET,
+                              help=f'Unix socket path (default: {DEFAULT_SOCKET})')
+    
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
         sys.exit(1)
     
     if args.command == 'convert':
-        convert_file(args.input, args.output)
+        convert_file(args.input, args.output, args.source_format, args.cache_dir, args.cache_size)
     elif args.command == 'validate':
         validate_file(args.input)
+    elif args.command == 'index':
+        index_file(args.input, args.output)
+    elif args.command == 'diff':
+        diff_files(args.old, args.new, args.json)
+    elif args.command == 'merge':
+        merge_files(args.inputs, args.output, args.strategy)
+    elif args.command == 'watch':
+        watch(args.source, args.out, args.interval, args.workers, args.once, args.cache_dir, args.cache_size)
+    elif args.command == 'serve':
+        serve(args.socket)
 
 
 if __name__ == '__main__':
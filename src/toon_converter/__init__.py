@@ -1,19 +1,89 @@
 """TOON Converter - Token-Oriented Object Notation for LLM prompts."""
 
 __version__ = "0.1.0"
+# Bumped whenever the same input converts to different output, so caches
+# keyed on it (the CLI's conversion cache and watch manifest) go stale
+FORMAT_VERSION = 2
+
+from importlib import import_module
 
 from .core import json_to_toon, toon_to_json
-from .validator import validate_json, validate_toon, get_error_details
-from .exceptions import TOONError, TOONParseError, TOONValidationError, JSONValidationError
+from .exceptions import TOONError, TOONParseError, TOONLimitError, TOONValidationError, JSONValidationError
+
+# Everything beyond the core converters is imported on first access so
+# that short-lived processes (e.g. the CLI) only pay for what they use.
+_LAZY_ATTRIBUTES = {
+    "validate_json": ".validator",
+    "validate_toon": ".validator",
+    "get_error_details": ".validator",
+    "toon_to_columns": ".columnar",
+    "columns_to_toon": ".columnar",
+    "lazy_load": ".lazy",
+    "LazyMapping": ".lazy",
+    "LazySequence": ".lazy",
+    "IndexedToonFile": ".index",
+    "build_index": ".index",
+    "IncrementalEncoder": ".incremental",
+    "diff_toon": ".diff",
+    "merge_toon": ".merge",
+    "dump_toon": ".stream",
+    "load_toon": ".stream",
+    "open_compressed": ".stream",
+    "pack_toon": ".container",
+    "unpack_toon": ".container",
+    "shape_hash": ".container",
+    "register_encoder": ".objects",
+    "Encoder": ".codec",
+    "Decoder": ".codec",
+    "aencode": ".aio",
+    "adecode": ".aio",
+    "detect_format": ".detect",
+}
 
 __all__ = [
     "json_to_toon",
     "toon_to_json",
+    "toon_to_columns",
+    "columns_to_toon",
+    "lazy_load",
+    "LazyMapping",
+    "LazySequence",
+    "IndexedToonFile",
+    "build_index",
+    "IncrementalEncoder",
+    "diff_toon",
+    "merge_toon",
+    "dump_toon",
+    "load_toon",
+    "open_compressed",
+    "pack_toon",
+    "unpack_toon",
+    "shape_hash",
+    "register_encoder",
+    "Encoder",
+    "Decoder",
+    "aencode",
+    "adecode",
+    "detect_format",
     "validate_json",
     "validate_toon",
     "get_error_details",
     "TOONError",
     "TOONParseError",
+    "TOONLimitError",
     "TOONValidationError",
     "JSONValidationError",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
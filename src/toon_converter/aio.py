@@ -0,0 +1,113 @@
+"""Asyncio stream conversion that yields to the event loop as it goes."""
+
+import asyncio
+import codecs
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional
+
+from .core import KEY_ALIAS_PREFIX, _HOLD, _build_key_aliases, _iter_toon_chunks, _parse_lines, json_to_toon
+
+# Lines per write when encoding; a few milliseconds of work each
+AIO_CHUNK_LINES = 1024
+
+# Bytes per read when decoding
+AIO_READ_SIZE = 64 * 1024
+
+
+async def aencode(
+    data: Any,
+    writer: Any,
+    indent: int = 2,
+    compact: bool = False,
+    indent_char: str = " ",
+    key_aliases: Optional[bool] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+    fidelity: bool = False,
+) -> None:
+    """Write ``data`` as UTF-8 TOON to an ``asyncio.StreamWriter``.
+
+    Output is identical to ``json_to_toon`` with the same options. It is
+    written every ``AIO_CHUNK_LINES`` lines, and the writer is drained,
+    with control returned to the event loop between chunks. Other tasks
+    therefore keep running during large conversions. Key aliases (compact
+    mode) are still collected in one pass before the first write.
+
+    Args:
+        data: JSON data (dict, list, or a supported object)
+        writer: ``asyncio.StreamWriter``, or any object with ``write(bytes)``
+            and a coroutine ``drain()``
+        indent, compact, indent_char, key_aliases, default, fidelity:
+            As for ``json_to_toon``
+
+    Example:
+        >>> await aencode(records, writer)
+        >>> writer.close()
+    """
+    if not isinstance(data, (dict, list)) or not data:
+        writer.write(json_to_toon(data, indent, compact, indent_char, key_aliases, default=default, fidelity=fidelity).encode("utf-8"))
+        await writer.drain()
+        return
+
+    if compact:
+        indent = 1
+    if key_aliases is None:
+        key_aliases = compact
+    aliases = _build_key_aliases(data, default) if key_aliases else {}
+    for chunk in _iter_toon_chunks(data, indent, indent_char, aliases, AIO_CHUNK_LINES, default, fidelity):
+        writer.write(chunk.encode("utf-8"))
+        await writer.drain()
+        # drain() only waits when the transport buffer is full
+        await asyncio.sleep(0)
+
+
+async def adecode(reader: asyncio.StreamReader) -> Any:
+    """Read UTF-8 TOON from an ``asyncio.StreamReader`` until EOF and parse it.
+
+    Equivalent to ``toon_to_json`` on the whole stream. Each block of
+    ``AIO_READ_SIZE`` bytes is parsed as it arrives, and control returns
+    to the event loop between blocks. The text is never held in full.
+
+    Args:
+        reader: ``asyncio.StreamReader``, or any object with a coroutine
+            ``read(n)`` returning bytes (``b""`` at EOF)
+
+    Returns:
+        Parsed JSON data
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    aliases: Dict[str, str] = {}
+    stack = [({}, -1)]
+    lines: List[str] = []
+    partial = ""
+    first = True
+    header = True
+
+    while True:
+        block = await reader.read(AIO_READ_SIZE)
+        text = partial + decoder.decode(block, final=not block)
+        pieces = text.split("\n")
+        partial = pieces.pop() if block else ""
+        for line in pieces:
+            if not line.strip():
+                continue
+            if first:
+                # toon_to_json strips the document, which dedents its first line
+                line = line.lstrip()
+                first = False
+            if header:
+                if line.startswith(KEY_ALIAS_PREFIX):
+                    alias, _, key = line.rstrip("\r")[len(KEY_ALIAS_PREFIX):].partition("=")
+                    aliases[alias] = key
+                    continue
+                header = False
+            lines.append(line)
+        if not block:
+            break
+        if len(lines) > 1:
+            # The alias table doubles as the key table, as in load_toon
+            _parse_lines(chain(lines, (_HOLD,)), aliases, aliases, stack)
+            del lines[:-1]
+        await asyncio.sleep(0)
+
+    _parse_lines(lines, aliases, aliases, stack)
+    return stack[0][0]
@@ -0,0 +1,142 @@
+"""Reusable encoder and decoder objects for repeated conversions."""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .core import _build_key_aliases, _document_lines, _iter_toon_chunks, _parse_lines, json_to_toon, toon_to_json
+
+# Interned keys a Decoder keeps before starting over
+_KEY_CACHE_SIZE = 65536
+
+
+class Encoder:
+    """Encode JSON data to TOON with fixed options, reusing work between calls.
+
+    The encoder keeps the indentation strings and the rendered "key:"
+    prefix of every key and level it has seen, so documents with the same
+    keys (API responses, log records) skip rendering them again. Output
+    is identical to ``json_to_toon`` with the same options. Documents
+    with key aliases (compact mode) have their own prefixes and do not
+    use the cache.
+
+    Thread safety: an instance may be shared between threads. Calls hold
+    an internal lock, so they run one at a time. For parallel encoding
+    give each thread its own encoder (``threading.local``) or take one
+    from a pool.
+
+    Example:
+        >>> encoder = Encoder(indent=2)
+        >>> encoder.encode({"name": "Alice"})
+        'name: Alice'
+    """
+
+    def __init__(
+        self,
+        indent: int = 2,
+        compact: bool = False,
+        indent_char: str = " ",
+        key_aliases: Optional[bool] = None,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        default: Optional[Callable[[Any], Any]] = None,
+        fidelity: bool = False,
+    ):
+        if compact:
+            indent = 1
+        if key_aliases is None:
+            key_aliases = compact
+        self.indent = indent
+        self.indent_char = indent_char
+        self.key_aliases = key_aliases
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.default = default
+        self.fidelity = fidelity
+        # Per-level "key:" prefix caches, see core._iter_toon_chunks
+        self._prefixes: List[dict] = []
+        self._lock = threading.Lock()
+
+    def encode(self, data: Union[dict, list, str, Any]) -> str:
+        """Encode ``data`` like ``json_to_toon``.
+
+        Args:
+            data: JSON data (dict, list, JSON string, or a supported object)
+
+        Returns:
+            TOON formatted string
+
+        Raises:
+            TOONLimitError: If a limit is exceeded
+        """
+        if not isinstance(data, (dict, list)) or not data:
+            # JSON text, objects, scalars and empty containers
+            return json_to_toon(
+                data, self.indent, False, self.indent_char, self.key_aliases,
+                self.max_depth, self.max_nodes, self.default, self.fidelity,
+            )
+
+        if self.max_depth is not None or self.max_nodes is not None:
+            from .limits import check_data
+            check_data(data, self.max_depth, self.max_nodes)
+        aliases = _build_key_aliases(data, self.default) if self.key_aliases else {}
+        if aliases:
+            return "".join(_iter_toon_chunks(
+                data, self.indent, self.indent_char, aliases, default=self.default, fidelity=self.fidelity,
+            ))
+        with self._lock:
+            return "".join(_iter_toon_chunks(
+                data, self.indent, self.indent_char, aliases,
+                default=self.default, fidelity=self.fidelity, prefixes=self._prefixes,
+            ))
+
+
+class Decoder:
+    """Decode TOON with fixed options, sharing key strings between calls.
+
+    Keys are interned in a table kept by the decoder, so a key that
+    appears in every record of every decoded document is stored once.
+    This reduces the memory held by decoded results. Output is identical
+    to ``toon_to_json`` with the same options.
+
+    Thread safety: an instance may be shared between threads, and calls
+    run concurrently. The key table is only read and extended with
+    atomic dict operations.
+
+    Example:
+        >>> decoder = Decoder()
+        >>> decoder.decode("name: Alice")
+        {'name': 'Alice'}
+    """
+
+    def __init__(
+        self,
+        object_pairs_hook: Optional[Callable[[List[Tuple[str, Any]]], Any]] = None,
+        into: Any = None,
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+    ):
+        self.object_pairs_hook = object_pairs_hook
+        self.into = into
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self._keys: Dict[str, str] = {}
+
+    def decode(self, toon_str: str) -> Any:
+        """Decode ``toon_str`` like ``toon_to_json``.
+
+        Raises:
+            TOONLimitError: If a limit is exceeded
+            TOONParseError: If the document does not match ``into``
+        """
+        if self.into is not None or self.object_pairs_hook is not None:
+            # Typed decoders are already cached per class
+            return toon_to_json(toon_str, self.object_pairs_hook, self.max_depth, self.max_nodes, self.into)
+
+        lines, aliases = _document_lines(toon_str, self.max_depth, self.max_nodes)
+        if aliases:
+            # Aliases only apply to their own document
+            return _parse_lines(lines, aliases)
+        keys = self._keys
+        if len(keys) > _KEY_CACHE_SIZE:
+            keys.clear()
+        return _parse_lines(lines, aliases, keys)
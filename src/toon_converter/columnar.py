@@ -0,0 +1,355 @@
+"""Columnar decoding and encoding of TOON arrays of records."""
+
+from array import array
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .core import (
+    _parse_lines,
+    _parse_value,
+    _key_to_string,
+    _read_alias_header,
+    _simple_value_to_string,
+    _split_key_value,
+    json_to_toon,
+)
+from .exceptions import TOONParseError
+
+# Signed 64-bit range accepted by array("q")
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+# array.array typecodes whose values format as plain numbers
+_NUMERIC_TYPECODES = "bBhHiIlLqQfd"
+
+
+class _Column:
+    """Growable buffer for one field, typed by its first value.
+
+    Numeric columns live in ``array.array`` buffers. A value that does not
+    fit the column type demotes it to a plain list.
+    """
+
+    __slots__ = ("kind", "values")
+
+    def __init__(self, rows: int = 0):
+        # Columns that appear after the first row are back-filled with None
+        self.kind = "object" if rows else None
+        self.values = [None] * rows
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, raw: str) -> None:
+        """Append a raw scalar token."""
+        kind = self.kind
+        if kind == "int":
+            # Fast path: plain digits without a leading zero are always ints
+            if raw.isdigit() and (raw[0] != "0" or len(raw) == 1):
+                try:
+                    self.values.append(int(raw))
+                    return
+                except (ValueError, OverflowError):
+                    pass
+            self.append_value(_parse_value(raw))
+        elif kind is None:
+            self._start(_parse_value(raw))
+        else:
+            self.append_value(_parse_value(raw))
+
+    def append_value(self, value: Any) -> None:
+        """Append an already parsed value."""
+        kind = self.kind
+        if kind is None:
+            self._start(value)
+            return
+
+        if kind == "int" and type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+            self.values.append(value)
+        elif kind == "int" and type(value) is float:
+            self.values = array("d", self.values)
+            self.kind = "float"
+            self.values.append(value)
+        elif kind == "float" and type(value) in (int, float):
+            self.values.append(float(value))
+        else:
+            if kind != "object":
+                self.values = list(self.values)
+                self.kind = "object"
+            self.values.append(value)
+
+    def replace_last(self, value: Any) -> None:
+        """Overwrite the current row's value (repeated key in one record)."""
+        self.values.pop()
+        self.append_value(value)
+
+    def _start(self, value: Any) -> None:
+        if type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+            self.kind, self.values = "int", array("q", (value,))
+        elif type(value) is float:
+            self.kind, self.values = "float", array("d", (value,))
+        else:
+            self.kind, self.values = "object", [value]
+
+
+def toon_to_columns(toon_str: str, path: str = "items", backend: str = "auto") -> Dict[str, Any]:
+    """Parse a TOON array of records straight into per-field columns.
+
+    Args:
+        toon_str: TOON formatted string
+        path: Dotted key path of the array of records (e.g. "data.rows")
+        backend: "array" for ``array.array`` numeric columns, "numpy" for
+            NumPy arrays, or "auto" to use NumPy when it is installed
+
+    Returns:
+        Dictionary mapping field names to column buffers, in order of first
+        appearance. Numeric columns are ``array.array``/NumPy arrays, all
+        other columns (strings, booleans, nulls, nested values) are lists.
+        Fields missing from a record are filled with None.
+
+    Raises:
+        TOONParseError: If the path is missing or is not an array of records
+    """
+    if backend not in ("auto", "array", "numpy"):
+        raise ValueError(f"Unknown backend '{backend}'")
+
+    numpy = None
+    if backend != "array":
+        try:
+            import numpy
+        except ImportError:
+            if backend == "numpy":
+                raise
+
+    lines = [line for line in toon_str.split("\n") if line.strip()]
+    lines, aliases = _read_alias_header(lines)
+    indents = [len(line) - len(line.lstrip()) for line in lines]
+
+    start, end = _find_block(lines, indents, aliases, path)
+    columns = _read_records(lines, indents, aliases, start, end)
+
+    if numpy is None:
+        return {name: column.values for name, column in columns.items()}
+
+    result = {}
+    for name, column in columns.items():
+        if column.kind == "int":
+            result[name] = numpy.frombuffer(column.values, dtype=numpy.int64)
+        elif column.kind == "float":
+            result[name] = numpy.frombuffer(column.values, dtype=numpy.float64)
+        else:
+            result[name] = column.values
+    return result
+
+
+def _find_block(
+    lines: List[str], indents: List[int], aliases: Dict[str, str], path: str
+) -> Tuple[int, int]:
+    """Locate the child lines of the key at ``path``.
+
+    Returns:
+        Tuple of (start, end) line indices of the nested block
+    """
+    start, end = 0, len(lines)
+    segments = path.split(".")
+    for n, segment in enumerate(segments, 1):
+        child_indent = indents[start] if start < end else 0
+        found = None
+        for j in range(start, end):
+            if indents[j] != child_indent:
+                continue
+            key, value_str, has_colon = _split_key_value(lines[j].strip())
+            if has_colon and aliases.get(key, key) == segment:
+                found = j
+                break
+
+        if found is None:
+            raise TOONParseError(f"Path '{path}' not found")
+        if value_str:
+            # An empty array is written inline
+            if value_str == "[]" and n == len(segments):
+                return found + 1, found + 1
+            raise TOONParseError(f"Path '{path}' is not an array", line_number=found + 1)
+
+        start = end = found + 1
+        while end < len(lines) and indents[end] > indents[found]:
+            end += 1
+
+    # Records are '-' items; keyed lines right under the key are an object
+    if start < end and lines[start].strip() != "-":
+        raise TOONParseError(f"Path '{path}' is not an array of records", line_number=start + 1)
+    return start, end
+
+
+def _read_records(
+    lines: List[str], indents: List[int], aliases: Dict[str, str], start: int, end: int
+) -> Dict[str, _Column]:
+    """Append every record in ``lines[start:end]`` to its field columns."""
+    columns: Dict[str, _Column] = {}
+    if start == end:
+        return columns
+
+    item_indent = indents[start]
+    rows = 0
+    seen = None
+
+    i = start
+    while i < end:
+        line = lines[i]
+        indent = indents[i]
+        stripped = line.strip()
+
+        if indent == item_indent and stripped == "-":
+            rows = _finish_row(columns, rows, seen)
+            seen = set()
+            i += 1
+            continue
+
+        key, value_str, has_colon = _split_key_value(stripped)
+        if not has_colon:
+            raise TOONParseError("Expected a record field", line_number=i + 1)
+        if aliases:
+            key = aliases.get(key, key)
+
+        # Legacy: record without '-', a repeated key starts the next record
+        if seen is None or (indent == item_indent and key in seen):
+            rows = _finish_row(columns, rows, seen)
+            seen = set()
+
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = _Column(rows)
+
+        i += 1
+        if value_str:
+            if key in seen:
+                column.replace_last(_parse_value(value_str))
+            else:
+                column.append(value_str)
+        else:
+            # Nested value: parse just this field's block
+            block_end = i
+            while block_end < end and indents[block_end] > indent:
+                block_end += 1
+            value = None
+            if block_end > i:
+                value = _parse_lines(lines[i - 1:block_end], aliases)[key]
+            if key in seen:
+                column.replace_last(value)
+            else:
+                column.append_value(value)
+            i = block_end
+        seen.add(key)
+
+    _finish_row(columns, rows, seen)
+    return columns
+
+
+def _finish_row(columns: Dict[str, _Column], rows: int, seen) -> int:
+    """Pad columns the closing record did not set and return the row count."""
+    if seen is None:
+        return rows
+    rows += 1
+    if len(seen) != len(columns):
+        for column in columns.values():
+            if len(column) < rows:
+                column.append_value(None)
+    return rows
+
+
+def columns_to_toon(
+    columns: Any,
+    key: Optional[str] = "items",
+    indent: int = 2,
+    indent_char: str = " ",
+) -> str:
+    """Encode column data as a TOON array of records.
+
+    Produces the same text as ``json_to_toon({key: records})`` without
+    building a dict per row.
+
+    Args:
+        columns: Mapping of field name to a sequence of values (list,
+            ``array.array``, NumPy array, pandas Series) or a pandas
+            DataFrame
+        key: Key holding the records, or None for a top-level array
+        indent: Number of spaces for indentation
+        indent_char: Character used for indentation (" " or "\t")
+
+    Returns:
+        TOON formatted string
+
+    Raises:
+        ValueError: If the columns have different lengths
+    """
+    if not isinstance(columns, Mapping) and hasattr(columns, "columns"):
+        # pandas DataFrame: read it column by column
+        columns = {name: columns[name] for name in columns.columns}
+
+    names = list(columns)
+    cells = [_format_column(columns[name]) for name in names]
+    rows = len(cells[0]) if cells else 0
+    for name, column in zip(names, cells):
+        if len(column) != rows:
+            raise ValueError(f"Column '{name}' has {len(column)} values, expected {rows}")
+
+    unit = indent_char * indent
+    lines = []
+    if key is None:
+        if not rows:
+            return ""
+        level = 0
+    else:
+        key_str = _key_to_string(key)
+        if not rows:
+            return f"{key_str}: []"
+        lines.append(f"{key_str}:")
+        level = 1
+
+    item_line = f"{unit * level}-"
+    field_pad = unit * (level + 1)
+    nested_pad = field_pad + unit
+    prefixes = [f"{field_pad}{_key_to_string(name)}:" for name in names]
+
+    for row in range(rows):
+        lines.append(item_line)
+        for prefix, column in zip(prefixes, cells):
+            cell = column[row]
+            if cell.__class__ is str:
+                lines.append(f"{prefix} {cell}")
+            else:
+                # Non-empty dict or list: encode it one level below the field
+                lines.append(prefix)
+                for sub_line in json_to_toon(cell, indent, indent_char=indent_char).split("\n"):
+                    lines.append(f"{nested_pad}{sub_line}")
+
+    return "\n".join(lines)
+
+
+def _format_column(values: Any) -> List[Any]:
+    """Format a column's scalars, leaving non-empty containers as they are."""
+    if hasattr(values, "tolist"):
+        # array.array, NumPy arrays and pandas Series convert in one call
+        numeric = _is_numeric(values)
+        values = values.tolist()
+        if numeric:
+            return list(map(str, values))
+
+    cells = []
+    for value in values:
+        if isinstance(value, (dict, list)):
+            if value:
+                cells.append(value)
+            else:
+                cells.append("{}" if isinstance(value, dict) else "[]")
+        else:
+            cells.append(_simple_value_to_string(value))
+    return cells
+
+
+def _is_numeric(values: Any) -> bool:
+    """Whether a typed buffer holds only ints or floats."""
+    typecode = getattr(values, "typecode", None)
+    if typecode is not None:
+        return typecode in _NUMERIC_TYPECODES
+    dtype = getattr(values, "dtype", None)
+    return getattr(dtype, "kind", "") in ("i", "u", "f")
@@ -0,0 +1,194 @@
+"""Binary-framed TOON container for caches and fast reloads."""
+
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from hashlib import blake2b
+from typing import Any, Dict, List, Union
+
+from .core import _parse_lines, _read_alias_header, _split_key_value
+from .exceptions import TOONParseError
+from .lazy import _Document, _mapping_or_value
+
+CONTAINER_MAGIC = b"TOON"
+CONTAINER_VERSION = 1
+
+# magic, version, flags, shape hash, body length, line count
+_HEADER = struct.Struct("<4sHH16sQI")
+# Flag: line offsets are stored as 64-bit integers
+_WIDE_OFFSETS = 1
+
+
+def shape_hash(toon_str: str) -> str:
+    """Hash the structural skeleton of a TOON document.
+
+    The skeleton is every line's indentation and key (or array marker)
+    with values left out, so documents that differ only in scalar values
+    share a hash.
+
+    Returns:
+        32-character hex digest
+    """
+    lines = [line for line in toon_str.strip().split("\n") if line.strip()]
+    lines, _ = _read_alias_header(lines)
+    return _skeleton_digest(lines, [len(line) - len(line.lstrip()) for line in lines]).hex()
+
+
+def pack_toon(toon_str: str) -> bytes:
+    """Wrap TOON text in a binary frame.
+
+    The frame starts with a fixed header (magic, format version, shape
+    hash, body length, line count) followed by a table of line offsets
+    and indentation widths, then the TOON body as UTF-8. Blank lines are
+    dropped from the body; otherwise it is the text as given.
+
+    Args:
+        toon_str: TOON formatted string (e.g. from ``json_to_toon``)
+
+    Returns:
+        Framed bytes, readable with ``unpack_toon``
+    """
+    all_lines = [line for line in toon_str.strip().split("\n") if line.strip()]
+    lines, _ = _read_alias_header(all_lines)
+    body = "\n".join(all_lines).encode("utf-8")
+
+    indents = array("I", [len(line) - len(line.lstrip()) for line in lines])
+    wide = len(body) >= 2 ** 32
+    offsets = array("Q" if wide else "I")
+    # Content lines start after the "@key" header lines
+    position = sum(len(line.encode("utf-8")) + 1 for line in all_lines[:len(all_lines) - len(lines)])
+    for line in lines:
+        offsets.append(position)
+        position += len(line.encode("utf-8")) + 1
+
+    header = _HEADER.pack(
+        CONTAINER_MAGIC,
+        CONTAINER_VERSION,
+        _WIDE_OFFSETS if wide else 0,
+        _skeleton_digest(lines, indents),
+        len(body),
+        len(lines),
+    )
+    return header + _to_bytes(offsets) + _to_bytes(indents) + body
+
+
+def read_header(blob: Union[bytes, memoryview]) -> dict:
+    """Read a container's header without touching its body.
+
+    Returns:
+        Dict with "version", "flags", "shape_hash" (hex), "length"
+        (body bytes) and "lines" (content line count)
+
+    Raises:
+        TOONParseError: If the blob is not a container of a supported version
+    """
+    if len(blob) < _HEADER.size:
+        raise TOONParseError("Truncated TOON container header")
+    magic, version, flags, digest, length, count = _HEADER.unpack_from(blob)
+    if magic != CONTAINER_MAGIC:
+        raise TOONParseError("Not a TOON container")
+    if version != CONTAINER_VERSION:
+        raise TOONParseError(f"Unsupported TOON container version {version}")
+    return {
+        "version": version,
+        "flags": flags,
+        "shape_hash": digest.hex(),
+        "length": length,
+        "lines": count,
+    }
+
+
+def unpack_toon(blob: Union[bytes, memoryview], lazy: bool = False) -> Any:
+    """Parse a framed TOON container.
+
+    With ``lazy=True`` the stored offset and indentation tables stand in
+    for the structural scan: a ``LazyMapping`` is returned straight away
+    and lines are decoded only when their values are accessed.
+
+    Args:
+        blob: Bytes from ``pack_toon``
+        lazy: Return a lazy proxy (see ``lazy_load``) instead of dicts
+
+    Returns:
+        Parsed JSON data, or a ``LazyMapping``
+
+    Raises:
+        TOONParseError: If the container is malformed or truncated
+    """
+    header = read_header(blob)
+    count = header["lines"]
+    position = _HEADER.size
+    offsets, position = _read_array("Q" if header["flags"] & _WIDE_OFFSETS else "I", blob, position, count)
+    indents, position = _read_array("I", blob, position, count)
+    body = bytes(blob[position:])
+    if len(body) != header["length"]:
+        raise TOONParseError("TOON container body length does not match its header")
+
+    # The "@key" header, if any, precedes the first content line
+    first = offsets[0] if count else len(body)
+    aliases: Dict[str, str] = {}
+    if first:
+        _, aliases = _read_alias_header(body[:first].decode("utf-8").split("\n"))
+
+    if not lazy:
+        text = body[first:].decode("utf-8")
+        return _parse_lines(text.split("\n") if text else [], aliases)
+
+    doc = _Document(_LineTable(body, offsets), aliases, indents)
+    return _mapping_or_value(doc, 0, count)
+
+
+class _LineTable(Sequence):
+    """Lines of a container body, decoded on access."""
+
+    __slots__ = ("body", "offsets")
+
+    def __init__(self, body: bytes, offsets: array):
+        self.body = body
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.offsets)))]
+        start = self.offsets[index]
+        end = self.body.find(b"\n", start)
+        return self.body[start:end if end != -1 else len(self.body)].decode("utf-8")
+
+
+def _skeleton_digest(lines: List[str], indents) -> bytes:
+    digest = blake2b(digest_size=16)
+    for line, indent in zip(lines, indents):
+        stripped = line.strip()
+        key, _, has_colon = _split_key_value(stripped)
+        if has_colon:
+            marker = f"{key}:"
+        elif stripped == "-":
+            marker = "-"
+        else:
+            # Array scalar: only its position is structural
+            marker = ""
+        digest.update(f"{indent} {marker}\n".encode("utf-8"))
+    return digest.digest()
+
+
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(typecode: str, blob: Union[bytes, memoryview], position: int, count: int):
+    values = array(typecode)
+    end = position + values.itemsize * count
+    if end > len(blob):
+        raise TOONParseError("Truncated TOON container table")
+    values.frombytes(blob[position:end])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, end
+
@@ -1,22 +1,108 @@
 """Core conversion functions for JSON <-> TOON."""
 
-import json
-from typing import Any, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from .exceptions import TOONParseError
+from .objects import SCALAR_TYPES, to_container
 
+# Header line declaring a key alias, e.g. "@key a=customer_identifier"
+KEY_ALIAS_PREFIX = "@key "
 
-def json_to_toon(data: Union[dict, list, str], indent: int = 2) -> str:
+_ALIAS_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+_CONTAINER_OR_SCALAR = SCALAR_TYPES | {dict, list}
+
+# Entries of each per-level prefix cache that are not keys
+_INDENT = object()
+_MARKER = object()
+# Keys cached per level; beyond this, prefixes are rendered each time
+_PREFIX_CACHE_SIZE = 4096
+
+# Ends a batch of lines passed to _parse_lines, see there
+_HOLD = object()
+
+# First characters of unquoted tokens that may parse as something other
+# than a string; every other token is returned as-is
+_NON_STRING_FIRST = frozenset("0123456789-+.ntf{[")
+
+# Whitespace that line stripping would drop from either end of a string
+_STRIPPED = frozenset(" \t")
+_UNSAFE_LAST = _STRIPPED | {'"'}
+
+# Escapes inside quoted strings: JSON's, so no character is written
+# that could split or end a line
+_ESCAPES = str.maketrans({
+    **{chr(code): f"\\u{code:04x}" for code in (*range(0x20), 0x7f, 0x85, 0x2028, 0x2029)},
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
+# Compiled by _unquote on first use, so importing the package skips ``re``
+_ESCAPE_PATTERN = None
+_UNESCAPES = {"n": "\n", "r": "\r", "t": "\t", "b": "\b", "f": "\f", "/": "/"}
+
+
+def json_to_toon(
+    data: Union[dict, list, str],
+    indent: int = 2,
+    compact: bool = False,
+    indent_char: str = " ",
+    key_aliases: Optional[bool] = None,
+    max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+    fidelity: bool = False,
+) -> str:
     """Convert JSON to TOON format.
     
+    Dataclasses, NamedTuples and fully slotted objects are encoded as
+    objects, read through field accessors cached per class, without
+    building an intermediate dict tree.
+    
     Args:
-        data: JSON data (dict, list, or JSON string)
+        data: JSON data (dict, list, JSON string, or a supported object)
         indent: Number of spaces for indentation
+        compact: Use the compact profile (single-character indentation
+            and key aliases)
+        indent_char: Character used for indentation (" " or "\t")
+        key_aliases: Emit a "@key" header mapping long repeated keys to
+            short aliases. Defaults to the value of ``compact``.
+        max_depth: Reject documents nested deeper than this
+        max_nodes: Reject documents with more values than this
+        default: Called with any other non-JSON object; should return a
+            encodable value, like ``json.dumps``'s ``default``. Without
+            it such objects are written with ``str()``.
+        fidelity: Quote every string and key that would not parse back
+            unchanged (e.g. "123", "true", "", " x", or ":" inside list
+            items), so ``toon_to_json`` returns the exact input.
         
     Returns:
         TOON formatted string
+        
+    Raises:
+        TOONLimitError: If a limit is exceeded (checked before any
+            output is produced, and before parsing a JSON string)
     """
+    limited = max_depth is not None or max_nodes is not None
     if isinstance(data, str):
-        data = json.loads(data)
+        # Imported here: json is only needed for string input
+        from .deepjson import loads
+        if limited:
+            from .limits import JSONShapeScanner
+            JSONShapeScanner(max_depth, max_nodes).feed(data.encode("utf-8"))
+        data = loads(data)
+    else:
+        if type(data) not in _CONTAINER_OR_SCALAR:
+            data = to_container(data, default)
+        if limited:
+            from .limits import check_data
+            check_data(data, max_depth, max_nodes)
+    
+    if compact:
+        indent = 1
+    if key_aliases is None:
+        key_aliases = compact
     
     # Pre-check for simple types
     if data is None: return "null"
@@ -25,14 +111,49 @@ def json_to_toon(data: Union[dict, list, str], indent: int = 2) -> str:
     if isinstance(data, str): return data
     if not data: return ""
 
+    aliases = _build_key_aliases(data, default) if key_aliases and isinstance(data, (dict, list)) else {}
+    return "".join(_iter_toon_chunks(data, indent, indent_char, aliases, default=default, fidelity=fidelity))
+
+
+def _iter_toon_chunks(
+    data: Union[dict, list],
+    indent: int,
+    indent_char: str,
+    aliases: Dict[str, str],
+    chunk_lines: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+    fidelity: bool = False,
+    prefixes: Optional[List[dict]] = None,
+) -> Iterator[str]:
+    """Render a non-empty container as TOON text.
+    
+    With ``chunk_lines`` set, the text is yielded in pieces of about that
+    many lines (joined by "\n", without a trailing newline on the last
+    piece) so callers can write it out without building the whole string.
+    Otherwise a single piece is yielded.
+    
+    ``prefixes`` caches the rendered "key:" prefix of each key by level;
+    ``Encoder`` passes its own to reuse them across calls with the same
+    indentation and no aliases.
+    """
     lines = []
+    for key, alias in aliases.items():
+        lines.append(f"{KEY_ALIAS_PREFIX}{alias}={key}")
+    
+    unit = indent_char * indent
+    
     # Stack: (obj, level, prefix)
     # prefix is the string to print before the object (e.g. "key:" or "-")
     # If prefix is None, it means just print the object at 'level' indentation.
     
     stack = [(data, 0, None)]
+    if prefixes is None:
+        prefixes = []
     
     while stack:
+        if chunk_lines and len(lines) >= chunk_lines:
+            yield "\n".join(lines) + "\n"
+            lines = []
         obj, level, prefix = stack.pop()
         
         if isinstance(obj, dict):
@@ -42,8 +163,7 @@ def json_to_toon(data: Union[dict, list, str], indent: int = 2) -> str:
                 if prefix:
                     lines.append(f"{prefix} {val_str}")
                 else:
-                    spacing = " " * (level * indent)
-                    lines.append(f"{spacing}{val_str}")
+                    lines.append(prefixes[level][_INDENT] + val_str)
                 continue
 
             if prefix:
@@ -52,11 +172,19 @@ def json_to_toon(data: Union[dict, list, str], indent: int = 2) -> str:
             else:
                 child_level = level
             
+            if child_level < len(prefixes):
+                level_prefixes = prefixes[child_level]
+            else:
+                level_prefixes = _level_prefixes(prefixes, child_level, unit)
+            
             # Push items in reverse order
             for key, value in reversed(list(obj.items())):
-                key_str = f'"{key}"' if ":" in key else key
-                spacing = " " * (child_level * indent)
-                child_prefix = f"{spacing}{key_str}:"
+                child_prefix = level_prefixes.get(key)
+                if child_prefix is None:
+                    key_str = aliases[key] if key in aliases else _key_to_string(key)
+                    child_prefix = f"{level_prefixes[_INDENT]}{key_str}:"
+                    if len(level_prefixes) < _PREFIX_CACHE_SIZE:
+                        level_prefixes[key] = child_prefix
                 stack.append((value, child_level, child_prefix))
                     
         elif isinstance(obj, list):
@@ -66,8 +194,7 @@ def json_to_toon(data: Union[dict, list, str], indent: int = 2) -> str:
                 if prefix:
                     lines.append(f"{prefix} {val_str}")
                 else:
-                    spacing = " " * (level * indent)
-                    lines.append(f"{spacing}{val_str}")
+                    lines.append(prefixes[level][_INDENT] + val_str)
                 continue
 
             if prefix:
@@ -75,56 +202,264 @@ def json_to_toon(data: Union[dict, list, str], indent: int = 2) -> str:
                 child_level = level + 1
             else:
                 child_level = level
+            if child_level < len(prefixes):
+                marker = prefixes[child_level][_MARKER]
+            else:
+                marker = _level_prefixes(prefixes, child_level, unit)[_MARKER]
             
             for i in range(len(obj) - 1, -1, -1):
                 item = obj[i]
+                if type(item) not in _CONTAINER_OR_SCALAR:
+                    item = to_container(item, default)
                 
                 if isinstance(item, dict) and item:
-                    spacing = " " * (child_level * indent)
-                    child_prefix = f"{spacing}-"
-                    stack.append((item, child_level, child_prefix))
+                    stack.append((item, child_level, marker))
                 else:
                     # Simple value or list in list
                     stack.append((item, child_level, None))
         
         else:
-            # Simple value
-            val_str = _simple_value_to_string(obj)
+            if type(obj) not in SCALAR_TYPES:
+                # Dataclass, NamedTuple, slotted object or ``default`` hook
+                converted = to_container(obj, default)
+                if converted is not obj:
+                    stack.append((converted, level, prefix))
+                    continue
+            # Simple value; list items (no prefix) are read as whole lines.
+            # Plain printable strings after a key skip the quoting checks.
+            if (type(obj) is str and prefix and not fidelity and obj.isprintable()
+                    and obj[:1] not in _STRIPPED and obj[-1:] not in _UNSAFE_LAST):
+                val_str = obj
+            else:
+                val_str = _simple_value_to_string(obj, prefix is None, fidelity)
             if prefix:
                 lines.append(f"{prefix} {val_str}")
             else:
-                spacing = " " * (level * indent)
-                lines.append(f"{spacing}{val_str}")
+                lines.append(prefixes[level][_INDENT] + val_str)
         
-    return "\n".join(lines)
+    yield "\n".join(lines)
+
+
+def _level_prefixes(prefixes: List[dict], level: int, unit: str) -> dict:
+    """Extend the per-level prefix caches up to ``level`` and return its cache."""
+    while len(prefixes) <= level:
+        spacing = unit * len(prefixes)
+        prefixes.append({_INDENT: spacing, _MARKER: spacing + "-"})
+    return prefixes[level]
+
+
+def _build_key_aliases(data: Union[dict, list], default: Optional[Callable[[Any], Any]] = None) -> Dict[str, str]:
+    """Pick short aliases for the keys whose repetition costs the most.
+    
+    A key is only aliased when the characters saved across all of its
+    occurrences outweigh the cost of its header line.
+    """
+    counts: Dict[str, int] = {}
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if type(obj) not in _CONTAINER_OR_SCALAR:
+            converted = to_container(obj, default)
+            if converted is obj:
+                continue
+            obj = converted
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                counts[key] = counts.get(key, 0) + 1
+                if type(value) not in SCALAR_TYPES:
+                    stack.append(value)
+        elif isinstance(obj, list):
+            for item in obj:
+                if type(item) not in SCALAR_TYPES:
+                    stack.append(item)
+    
+    # Most valuable keys first so they get the shortest aliases
+    ranked = sorted(counts, key=lambda k: len(k) * counts[k], reverse=True)
+    
+    aliases = {}
+    names = _alias_names(counts)
+    alias = next(names)
+    for key in ranked:
+        if "\n" in key:
+            continue
+        key_len = len(key) + 2 * (":" in key)
+        header_cost = len(KEY_ALIAS_PREFIX) + len(alias) + len(key) + 2
+        if counts[key] * (key_len - len(alias)) <= header_cost:
+            continue
+        aliases[key] = alias
+        alias = next(names)
+    return aliases
+
 
+def _alias_names(taken: Dict[str, int]) -> Iterator[str]:
+    """Yield short alias names that do not collide with existing keys."""
+    length = 1
+    while True:
+        for n in range(len(_ALIAS_ALPHABET) ** length):
+            name = ""
+            for _ in range(length):
+                n, r = divmod(n, len(_ALIAS_ALPHABET))
+                name = _ALIAS_ALPHABET[r] + name
+            if name not in taken:
+                yield name
+        length += 1
 
-def _simple_value_to_string(obj: Any) -> str:
+
+def _simple_value_to_string(obj: Any, in_list: bool = False, fidelity: bool = False) -> str:
     if obj is None: return "null"
     if isinstance(obj, bool): return "true" if obj else "false"
-    return str(obj)
+    if type(obj) is not str: return str(obj)
+    if _is_unsafe(obj, in_list) or (fidelity and _is_ambiguous(obj)):
+        return _quote(obj)
+    return obj
+
+
+def _is_unsafe(text: str, in_list: bool) -> bool:
+    """Whether a string would lose characters or break lines unquoted.
+    
+    Covers line breaks and other control characters, whitespace at
+    either end, text wrapped in quotes, and list items that would read
+    as a key or an object marker.
+    """
+    if not text:
+        return False
+    if text[0] in _STRIPPED or text[-1] in _STRIPPED or not text.isprintable():
+        return True
+    if len(text) > 1 and text[0] == '"' and text[-1] == '"':
+        return True
+    return in_list and (":" in text or text == "-")
+
+
+def _is_ambiguous(text: str) -> bool:
+    """Whether a string would parse back as another type unquoted."""
+    return not text or (text[0] in _NON_STRING_FIRST and _parse_value(text) is not text)
+
+
+def _key_to_string(key: str) -> str:
+    if not key or ":" in key or key[0] in '"@' or _is_unsafe(key, False):
+        return _quote(key)
+    return key
+
+
+def _quote(text: str) -> str:
+    return '"' + text.translate(_ESCAPES) + '"'
+
+
+def _unquote(token: str) -> str:
+    """Inverse of ``_quote``: strip the quotes and decode escapes."""
+    inner = token[1:-1]
+    if "\\" not in inner:
+        return inner
+    global _ESCAPE_PATTERN
+    if _ESCAPE_PATTERN is None:
+        import re
+        _ESCAPE_PATTERN = re.compile(r'\\(u[0-9a-fA-F]{4}|.)', re.DOTALL)
+    return _ESCAPE_PATTERN.sub(_unescape, inner)
+
+
+def _unescape(match: "re.Match") -> str:
+    code = match.group(1)
+    if len(code) == 5:
+        return chr(int(code[1:], 16))
+    return _UNESCAPES.get(code, code)
 
 
-def toon_to_json(toon_str: str) -> Union[dict, list]:
+def toon_to_json(
+    toon_str: str,
+    object_pairs_hook: Optional[Callable[[List[Tuple[str, Any]]], Any]] = None,
+    max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    into: Any = None,
+) -> Any:
     """Convert TOON format to JSON.
     
     Args:
         toon_str: TOON formatted string
+        object_pairs_hook: Optional callable, like the one accepted by
+            ``json.loads``, called with each object's ``(key, value)``
+            pairs in document order (duplicates included). Its return
+            value is used in place of a dict.
+        max_depth: Reject documents nested deeper than this
+        max_nodes: Reject documents with more values than this
+        into: Type to decode into, e.g. a dataclass or ``List[Model]``.
+            Objects are built directly while parsing and scalars are
+            converted by their declared type.
         
     Returns:
-        Parsed JSON data (dict or list)
+        Parsed JSON data (dict or list), or an instance of ``into``
+        
+    Raises:
+        TOONLimitError: If a limit is exceeded (checked before parsing)
+        TOONParseError: If the document does not match ``into``
+    """
+    if into is not None:
+        # Imported here: typed decoding is only needed with ``into``
+        from .typed import decode_lines
+        if max_depth is not None or max_nodes is not None:
+            _document_lines(toon_str, max_depth, max_nodes)
+        aliases = {}
+        # Numbered lines, so errors point at the document's own line numbers
+        return decode_lines(_numbered_lines(toon_str.split("\n"), aliases), aliases, into)
+    
+    lines, aliases = _document_lines(toon_str, max_depth, max_nodes)
+    if object_pairs_hook is not None:
+        return _parse_pairs(lines, aliases, object_pairs_hook)
+    return _parse_lines(lines, aliases)
+
+
+def _document_lines(
+    toon_str: str,
+    max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+) -> Tuple[List[str], Dict[str, str]]:
+    """Split a document into non-empty content lines and its alias table.
+    
+    Raises:
+        TOONLimitError: If a limit is exceeded
     """
     lines = [line for line in toon_str.strip().split("\n") if line.strip()]
-    if not lines:
-        return {}
+    lines, aliases = _read_alias_header(lines)
     
-    root = {}
-    # Stack: (container, indent_level)
-    stack = [(root, -1)]
+    if max_depth is not None or max_nodes is not None:
+        from .limits import check_lines
+        check_lines(lines, max_depth, max_nodes)
+    return lines, aliases
+
+
+def _parse_lines(
+    lines: Iterable[str],
+    aliases: Dict[str, str],
+    keys: Optional[Dict[str, str]] = None,
+    stack: Optional[List[Tuple[Union[dict, list], int]]] = None,
+) -> Union[dict, list]:
+    """Parse non-empty TOON lines into dicts and lists.
     
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    Lines are consumed in order with one line of lookahead, so ``lines``
+    may be any iterable (e.g. a generator over a file).
+    
+    Every key is looked up in ``keys`` (seeded with ``aliases``), so a
+    key repeated across records is stored as one shared string. Pass a
+    dict to reuse it across documents without aliases.
+    
+    To parse a document in batches, pass the same ``stack`` list (starting
+    as ``[({}, -1)]``) to every call and end each batch but the last with
+    ``_HOLD``. The line before ``_HOLD`` is left unparsed, as its block
+    type depends on the next line; start the next batch with it.
+    """
+    if keys is None:
+        keys = dict(aliases)
+    if stack is None:
+        # Stack: (container, indent_level)
+        stack = [({}, -1)]
+    root = stack[0][0]
+    
+    lines = iter(lines)
+    next_line = next(lines, None)
+    while next_line is not None:
+        line = next_line
+        next_line = next(lines, None)
+        if next_line is _HOLD:
+            break
         stripped = line.strip()
         indent = len(line) - len(line.lstrip())
         
@@ -141,31 +476,16 @@ def toon_to_json(toon_str: str) -> Union[dict, list]:
                 new_obj = {}
                 current_container.append(new_obj)
                 stack.append((new_obj, indent))
-                i += 1
                 continue
             else:
                 # Should not happen
                 pass
         
-        # Handle quoted keys
-        key = None
-        value_str = None
-        has_colon = False
-        
-        if stripped.startswith('"'):
-            end_quote = stripped.find('"', 1)
-            if end_quote != -1 and end_quote + 1 < len(stripped) and stripped[end_quote+1] == ':':
-                key = stripped[1:end_quote]
-                value_str = stripped[end_quote+2:].strip()
-                has_colon = True
-        
-        if not has_colon and ":" in stripped:
-            key, _, value_str = stripped.partition(":")
-            key = key.strip()
-            value_str = value_str.strip()
-            has_colon = True
+        key, value_str, has_colon = _split_key_value(stripped)
             
         if has_colon:
+            key = keys.setdefault(key, key)
+
             if value_str:
                 val = _parse_value(value_str)
                 if isinstance(current_container, dict):
@@ -179,27 +499,9 @@ def toon_to_json(toon_str: str) -> Union[dict, list]:
             else:
                 # Nested structure or None
                 # Look ahead to determine if there are children
-                has_children = False
-                next_type = dict
-                
-                if i + 1 < len(lines):
-                    next_line_content = lines[i+1]
-                    next_indent = len(next_line_content) - len(next_line_content.lstrip())
-                    
-                    # Must be more indented to be a child
-                    # Note: current indent is 'indent'. 
-                    # But wait, 'indent' variable is indentation of CURRENT line.
-                    # If we are in a dict, children should be indented relative to current line?
-                    # Yes.
-                    
-                    if next_indent > indent:
-                        has_children = True
-                        stripped_next = next_line_content.strip()
-                        if stripped_next == "-" or (":" not in stripped_next and not stripped_next.startswith('"')):
-                             if ":" not in stripped_next and not stripped_next.startswith('"'):
-                                  next_type = list
+                next_type = _container_type_of(next_line, indent)
                 
-                if has_children:
+                if next_type is not None:
                     new_container = next_type()
                     if isinstance(current_container, dict):
                         current_container[key] = new_container
@@ -228,14 +530,226 @@ def toon_to_json(toon_str: str) -> Union[dict, list]:
             elif isinstance(current_container, dict):
                 # Key without value?
                 pass
-                
-        i += 1
         
     return root
 
 
+def _numbered_lines(lines: Iterable[str], aliases: Dict[str, str]) -> Iterator[Tuple[int, str]]:
+    """Yield ``(line number, line)`` for content lines, counting from 1.
+    
+    Blank lines are skipped and the "@key" header is collected into
+    ``aliases`` as it is read. The first content line is dedented, as
+    ``toon_to_json`` strips the document.
+    """
+    first = True
+    header = True
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        if first:
+            line = line.lstrip()
+            first = False
+        if header:
+            if line.startswith(KEY_ALIAS_PREFIX):
+                alias, _, key = line.rstrip("\r\n")[len(KEY_ALIAS_PREFIX):].partition("=")
+                aliases[alias] = key
+                continue
+            header = False
+        yield number, line
+
+
+def _read_alias_header(lines: List[str]) -> Tuple[List[str], Dict[str, str]]:
+    """Strip the "@key alias=key" header written by compact mode.
+    
+    Returns:
+        Tuple of (remaining lines, alias -> key mapping)
+    """
+    aliases = {}
+    header = 0
+    while header < len(lines) and lines[header].startswith(KEY_ALIAS_PREFIX):
+        alias, _, key = lines[header][len(KEY_ALIAS_PREFIX):].partition("=")
+        aliases[alias] = key
+        header += 1
+    if header:
+        lines = lines[header:]
+    return lines, aliases
+
+
+def _split_key_value(stripped: str) -> Tuple[Optional[str], Optional[str], bool]:
+    """Split a stripped line into (key, value_str, has_colon)."""
+    # Handle quoted keys and quoted scalars
+    if stripped.startswith('"'):
+        end_quote = _closing_quote(stripped)
+        if end_quote != -1:
+            if end_quote + 1 < len(stripped) and stripped[end_quote+1] == ':':
+                return _unquote(stripped[:end_quote+1]), stripped[end_quote+2:].strip(), True
+            if end_quote + 1 == len(stripped):
+                return None, None, False
+    
+    if ":" in stripped:
+        key, _, value_str = stripped.partition(":")
+        return key.strip(), value_str.strip(), True
+    
+    return None, None, False
+
+
+def _closing_quote(text: str) -> int:
+    """Index of the quote closing the one at ``text[0]``, or -1."""
+    end = text.find('"', 1)
+    while end != -1:
+        backslashes = 0
+        while text[end - 1 - backslashes] == "\\":
+            backslashes += 1
+        if not backslashes % 2:
+            return end
+        end = text.find('"', end + 1)
+    return end
+
+
+def _child_container_type(lines: List[str], i: int, indent: int) -> Optional[type]:
+    """Look ahead from line ``i`` to find the type of its nested block.
+    
+    Returns:
+        dict or list if the next line is more indented, otherwise None
+    """
+    if i + 1 >= len(lines):
+        return None
+    return _container_type_of(lines[i + 1], indent)
+
+
+def _container_type_of(next_line: Optional[str], indent: int) -> Optional[type]:
+    """Type of the block opened by a line at ``indent``, given the line after it."""
+    if next_line is None:
+        return None
+    
+    next_indent = len(next_line) - len(next_line.lstrip())
+    
+    # Must be more indented to be a child
+    if next_indent <= indent:
+        return None
+    
+    stripped_next = next_line.strip()
+    if ":" not in stripped_next:
+        return list
+    return dict if _split_key_value(stripped_next)[2] else list
+
+
+class _PairsFrame:
+    """Open container on the pairs parser stack."""
+    
+    __slots__ = ("container", "indent", "is_object", "parent", "slot", "in_pairs", "record")
+    
+    def __init__(self, container, indent, is_object, parent=None, slot=0, in_pairs=False):
+        self.container = container
+        self.indent = indent
+        self.is_object = is_object
+        # Where the finished value goes: parent[slot], as a (key, value)
+        # pair when the parent is an object's pair list
+        self.parent = parent
+        self.slot = slot
+        self.in_pairs = in_pairs
+        # Legacy record (object in list without '-') still collecting keys
+        self.record = None
+
+
+def _close_frame(frame: _PairsFrame, hook: Callable) -> Any:
+    """Finish a container and store it in its parent."""
+    _close_record(frame, hook)
+    value = hook(frame.container) if frame.is_object else frame.container
+    if frame.parent is not None:
+        if frame.in_pairs:
+            frame.parent[frame.slot] = (frame.parent[frame.slot][0], value)
+        else:
+            frame.parent[frame.slot] = value
+    return value
+
+
+def _close_record(frame: _PairsFrame, hook: Callable) -> None:
+    """Finish the legacy record a list frame is collecting, if any."""
+    if frame.record is not None:
+        frame.container[-1] = hook(frame.record)
+        frame.record = None
+
+
+def _parse_pairs(lines: List[str], aliases: Dict[str, str], hook: Callable) -> Any:
+    """Parse TOON lines, building every object through ``hook``.
+    
+    Objects are collected as lists of (key, value) pairs and handed to
+    ``hook`` as soon as their indentation block closes, so no intermediate
+    dicts are allocated and repeated keys are preserved.
+    """
+    stack = [_PairsFrame([], -1, True)]
+    
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+        i += 1
+        
+        while len(stack) > 1 and indent <= stack[-1].indent:
+            _close_frame(stack.pop(), hook)
+        
+        frame = stack[-1]
+        container = frame.container
+        
+        if stripped == "-" and not frame.is_object:
+            _close_record(frame, hook)
+            container.append([])
+            stack.append(_PairsFrame(container[-1], indent, True, container, len(container) - 1))
+            continue
+        
+        key, value_str, has_colon = _split_key_value(stripped)
+        
+        if not has_colon:
+            # Simple value in array; ignored inside objects
+            if not frame.is_object:
+                _close_record(frame, hook)
+                container.append(_parse_value(stripped))
+            continue
+        
+        if aliases:
+            key = aliases.get(key, key)
+        
+        if frame.is_object:
+            pairs = container
+        else:
+            # Legacy: object in list without '-', a repeated key starts a new record
+            pairs = frame.record
+            if pairs is None or any(k == key for k, _ in pairs):
+                _close_record(frame, hook)
+                pairs = frame.record = []
+                container.append(pairs)
+        
+        if value_str:
+            pairs.append((key, _parse_value(value_str)))
+            continue
+        
+        next_type = _child_container_type(lines, i - 1, indent)
+        if next_type is None:
+            pairs.append((key, None))
+        else:
+            child = []
+            pairs.append((key, child))
+            stack.append(_PairsFrame(child, indent, next_type is dict, pairs, len(pairs) - 1, True))
+    
+    while len(stack) > 1:
+        _close_frame(stack.pop(), hook)
+    return _close_frame(stack[0], hook)
+
+
 def _parse_value(value: str) -> Any:
     """Parse a value string to appropriate type."""
+    first = value[:1]
+    if first == '"' and len(value) > 1 and value[-1] == '"':
+        return _unquote(value)
+    if first not in _NON_STRING_FIRST:
+        # Cannot be a keyword, number or empty container
+        return value
+    if value == "{}":
+        return {}
+    if value == "[]":
+        return []
     if value == "null":
         return None
     if value == "true":
@@ -249,7 +763,7 @@ def _parse_value(value: str) -> Any:
         if value.startswith("0") and len(value) > 1 and value[1] != ".":
             return value
 
-        if value.replace(".", "", 1).replace("-", "", 1).replace("e", "", 1).replace("E", "", 1).replace("+", "", 1).isdigit():
+        if value.replace(".", "", 1).replace("-", "", 2).replace("e", "", 1).replace("E", "", 1).replace("+", "", 1).isdigit():
             if "." in value or "e" in value.lower():
                 return float(value)
             return int(value)
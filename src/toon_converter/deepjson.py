@@ -0,0 +1,223 @@
+"""Stack-safe JSON parsing and serialization.
+
+The standard library's JSON parser and encoder recurse once per nesting
+level and fail with RecursionError around the interpreter's recursion
+limit. ``loads`` tries the C parser first and only falls back to the
+iterative parser here for documents that deep. Indented output has no C
+encoder in the standard library, so ``dumps``/``dump`` always use the
+iterative encoder for it, which is as fast as ``json.dumps(indent=...)``.
+"""
+
+import json
+import re
+from json.decoder import JSONDecodeError, scanstring
+from json.encoder import encode_basestring_ascii
+from json.scanner import NUMBER_RE
+from typing import IO, Any, Iterator, List, Optional, Tuple, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Pieces per write in ``dump``
+_CHUNK_PARTS = 8192
+
+_CONSTANTS = {
+    "null": None,
+    "true": True,
+    "false": False,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+
+
+def loads(s: Union[str, bytes]) -> Any:
+    """Parse a JSON document of any nesting depth.
+
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+    """
+    try:
+        return json.loads(s)
+    except RecursionError:
+        pass
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode("utf-8")
+    return _loads_iterative(s)
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize ``obj`` like ``json.dumps(obj, indent=indent)`` at any depth."""
+    if indent is None:
+        # Only the compact form has a C encoder worth trying first
+        try:
+            return json.dumps(obj)
+        except RecursionError:
+            pass
+    return "".join(_iterencode(obj, indent))
+
+
+def dump(obj: Any, fp: IO[str], indent: Optional[int] = None) -> None:
+    """Write ``obj`` to a text file like ``json.dump``, at any depth, in chunks."""
+    for chunk in _iterencode(obj, indent, _CHUNK_PARTS):
+        fp.write(chunk)
+
+
+def _loads_iterative(s: str) -> Any:
+    end = len(s)
+    pos = _WHITESPACE.match(s, 0).end()
+    # Open containers: (container, current key); key is None for lists
+    stack: List[Tuple[Union[dict, list], Optional[str]]] = []
+
+    while True:
+        # Parse one value starting at pos
+        if pos >= end:
+            raise JSONDecodeError("Expecting value", s, pos)
+        char = s[pos]
+        if char == "{":
+            pos = _WHITESPACE.match(s, pos + 1).end()
+            if s.startswith("}", pos):
+                value, pos = {}, pos + 1
+            else:
+                key, pos = _parse_key(s, pos)
+                stack.append(({}, key))
+                continue
+        elif char == "[":
+            pos = _WHITESPACE.match(s, pos + 1).end()
+            if s.startswith("]", pos):
+                value, pos = [], pos + 1
+            else:
+                stack.append(([], None))
+                continue
+        elif char == '"':
+            value, pos = scanstring(s, pos + 1)
+        else:
+            value, pos = _parse_scalar(s, pos)
+
+        # Store the value and close every container it completes
+        while True:
+            pos = _WHITESPACE.match(s, pos).end()
+            if not stack:
+                if pos != end:
+                    raise JSONDecodeError("Extra data", s, pos)
+                return value
+            container, key = stack[-1]
+            if key is None:
+                container.append(value)
+            else:
+                container[key] = value
+
+            if s.startswith(",", pos):
+                pos = _WHITESPACE.match(s, pos + 1).end()
+                if key is not None:
+                    key, pos = _parse_key(s, pos)
+                    stack[-1] = (container, key)
+                break
+            if s.startswith("]" if key is None else "}", pos):
+                stack.pop()
+                value, pos = container, pos + 1
+                continue
+            raise JSONDecodeError("Expecting ',' delimiter", s, pos)
+
+
+def _parse_key(s: str, pos: int) -> Tuple[str, int]:
+    """Parse ``"key" :`` and return the key and the position of its value."""
+    if not s.startswith('"', pos):
+        raise JSONDecodeError("Expecting property name enclosed in double quotes", s, pos)
+    key, pos = scanstring(s, pos + 1)
+    pos = _WHITESPACE.match(s, pos).end()
+    if not s.startswith(":", pos):
+        raise JSONDecodeError("Expecting ':' delimiter", s, pos)
+    return key, _WHITESPACE.match(s, pos + 1).end()
+
+
+def _parse_scalar(s: str, pos: int) -> Tuple[Any, int]:
+    match = NUMBER_RE.match(s, pos)
+    if match is not None:
+        integer, frac, exp = match.groups()
+        if frac or exp:
+            return float(integer + (frac or "") + (exp or "")), match.end()
+        return int(integer), match.end()
+    for literal, value in _CONSTANTS.items():
+        if s.startswith(literal, pos):
+            return value, pos + len(literal)
+    raise JSONDecodeError("Expecting value", s, pos)
+
+
+def _iterencode(obj: Any, indent: Optional[int], chunk_parts: Optional[int] = None) -> Iterator[str]:
+    """Encode iteratively, yielding text every ``chunk_parts`` pieces (or once)."""
+    if isinstance(indent, int):
+        indent = " " * indent
+    item_separator = "," if indent is not None else ", "
+    parts: List[str] = []
+    # Work items: ("value", obj, level) or ("text", str, None)
+    stack: List[Tuple[str, Any, Optional[int]]] = [("value", obj, 0)]
+
+    while stack:
+        if chunk_parts and len(parts) >= chunk_parts:
+            yield "".join(parts)
+            parts = []
+        kind, item, level = stack.pop()
+        if kind == "text":
+            parts.append(item)
+            continue
+        if isinstance(item, dict) and item:
+            opening, closing, entries = "{", "}", list(item.items())
+        elif isinstance(item, (list, tuple)) and item:
+            opening, closing, entries = "[", "]", [(None, value) for value in item]
+        else:
+            parts.append(_encode_scalar(item))
+            continue
+
+        if indent is not None:
+            inner = "\n" + indent * (level + 1)
+            outer = "\n" + indent * level
+        else:
+            inner = outer = ""
+        parts.append(opening)
+        stack.append(("text", outer + closing, None))
+        for i in range(len(entries) - 1, -1, -1):
+            key, value = entries[i]
+            stack.append(("value", value, level + 1))
+            prefix = (item_separator if i else "") + inner
+            if key is not None:
+                prefix += encode_basestring_ascii(_key_to_string(key)) + ": "
+            stack.append(("text", prefix, None))
+    yield "".join(parts)
+
+
+def _key_to_string(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return _encode_scalar(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _encode_scalar(value: Any) -> str:
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        if value != value:
+            return "NaN"
+        if value in (float("inf"), float("-inf")):
+            return "Infinity" if value > 0 else "-Infinity"
+        return float.__repr__(value)
+    if isinstance(value, dict):
+        return "{}"
+    if isinstance(value, (list, tuple)):
+        return "[]"
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,76 @@
+"""Detect JSON, NDJSON or TOON from the first few kilobytes of a document."""
+
+import os
+import re
+from typing import Union
+
+from .core import KEY_ALIAS_PREFIX, _closing_quote
+from .exceptions import TOONError
+
+# Characters inspected by detect_file and the CLI/API auto modes
+SNIFF_SIZE = 4096
+
+FORMATS = ("json", "ndjson", "toon")
+
+# A line ending in anything but ",", ":" or an opening bracket, followed
+# by a line opening an object or array. Within one JSON document a value
+# only starts there after one of those, so this marks NDJSON records.
+_RECORD_BOUNDARY = re.compile(r'[^,:\[{\s]\s*\n\s*[{\[]')
+_JSON_SCALAR = re.compile(r'(?:-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null)\s*$')
+
+
+def detect_format(sample: Union[str, bytes]) -> str:
+    """Guess the format of a document from its beginning.
+
+    Only structural hints in ``sample`` are used: no parser runs, so a
+    truncated sample is fine and the result costs no more than a few
+    regular expression matches.
+
+    Args:
+        sample: Start of the document (e.g. its first ``SNIFF_SIZE``
+            characters); bytes are decoded as UTF-8
+
+    Returns:
+        "json", "ndjson" or "toon"
+
+    Raises:
+        TOONError: If the sample is empty or only whitespace
+
+    Example:
+        >>> detect_format('{"a": 1}\\n{"a": 2}\\n')
+        'ndjson'
+    """
+    if isinstance(sample, (bytes, bytearray)):
+        # A multi-byte character may be cut at the end of the sample
+        sample = bytes(sample).decode("utf-8", errors="ignore")
+    text = sample.lstrip("\ufeff \t\r\n")
+    if not text:
+        raise TOONError("Cannot detect the format of empty input")
+
+    if text[0] in "{[":
+        return "ndjson" if _RECORD_BOUNDARY.search(text) else "json"
+
+    first_line = text.split("\n", 1)[0].rstrip()
+    if first_line.startswith(KEY_ALIAS_PREFIX):
+        return "toon"
+    if text[0] == '"':
+        # A TOON document starts with a key, which a quoted key follows with ":"
+        end = _closing_quote(first_line)
+        return "toon" if end != -1 and first_line[end + 1:end + 2] == ":" else "json"
+    if _JSON_SCALAR.match(first_line):
+        return "json"
+    return "toon"
+
+
+def detect_file(path: Union[str, os.PathLike], size: int = SNIFF_SIZE) -> str:
+    """Detect the format of a file from its first ``size`` characters.
+
+    Compressed files (see ``open_compressed``) are sniffed after
+    decompression.
+
+    Raises:
+        TOONError: If the file is empty
+    """
+    from .stream import open_compressed
+    with open_compressed(path) as f:
+        return detect_format(f.read(size))
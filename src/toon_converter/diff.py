@@ -0,0 +1,192 @@
+"""Streaming structural diff between TOON documents."""
+
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .core import KEY_ALIAS_PREFIX, _container_type_of, _parse_value, _split_key_value
+
+Path = Tuple[Union[str, int], ...]
+
+
+class _Frame:
+    """Open container while walking a TOON stream."""
+
+    __slots__ = ("indent", "path", "is_list", "count", "record", "record_keys")
+
+    def __init__(self, indent: int, path: Path, is_list: bool):
+        self.indent = indent
+        self.path = path
+        self.is_list = is_list
+        # Next array index
+        self.count = 0
+        # Legacy record (keys directly in an array) still collecting keys
+        self.record = 0
+        self.record_keys: Optional[set] = None
+
+
+def iter_leaves(source: Union[str, IO[str], Iterable[str]]) -> Iterator[Tuple[Path, Any]]:
+    """Yield ``(path, value)`` for every scalar in a TOON document.
+
+    Lines are consumed one at a time with a single line of lookahead, so
+    memory is bounded by nesting depth rather than document size.
+
+    Args:
+        source: TOON formatted string, or a text file / iterable of lines
+
+    Yields:
+        Tuples of (path, value); path items are keys (str) or array
+        indices (int)
+    """
+    lines = _content_lines(source)
+    aliases: Dict[str, str] = {}
+    nxt = next(lines, None)
+
+    # Expand the "@key alias=key" header written by compact mode
+    while nxt is not None and nxt[0] == 0 and nxt[1].startswith(KEY_ALIAS_PREFIX):
+        alias, _, key = nxt[1][len(KEY_ALIAS_PREFIX):].partition("=")
+        aliases[alias] = key
+        nxt = next(lines, None)
+
+    stack = [_Frame(-1, (), False)]
+    while nxt is not None:
+        indent, stripped = nxt
+        nxt = next(lines, None)
+
+        while len(stack) > 1 and indent <= stack[-1].indent:
+            stack.pop()
+        frame = stack[-1]
+
+        if stripped == "-":
+            if frame.is_list:
+                frame.record_keys = None
+                stack.append(_Frame(indent, frame.path + (frame.count,), False))
+                frame.count += 1
+            continue
+
+        key, value_str, has_colon = _split_key_value(stripped)
+        if not has_colon:
+            # Simple value in array; ignored inside objects
+            if frame.is_list:
+                frame.record_keys = None
+                yield frame.path + (frame.count,), _parse_value(stripped)
+                frame.count += 1
+            continue
+
+        if aliases:
+            key = aliases.get(key, key)
+
+        if frame.is_list:
+            # Legacy: object in list without '-', a repeated key starts a new record
+            if frame.record_keys is None or key in frame.record_keys:
+                frame.record_keys = set()
+                frame.record = frame.count
+                frame.count += 1
+            frame.record_keys.add(key)
+            path = frame.path + (frame.record, key)
+        else:
+            path = frame.path + (key,)
+
+        if value_str:
+            yield path, _parse_value(value_str)
+        elif nxt is None or nxt[0] <= indent:
+            yield path, None
+        else:
+            is_list = _container_type_of(" " * nxt[0] + nxt[1], indent) is list
+            stack.append(_Frame(indent, path, is_list))
+
+
+def diff_toon(
+    a: Union[str, IO[str], Iterable[str]],
+    b: Union[str, IO[str], Iterable[str]],
+    window: int = 10000,
+) -> Iterator[dict]:
+    """Diff two TOON documents leaf by leaf without parsing either fully.
+
+    Both inputs are walked in lockstep. While their paths agree nothing
+    is buffered; after they diverge, unmatched leaves wait in a buffer of
+    at most ``window`` entries per side for the other document to catch
+    up. Leaves pushed out of a full buffer are reported as removed/added.
+
+    Args:
+        a: Old document (TOON string, text file, or iterable of lines)
+        b: New document
+        window: Maximum number of unmatched leaves buffered per side
+
+    Yields:
+        Records like ``{"op": "change", "path": "/users/0/name",
+        "old": "Alice", "new": "Alicia"}``; "add" records carry only
+        "new" and "remove" records only "old"
+    """
+    left = iter_leaves(a)
+    right = iter_leaves(b)
+    pending_left: Dict[Path, Any] = {}
+    pending_right: Dict[Path, Any] = {}
+
+    while True:
+        x = next(left, None)
+        y = next(right, None)
+        if x is None and y is None:
+            break
+
+        if x is not None and y is not None and x[0] == y[0] and not pending_left and not pending_right:
+            # Aligned: the common case for mostly unchanged documents
+            if not _same(x[1], y[1]):
+                yield _record("change", x[0], x[1], y[1])
+            continue
+
+        if x is not None:
+            path, value = x
+            if path in pending_right:
+                new = pending_right.pop(path)
+                if not _same(value, new):
+                    yield _record("change", path, value, new)
+            else:
+                pending_left[path] = value
+        if y is not None:
+            path, value = y
+            if path in pending_left:
+                old = pending_left.pop(path)
+                if not _same(old, value):
+                    yield _record("change", path, old, value)
+            else:
+                pending_right[path] = value
+
+        while len(pending_left) > window:
+            path = next(iter(pending_left))
+            yield _record("remove", path, pending_left.pop(path), None)
+        while len(pending_right) > window:
+            path = next(iter(pending_right))
+            yield _record("add", path, None, pending_right.pop(path))
+
+    for path, value in pending_left.items():
+        yield _record("remove", path, value, None)
+    for path, value in pending_right.items():
+        yield _record("add", path, None, value)
+
+
+def format_pointer(path: Path) -> str:
+    """Render a path as a JSON Pointer (RFC 6901)."""
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in path)
+
+
+def _record(op: str, path: Path, old: Any, new: Any) -> dict:
+    record = {"op": op, "path": format_pointer(path)}
+    if op != "add":
+        record["old"] = old
+    if op != "remove":
+        record["new"] = new
+    return record
+
+
+def _same(old: Any, new: Any) -> bool:
+    # 1, 1.0 and True are different TOON values
+    return type(old) is type(new) and old == new
+
+
+def _content_lines(source: Union[str, IO[str], Iterable[str]]) -> Iterator[Tuple[int, str]]:
+    """Yield (indent, stripped) for each non-blank line."""
+    if isinstance(source, str):
+        source = source.split("\n")
+    for line in source:
+        stripped = line.strip()
+        if stripped:
+            yield len(line) - len(line.lstrip()), stripped
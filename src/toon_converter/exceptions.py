@@ -23,6 +23,11 @@ class TOONParseError(TOONError):
         return self.message
 
 
+class TOONLimitError(TOONError):
+    """Raised when a document exceeds a configured depth or size limit."""
+    pass
+
+
 class TOONValidationError(TOONError):
     """Raised when validation fails."""
     pass
@@ -0,0 +1,375 @@
+"""Incremental TOON encoding that re-renders only changed subtrees."""
+
+from typing import Any, Dict, List, Optional, Union
+
+from .core import _key_to_string, _simple_value_to_string, json_to_toon
+from .deepjson import loads
+from .exceptions import TOONError
+
+
+class _Node:
+    """Rendered subtree.
+
+    Leaves (scalars and empty containers) keep their value; non-empty
+    containers keep child nodes and the joined text of the whole subtree.
+    """
+
+    __slots__ = ("value", "level", "prefix", "item", "children", "text")
+
+    def __init__(self, value: Any, level: int, prefix: Optional[str], item: bool = False):
+        self.value = value
+        self.level = level
+        self.prefix = prefix
+        # Array items get a "-" line only while they are non-empty objects
+        self.item = item
+        self.children: Optional[Union[Dict[str, "_Node"], List["_Node"]]] = None
+        self.text = ""
+
+
+class IncrementalEncoder:
+    """Encoder that keeps the previous output and patches it.
+
+    The rendered text of every subtree is cached. ``encode`` compares the
+    new object with the cached tree and re-renders only subtrees whose
+    values changed; ``apply_patch`` goes straight to the paths named by a
+    JSON Patch, so an update costs O(changed) plus re-joining the texts of
+    its ancestors. Each level of nesting keeps its own copy of its text,
+    so memory grows with document depth.
+
+    Output is identical to ``json_to_toon(data, indent, indent_char=...)``.
+
+    Example:
+        >>> encoder = IncrementalEncoder()
+        >>> encoder.encode({"a": 1, "b": [1, 2]})
+        >>> encoder.apply_patch([{"op": "replace", "path": "/a", "value": 2}])
+    """
+
+    def __init__(self, indent: int = 2, indent_char: str = " "):
+        self.unit = indent_char * indent
+        self._root: Optional[_Node] = None
+        self._output = ""
+
+    @property
+    def output(self) -> str:
+        """Most recent TOON output."""
+        return self._output
+
+    def encode(self, data: Union[dict, list, str]) -> str:
+        """Encode ``data``, reusing the text of unchanged subtrees.
+
+        Args:
+            data: JSON data (dict, list, or JSON string)
+
+        Returns:
+            TOON formatted string
+        """
+        if isinstance(data, str):
+            data = loads(data)
+
+        if self._root is None or not _is_container(data) or self._root.children is None:
+            self._reset(data)
+        elif self._sync(self._root, data):
+            self._output = self._root.text
+        return self._output
+
+    def apply_patch(self, patch: List[dict]) -> str:
+        """Apply a JSON Patch (RFC 6902) and re-render the touched subtrees.
+
+        Args:
+            patch: List of patch operations
+
+        Returns:
+            TOON formatted string
+
+        Raises:
+            TOONError: If an operation or path is invalid
+        """
+        if self._root is None:
+            raise TOONError("Nothing encoded yet")
+
+        for operation in patch:
+            op = operation.get("op")
+            path = _parse_pointer(operation.get("path", ""))
+            if op in ("add", "replace"):
+                self._set(path, operation["value"], insert=op == "add")
+            elif op == "remove":
+                self._remove(path)
+            elif op in ("move", "copy"):
+                source = _parse_pointer(operation["from"])
+                value = _to_value(self._find(source))
+                if op == "move":
+                    self._remove(source)
+                self._set(path, value, insert=True)
+            elif op == "test":
+                if _to_value(self._find(path)) != operation["value"]:
+                    raise TOONError(f"Test failed at '{operation['path']}'")
+            else:
+                raise TOONError(f"Unsupported patch operation '{op}'")
+
+        self._output = self._root.text
+        return self._output
+
+    def _reset(self, data: Any) -> None:
+        if _is_container(data):
+            self._root = self._build(data, 0, None)
+            self._output = self._root.text
+        else:
+            # Scalars and empty documents use json_to_toon's special cases
+            self._root = _Node(_snapshot(data), 0, None)
+            self._output = self._root.text = json_to_toon(data)
+
+    def _build(self, value: Any, level: int, prefix: Optional[str]) -> _Node:
+        """Render a subtree, returning its node."""
+        root = _Node(value, level, prefix)
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            value = node.value
+            if not _is_container(value):
+                node.value = _snapshot(value)
+                node.text = self._leaf_text(node)
+                continue
+            order.append(node)
+            child_level = node.level + 1 if node.prefix else node.level
+            if isinstance(value, dict):
+                node.children = {key: self._child(key, item, child_level) for key, item in value.items()}
+                stack.extend(node.children.values())
+            else:
+                node.children = [self._child(None, item, child_level) for item in value]
+                stack.extend(node.children)
+            node.value = dict if isinstance(value, dict) else list
+
+        # Children are rendered before their parents
+        for node in reversed(order):
+            self._join(node)
+        return root
+
+    def _child(self, key: Optional[str], value: Any, level: int) -> _Node:
+        spacing = self.unit * level
+        if key is not None:
+            return _Node(value, level, f"{spacing}{_key_to_string(key)}:")
+        if isinstance(value, dict) and value:
+            return _Node(value, level, f"{spacing}-", item=True)
+        return _Node(value, level, None, item=True)
+
+    def _leaf_text(self, node: _Node) -> str:
+        value = node.value
+        if isinstance(value, dict):
+            val_str = "{}"
+        elif isinstance(value, list):
+            val_str = "[]"
+        else:
+            val_str = _simple_value_to_string(value, node.prefix is None)
+        if node.prefix:
+            return f"{node.prefix} {val_str}"
+        return f"{self.unit * node.level}{val_str}"
+
+    def _join(self, node: _Node) -> None:
+        children = node.children.values() if isinstance(node.children, dict) else node.children
+        texts = [child.text for child in children]
+        if node.prefix:
+            texts.insert(0, node.prefix)
+        node.text = "\n".join(texts)
+
+    def _sync(self, node: _Node, value: Any) -> bool:
+        """Bring ``node`` in line with ``value``; return whether it changed."""
+        children = node.children
+        if children is None:
+            if _same_leaf(node.value, value):
+                return False
+            self._replace(node, value)
+            return True
+
+        if (node.value is dict) != isinstance(value, dict) or not _is_container(value):
+            self._replace(node, value)
+            return True
+
+        child_level = node.level + 1 if node.prefix else node.level
+        changed = False
+        if node.value is dict:
+            if list(value) == list(children):
+                for key, child in children.items():
+                    if self._sync(child, value[key]):
+                        changed = True
+            else:
+                # Keys added, removed or reordered: reuse the nodes of kept keys
+                merged = {}
+                for key, item in value.items():
+                    child = children.get(key)
+                    if child is None:
+                        child = self._child(key, item, child_level)
+                        self._fill(child)
+                    else:
+                        self._sync(child, item)
+                    merged[key] = child
+                node.children = merged
+                changed = True
+        else:
+            for i, child in enumerate(children[:len(value)]):
+                if self._sync(child, value[i]):
+                    changed = True
+            if len(value) != len(children):
+                del children[len(value):]
+                for item in value[len(children):]:
+                    child = self._child(None, item, child_level)
+                    self._fill(child)
+                    children.append(child)
+                changed = True
+
+        if changed:
+            self._join(node)
+        return changed
+
+    def _fill(self, node: _Node) -> None:
+        """Render a freshly created child node from its value."""
+        fresh = self._build(node.value, node.level, node.prefix)
+        node.value, node.children, node.text = fresh.value, fresh.children, fresh.text
+
+    def _replace(self, node: _Node, value: Any) -> None:
+        """Re-render ``node`` in place from ``value``."""
+        if node.item:
+            node.prefix = f"{self.unit * node.level}-" if isinstance(value, dict) and value else None
+        node.value = value
+        self._fill(node)
+
+    def _find(self, path: List[str]) -> _Node:
+        node = self._root
+        for token in path:
+            node = _child_at(node, token)
+        return node
+
+    def _set(self, path: List[str], value: Any, insert: bool) -> None:
+        if not path:
+            self._reset(value)
+            return
+
+        ancestors = self._ancestors(path)
+        parent = ancestors[-1]
+        token = path[-1]
+        child_level = parent.level + 1 if parent.prefix else parent.level
+
+        if parent.children is None:
+            if not insert or not isinstance(parent.value, (dict, list)):
+                raise TOONError(f"Path '/{'/'.join(path)}' not found")
+            # Adding to an empty container turns the leaf into a container
+            container = {} if isinstance(parent.value, dict) else []
+            if isinstance(container, list) and token not in ("0", "-"):
+                raise TOONError(f"Index '{token}' out of range")
+            if isinstance(container, dict):
+                container[token] = value
+            else:
+                container.append(value)
+            self._replace(parent, container)
+        elif parent.value is dict:
+            if not insert and token not in parent.children:
+                raise TOONError(f"Path '/{'/'.join(path)}' not found")
+            if token in parent.children:
+                self._replace(parent.children[token], value)
+            else:
+                child = parent.children[token] = self._child(token, value, child_level)
+                self._fill(child)
+        else:
+            index = _list_index(parent.children, token, insert)
+            if insert:
+                child = self._child(None, value, child_level)
+                self._fill(child)
+                parent.children.insert(index, child)
+            else:
+                self._replace(parent.children[index], value)
+
+        self._rejoin(ancestors)
+
+    def _remove(self, path: List[str]) -> None:
+        if not path:
+            raise TOONError("Cannot remove the document root")
+
+        ancestors = self._ancestors(path)
+        parent = ancestors[-1]
+        token = path[-1]
+        if parent.children is None:
+            raise TOONError(f"Path '/{'/'.join(path)}' not found")
+        if parent.value is dict:
+            if token not in parent.children:
+                raise TOONError(f"Path '/{'/'.join(path)}' not found")
+            del parent.children[token]
+        else:
+            del parent.children[_list_index(parent.children, token, False)]
+
+        if not parent.children and parent is not self._root:
+            # An emptied container renders inline as "{}" / "[]"
+            self._replace(parent, {} if parent.value is dict else [])
+        self._rejoin(ancestors)
+
+    def _ancestors(self, path: List[str]) -> List[_Node]:
+        """Nodes from the root down to the parent of ``path``."""
+        nodes = [self._root]
+        for token in path[:-1]:
+            nodes.append(_child_at(nodes[-1], token))
+        return nodes
+
+    def _rejoin(self, ancestors: List[_Node]) -> None:
+        for node in reversed(ancestors):
+            if node.children is not None:
+                self._join(node)
+        root = self._root
+        if root.children is not None and not root.children:
+            # Removing the last key leaves an empty document
+            self._reset({} if root.value is dict else [])
+
+
+def _is_container(value: Any) -> bool:
+    return isinstance(value, (dict, list)) and bool(value)
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy empty containers so later in-place mutation is still detected."""
+    if isinstance(value, dict):
+        return {}
+    if isinstance(value, list):
+        return []
+    return value
+
+
+def _same_leaf(old: Any, new: Any) -> bool:
+    # 1, 1.0 and True render differently, so types must match too
+    return type(old) is type(new) and old == new
+
+
+def _child_at(node: _Node, token: str) -> _Node:
+    if node.children is None:
+        raise TOONError(f"Path segment '{token}' not found")
+    if node.value is dict:
+        if token not in node.children:
+            raise TOONError(f"Path segment '{token}' not found")
+        return node.children[token]
+    return node.children[_list_index(node.children, token, False)]
+
+
+def _list_index(children: List[_Node], token: str, insert: bool) -> int:
+    if insert and token == "-":
+        return len(children)
+    if not token.isdigit():
+        raise TOONError(f"Invalid array index '{token}'")
+    index = int(token)
+    if index > len(children) or (index == len(children) and not insert):
+        raise TOONError(f"Index '{token}' out of range")
+    return index
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """Split a JSON Pointer (RFC 6901) into unescaped tokens."""
+    if not pointer:
+        return []
+    if not pointer.startswith("/"):
+        raise TOONError(f"Invalid JSON Pointer '{pointer}'")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _to_value(node: _Node) -> Any:
+    """Rebuild the Python value a node was rendered from."""
+    if node.children is None:
+        return _snapshot(node.value)
+    if node.value is dict:
+        return {key: _to_value(child) for key, child in node.children.items()}
+    return [_to_value(child) for child in node.children]
@@ -0,0 +1,235 @@
+"""Line-offset index sidecars for random access into TOON files."""
+
+import json
+import os
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .core import KEY_ALIAS_PREFIX, _container_type_of, _parse_lines, _parse_value, _split_key_value
+from .exceptions import TOONParseError
+
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".idx"
+
+_ALIAS_PREFIX_BYTES = KEY_ALIAS_PREFIX.encode("utf-8")
+
+
+def build_index(path: Union[str, os.PathLike]) -> dict:
+    """Index the byte spans of a TOON file's top-level keys.
+
+    The file is scanned once in binary. Each top-level key records its
+    span and the start offsets of its direct children (array elements or
+    object keys).
+
+    Args:
+        path: TOON file path
+
+    Returns:
+        Index dictionary, suitable for ``save_index``
+
+    Raises:
+        TOONParseError: If a line is nested under a scalar top-level value
+    """
+    stat = os.stat(path)
+    keys: Dict[str, dict] = {}
+    aliases: Dict[str, str] = {}
+    header = True
+    entry = None
+    child_indent = 0
+    # Whether the last child can own more-indented lines
+    child_open = False
+    offset = 0
+
+    with open(path, "rb") as f:
+        for line_number, raw in enumerate(f, 1):
+            start = offset
+            offset += len(raw)
+            content = raw.strip()
+            if not content:
+                continue
+            indent = len(raw) - len(raw.lstrip())
+
+            if header:
+                if raw.startswith(_ALIAS_PREFIX_BYTES):
+                    text = content.decode("utf-8")[len(KEY_ALIAS_PREFIX):]
+                    alias, _, key = text.partition("=")
+                    aliases[alias] = key
+                    continue
+                header = False
+
+            if indent == 0:
+                if entry is not None:
+                    entry["end"] = start
+                key, value_str, has_colon = _split_key_value(content.decode("utf-8"))
+                if not has_colon:
+                    # Top-level scalars are ignored by the parser
+                    entry = None
+                    continue
+                entry = {
+                    "start": start,
+                    "end": None,
+                    "kind": "scalar" if value_str else None,
+                    "children": [],
+                }
+                keys[aliases.get(key, key)] = entry
+                continue
+
+            if entry is None:
+                continue
+            if entry["kind"] == "scalar":
+                raise TOONParseError("Unexpected indentation under a value", line_number=line_number)
+
+            if entry["kind"] is None:
+                child_indent = indent
+                # The parser's own lookahead, so quoted items stay list items
+                keyed = _container_type_of(raw.decode("utf-8").rstrip("\r\n"), 0) is dict
+                entry["kind"] = "dict" if keyed else "list"
+
+            children = entry["children"]
+            if children is None:
+                continue
+            if indent < child_indent:
+                # Irregular layout: lookups fall back to parsing the whole key
+                entry["children"] = None
+            elif indent > child_indent:
+                if not child_open:
+                    entry["children"] = None
+            elif entry["kind"] == "list":
+                if b":" in content and _split_key_value(content.decode("utf-8"))[2]:
+                    entry["children"] = None
+                else:
+                    children.append(start)
+                    child_open = content == b"-"
+            else:
+                key, value_str, has_colon = _split_key_value(content.decode("utf-8"))
+                if not has_colon:
+                    entry["children"] = None
+                else:
+                    children.append([aliases.get(key, key), start])
+                    child_open = not value_str
+
+    if entry is not None:
+        entry["end"] = offset
+
+    return {
+        "version": INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "aliases": aliases,
+        "keys": keys,
+    }
+
+
+def save_index(index: dict, index_path: Union[str, os.PathLike]) -> None:
+    """Write an index sidecar file."""
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+
+def load_index(index_path: Union[str, os.PathLike]) -> Optional[dict]:
+    """Read an index sidecar file, or None if it is missing or unreadable."""
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+    return index
+
+
+class IndexedToonFile(Mapping):
+    """Random access to the top-level keys of a large TOON file.
+
+    Lookups seek straight to the indexed byte span and parse only that
+    slice. The sidecar index (``<path>.idx`` by default) is rebuilt and
+    rewritten whenever the file's size or mtime no longer match it.
+
+    Example:
+        >>> archive = IndexedToonFile("archive.toon")
+        >>> archive.lookup("users", 12345)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        index_path: Optional[Union[str, os.PathLike]] = None,
+    ):
+        self.path = os.fspath(path)
+        self.index_path = os.fspath(index_path) if index_path else self.path + INDEX_SUFFIX
+        self._index = load_index(self.index_path)
+        self._dict_children: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self._ensure_fresh()
+
+    def _ensure_fresh(self) -> None:
+        """Rebuild the index if the file changed since it was written."""
+        stat = os.stat(self.path)
+        index = self._index
+        if index is None or index["size"] != stat.st_size or index["mtime_ns"] != stat.st_mtime_ns:
+            self._index = build_index(self.path)
+            self._dict_children.clear()
+            save_index(self._index, self.index_path)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.lookup(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index["keys"])
+
+    def __len__(self) -> int:
+        return len(self._index["keys"])
+
+    def lookup(self, key: str, item: Optional[Union[int, str]] = None) -> Any:
+        """Parse a top-level value, or one element/key directly beneath it.
+
+        Args:
+            key: Top-level key
+            item: Array index or object key inside ``key``'s value
+
+        Returns:
+            The parsed value
+        """
+        self._ensure_fresh()
+        entry = self._index["keys"][key]
+        if item is None:
+            return self._parse_entry(key, entry)
+
+        children = entry["children"]
+        if not children or entry["kind"] not in ("list", "dict"):
+            return self._parse_entry(key, entry)[item]
+
+        if entry["kind"] == "list":
+            if item < 0:
+                item += len(children)
+            if not 0 <= item < len(children):
+                raise IndexError(item)
+            end = children[item + 1] if item + 1 < len(children) else entry["end"]
+            lines = self._read_lines(children[item], end)
+            stripped = lines[0].strip()
+            if stripped == "-":
+                return _parse_lines(lines[1:], self._index["aliases"])
+            return _parse_value(stripped)
+
+        start, end = self._object_children(key, entry)[item]
+        return _parse_lines(self._read_lines(start, end), self._index["aliases"])[item]
+
+    def _parse_entry(self, key: str, entry: dict) -> Any:
+        return _parse_lines(self._read_lines(entry["start"], entry["end"]), self._index["aliases"])[key]
+
+    def _object_children(self, key: str, entry: dict) -> Dict[str, Tuple[int, int]]:
+        """Map child key -> byte span, built on first use."""
+        spans = self._dict_children.get(key)
+        if spans is None:
+            spans = {}
+            children: List[list] = entry["children"]
+            for i, (child, start) in enumerate(children):
+                end = children[i + 1][1] if i + 1 < len(children) else entry["end"]
+                spans[child] = (start, end)
+            self._dict_children[key] = spans
+        return spans
+
+    def _read_lines(self, start: int, end: int) -> List[str]:
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            text = f.read(end - start).decode("utf-8")
+        return [line for line in text.split("\n") if line.strip()]
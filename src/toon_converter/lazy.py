@@ -0,0 +1,223 @@
+"""Lazy TOON document proxies that parse subtrees on access."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+from .core import (
+    _child_container_type,
+    _parse_lines,
+    _parse_value,
+    _read_alias_header,
+    _split_key_value,
+)
+
+
+class _Document:
+    """Lines of a TOON document shared by all of its proxies."""
+
+    __slots__ = ("lines", "indents", "aliases")
+
+    def __init__(self, lines: Sequence, aliases: Dict[str, str], indents: Optional[Sequence] = None):
+        self.lines = lines
+        if indents is None:
+            indents = [len(line) - len(line.lstrip()) for line in lines]
+        self.indents = indents
+        self.aliases = aliases
+
+    def block_end(self, i: int, end: int) -> int:
+        """Index of the first line after ``i`` that is not nested under it."""
+        indents = self.indents
+        indent = indents[i]
+        j = i + 1
+        while j < end and indents[j] > indent:
+            j += 1
+        return j
+
+
+class LazyMapping(Mapping):
+    """Read-only mapping over a TOON object block.
+
+    Keys are indexed by one scan of the block's indentation. Values are
+    parsed (and nested blocks wrapped in further proxies) the first time
+    they are accessed, then cached.
+    """
+
+    def __init__(self, doc: _Document, index: Dict[str, Tuple[int, int, Optional[str]]]):
+        self._doc = doc
+        # key -> (line index, block end, value string)
+        self._index = index
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        i, end, value_str = self._index[key]
+        if value_str:
+            value = _parse_value(value_str)
+        else:
+            value = _nested_value(self._doc, i, end)
+        self._cache[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"LazyMapping({list(self._index)!r})"
+
+    def to_dict(self) -> dict:
+        """Parse the whole block into plain dicts and lists."""
+        return {key: _materialize(value) for key, value in self.items()}
+
+
+class LazySequence(Sequence):
+    """Read-only sequence over a TOON array block.
+
+    Item positions are indexed up front; object items become LazyMapping
+    proxies and scalars are parsed on access.
+    """
+
+    def __init__(self, doc: _Document, items: List[Tuple[int, int]]):
+        self._doc = doc
+        # (line index, block end); a "-" line marks an object item
+        self._items = items
+        self._cache: Dict[int, Any] = {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        if index < 0:
+            index += len(self._items)
+        if index in self._cache:
+            return self._cache[index]
+        i, end = self._items[index]
+        doc = self._doc
+        stripped = doc.lines[i].strip()
+        if stripped == "-":
+            value = _mapping_or_value(doc, i + 1, end)
+        else:
+            value = _parse_value(stripped)
+        self._cache[index] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, Sequence)) and not isinstance(other, (str, bytes)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazySequence(<{len(self._items)} items>)"
+
+    def to_list(self) -> list:
+        """Parse the whole block into plain dicts and lists."""
+        return [_materialize(value) for value in self]
+
+
+def lazy_load(src: Union[str, IO[str]]) -> Union[LazyMapping, dict]:
+    """Open a TOON document without parsing it.
+
+    Only the top-level keys are indexed; nested objects and arrays are
+    indexed when first accessed and scalars are parsed on access.
+
+    Args:
+        src: TOON formatted string or text file object
+
+    Returns:
+        Mapping proxy over the document root (a plain dict when the
+        document's layout needs the full parser)
+    """
+    if not isinstance(src, str):
+        src = src.read()
+    lines = [line for line in src.strip().split("\n") if line.strip()]
+    lines, aliases = _read_alias_header(lines)
+    doc = _Document(lines, aliases)
+    return _mapping_or_value(doc, 0, len(lines))
+
+
+def _nested_value(doc: _Document, i: int, end: int) -> Any:
+    """Value of the key on line ``i`` whose block ends at ``end``."""
+    next_type = _child_container_type(doc.lines, i, doc.indents[i])
+    if next_type is None:
+        return None
+    if next_type is dict:
+        proxy = _index_mapping(doc, i + 1, end)
+    else:
+        proxy = _index_sequence(doc, i + 1, end)
+    if proxy is not None:
+        return proxy
+    # Irregular block: let the full parser decide
+    key, _, _ = _split_key_value(doc.lines[i].strip())
+    return _parse_lines(doc.lines[i:end], doc.aliases)[doc.aliases.get(key, key)]
+
+
+def _mapping_or_value(doc: _Document, start: int, end: int) -> Union[LazyMapping, dict]:
+    """Proxy for an object block, or the parsed dict if it is irregular."""
+    proxy = _index_mapping(doc, start, end)
+    if proxy is None:
+        return _parse_lines(doc.lines[start:end], doc.aliases)
+    return proxy
+
+
+def _index_mapping(doc: _Document, start: int, end: int) -> Optional[LazyMapping]:
+    """Index the keys of an object block.
+
+    Returns None when the block is laid out in a way only the full parser
+    handles (e.g. mixed indentation or lines nested under a scalar).
+    """
+    lines, indents, aliases = doc.lines, doc.indents, doc.aliases
+    index: Dict[str, Tuple[int, int, Optional[str]]] = {}
+    if start == end:
+        return LazyMapping(doc, index)
+
+    child_indent = indents[start]
+    i = start
+    while i < end:
+        if indents[i] != child_indent:
+            return None
+        key, value_str, has_colon = _split_key_value(lines[i].strip())
+        if not has_colon:
+            return None
+        block_end = doc.block_end(i, end)
+        if value_str and block_end > i + 1:
+            return None
+        if aliases:
+            key = aliases.get(key, key)
+        index[key] = (i, block_end, value_str)
+        i = block_end
+    return LazyMapping(doc, index)
+
+
+def _index_sequence(doc: _Document, start: int, end: int) -> Optional[LazySequence]:
+    """Index the items of an array block, or None if it is irregular."""
+    lines, indents = doc.lines, doc.indents
+    items: List[Tuple[int, int]] = []
+    item_indent = indents[start]
+    i = start
+    while i < end:
+        if indents[i] != item_indent:
+            return None
+        stripped = lines[i].strip()
+        block_end = doc.block_end(i, end)
+        if stripped != "-":
+            # Keyed lines directly in an array use the legacy record rules
+            if block_end > i + 1 or _split_key_value(stripped)[2]:
+                return None
+        items.append((i, block_end))
+        i = block_end
+    return LazySequence(doc, items)
+
+
+def _materialize(value: Any) -> Any:
+    if isinstance(value, LazyMapping):
+        return value.to_dict()
+    if isinstance(value, LazySequence):
+        return value.to_list()
+    return value
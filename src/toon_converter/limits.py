@@ -0,0 +1,139 @@
+"""Depth and size limits for untrusted documents."""
+
+import re
+from typing import Any, Iterable, Optional
+
+from .exceptions import TOONLimitError
+
+# Outside strings only brackets, commas and quotes matter; inside strings
+# only the closing quote and escapes do.
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+class JSONShapeScanner:
+    """Track the nesting depth and value count of raw JSON bytes.
+
+    Bytes can be fed in arbitrary chunks as they arrive; ``feed`` raises
+    as soon as a limit is crossed, before the rest of the body is read.
+    The value count is taken from brackets and commas, so each empty
+    container counts one value too many.
+
+    Example:
+        >>> scanner = JSONShapeScanner(max_depth=64)
+        >>> for chunk in body_chunks:
+        ...     scanner.feed(chunk)
+    """
+
+    def __init__(self, max_depth: Optional[int] = None, max_nodes: Optional[int] = None):
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.depth = 0
+        self.nodes = 1
+        self._in_string = False
+        # Whether the previous chunk ended on a backslash inside a string
+        self._escape = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Scan the next chunk of the document.
+
+        Raises:
+            TOONLimitError: If the depth or value count exceeds its limit
+        """
+        pos = 0
+        end = len(chunk)
+        if self._escape and chunk:
+            pos = 1
+            self._escape = False
+
+        while pos < end:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(chunk, pos)
+                if match is None:
+                    return
+                pos = match.end()
+                if chunk[match.start()] == 0x5C:  # backslash
+                    if pos >= end:
+                        self._escape = True
+                        return
+                    pos += 1
+                else:
+                    self._in_string = False
+                continue
+
+            match = _STRUCTURAL.search(chunk, pos)
+            if match is None:
+                return
+            pos = match.end()
+            char = chunk[match.start()]
+            if char == 0x22:  # quote
+                self._in_string = True
+            elif char == 0x5B or char == 0x7B:  # [ {
+                self.depth += 1
+                self.nodes += 1
+                if self.max_depth is not None and self.depth > self.max_depth:
+                    raise TOONLimitError(f"Document nesting exceeds max_depth={self.max_depth}")
+                if self.max_nodes is not None and self.nodes > self.max_nodes:
+                    raise TOONLimitError(f"Document has more than max_nodes={self.max_nodes} values")
+            elif char == 0x5D or char == 0x7D:  # ] }
+                self.depth -= 1
+            else:
+                self.nodes += 1
+                if self.max_nodes is not None and self.nodes > self.max_nodes:
+                    raise TOONLimitError(f"Document has more than max_nodes={self.max_nodes} values")
+
+
+def check_data(data: Any, max_depth: Optional[int] = None, max_nodes: Optional[int] = None) -> None:
+    """Check parsed JSON data against depth and value-count limits.
+
+    Every dict, list and scalar counts as one value; the root container
+    is at depth 1. The walk stops at the first violation.
+
+    Raises:
+        TOONLimitError: If a limit is exceeded
+    """
+    nodes = 0
+    stack = [(data, 1)]
+    while stack:
+        obj, depth = stack.pop()
+        nodes += 1
+        if isinstance(obj, dict):
+            children = obj.values()
+        elif isinstance(obj, list):
+            children = obj
+        else:
+            continue
+        if max_depth is not None and depth > max_depth:
+            raise TOONLimitError(f"Document nesting exceeds max_depth={max_depth}")
+        # Everything on the stack will be counted, so fail before walking it
+        if max_nodes is not None and nodes + len(stack) + len(children) > max_nodes:
+            raise TOONLimitError(f"Document has more than max_nodes={max_nodes} values")
+        depth += 1
+        stack.extend((child, depth) for child in children)
+
+
+def check_lines(lines: Iterable[str], max_depth: Optional[int] = None, max_nodes: Optional[int] = None) -> None:
+    """Check non-empty TOON lines against depth and value-count limits.
+
+    Each line yields at most one value, so the count is checked without
+    parsing; depth follows the indentation of enclosing lines.
+
+    Raises:
+        TOONLimitError: If a limit is exceeded
+    """
+    if max_nodes is not None:
+        lines = list(lines)
+        # The root object plus one value per line
+        if len(lines) + 1 > max_nodes:
+            raise TOONLimitError(f"Document has more than max_nodes={max_nodes} values")
+    if max_depth is None:
+        return
+
+    indents = []
+    for line in lines:
+        indent = len(line) - len(line.lstrip())
+        while indents and indents[-1] >= indent:
+            indents.pop()
+        indents.append(indent)
+        if len(indents) > max_depth:
+            raise TOONLimitError(f"Document nesting exceeds max_depth={max_depth}")
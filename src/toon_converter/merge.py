@@ -0,0 +1,147 @@
+"""Text-level merging of TOON fragments."""
+
+from typing import IO, Any, Dict, Iterable, List, Tuple, Union
+
+from .core import _parse_lines, _read_alias_header, _split_key_value, json_to_toon
+from .exceptions import TOONError
+
+MERGE_STRATEGIES = ("deep", "last", "first", "error")
+
+
+class _Block:
+    """One top-level key of a fragment.
+
+    Blocks keep their source lines (normalized to indentation levels) and
+    are only parsed when another fragment defines the same key.
+    """
+
+    __slots__ = ("key", "levels", "aliases")
+
+    def __init__(self, key: str, aliases: Dict[str, str]):
+        self.key = key
+        # (level, stripped line) pairs, starting with the key line itself
+        self.levels: List[Tuple[int, str]] = []
+        self.aliases = aliases
+
+    def render(self, indent: int, indent_char: str) -> str:
+        if self.aliases:
+            # Aliased keys only make sense with their own header
+            return json_to_toon({self.key: self.value()}, indent, indent_char=indent_char)
+        unit = indent_char * indent
+        return "\n".join(f"{unit * level}{stripped}" for level, stripped in self.levels)
+
+    def value(self) -> Any:
+        lines = [" " * level + stripped for level, stripped in self.levels]
+        return _parse_lines(lines, self.aliases)[self.key]
+
+    def same_text(self, other: "_Block") -> bool:
+        return not self.aliases and not other.aliases and self.levels == other.levels
+
+
+def merge_toon(
+    fragments: Iterable[Union[str, IO[str]]],
+    strategy: str = "deep",
+    indent: int = 2,
+    indent_char: str = " ",
+) -> str:
+    """Merge TOON fragments into one document without a full round-trip.
+
+    Fragments are split into top-level blocks by indentation and
+    re-indented to a common width. Keys defined by a single fragment (or
+    with identical text everywhere) are copied as text; only conflicting
+    keys are parsed and resolved by ``strategy``.
+
+    Args:
+        fragments: TOON strings or text file objects
+        strategy: How to resolve a key defined by several fragments:
+            "deep" merges objects recursively (other values: last wins),
+            "last"/"first" keep one fragment's block, "error" raises
+        indent: Number of spaces for indentation of the output
+        indent_char: Character used for indentation (" " or "\\t")
+
+    Returns:
+        Merged TOON string, keys in order of first appearance
+
+    Raises:
+        TOONError: On a conflict with strategy "error"
+        ValueError: If the strategy is unknown
+    """
+    if strategy not in MERGE_STRATEGIES:
+        raise ValueError(f"Unknown merge strategy '{strategy}'")
+
+    merged: Dict[str, List[_Block]] = {}
+    for fragment in fragments:
+        if not isinstance(fragment, str):
+            fragment = fragment.read()
+        for block in _split_blocks(fragment):
+            blocks = merged.setdefault(block.key, [])
+            if not blocks or not block.same_text(blocks[-1]):
+                blocks.append(block)
+
+    output = []
+    for key, blocks in merged.items():
+        if len(blocks) == 1 or strategy == "last":
+            output.append(blocks[-1].render(indent, indent_char))
+        elif strategy == "first":
+            output.append(blocks[0].render(indent, indent_char))
+        elif strategy == "error":
+            raise TOONError(f"Conflicting values for key '{key}'")
+        else:
+            value = blocks[0].value()
+            for block in blocks[1:]:
+                value = _deep_merge(value, block.value())
+            output.append(json_to_toon({key: value}, indent, indent_char=indent_char))
+    return "\n".join(output)
+
+
+def _split_blocks(fragment: str) -> List[_Block]:
+    """Split a fragment into top-level key blocks.
+
+    Within one fragment a repeated key replaces the earlier block, as it
+    does in ``toon_to_json``.
+    """
+    lines = [line for line in fragment.strip().split("\n") if line.strip()]
+    lines, aliases = _read_alias_header(lines)
+
+    blocks: Dict[str, _Block] = {}
+    block = None
+    indents: List[int] = []
+    for line in lines:
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+        while indents and indents[-1] >= indent:
+            indents.pop()
+        level = len(indents)
+        indents.append(indent)
+
+        if level == 0:
+            key, _, has_colon = _split_key_value(stripped)
+            if not has_colon:
+                # Top-level values without a key are ignored by the parser
+                block = None
+                continue
+            key = aliases.get(key, key)
+            block = _Block(key, aliases)
+            blocks[key] = block
+        elif block is None:
+            continue
+        block.levels.append((level, stripped))
+    return list(blocks.values())
+
+
+def _deep_merge(old: Any, new: Any) -> Any:
+    """Merge ``new`` into ``old``: objects recursively, anything else replaced."""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return new
+    result = dict(old)
+    stack = [(result, new)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                current = target[key] = dict(current)
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return result
@@ -0,0 +1,102 @@
+"""Field accessors for encoding dataclasses, NamedTuples and slotted objects."""
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional, Union
+
+# Types the encoder writes as scalars
+SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Per-class accessor returning the object's fields as a dict (or list);
+# None records that a class has no accessor
+_ACCESSORS: Dict[type, Optional[Callable[[Any], Union[dict, list]]]] = {}
+
+_MISSING = object()
+
+
+def register_encoder(cls: type, accessor: Callable[[Any], Union[dict, list]]) -> None:
+    """Register how ``json_to_toon`` turns instances of ``cls`` into containers.
+
+    The accessor should return a shallow dict or list; nested values are
+    converted as the encoder reaches them.
+
+    Example:
+        >>> register_encoder(Point, lambda p: {"x": p.x, "y": p.y})
+    """
+    _ACCESSORS[cls] = accessor
+
+
+def to_container(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Return the dict/list view of ``obj``, or ``obj`` if it has none.
+
+    Dataclasses, NamedTuples and classes with ``__slots__`` get an
+    accessor built once per class. Other objects go to ``default``
+    (like ``json.dumps``) when it is given.
+    """
+    cls = type(obj)
+    try:
+        accessor = _ACCESSORS[cls]
+    except KeyError:
+        accessor = _ACCESSORS[cls] = _build_accessor(cls)
+    if accessor is not None:
+        return accessor(obj)
+    if default is not None:
+        return default(obj)
+    return obj
+
+
+def _build_accessor(cls: type) -> Optional[Callable[[Any], dict]]:
+    if hasattr(cls, "__dataclass_fields__"):
+        # Imported here: dataclasses is only needed for dataclass input
+        from dataclasses import fields
+        return _getter_accessor(tuple(field.name for field in fields(cls)))
+
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        names = cls._fields
+        return lambda obj: dict(zip(names, obj))
+
+    # Only fully slotted classes: otherwise instances also have a __dict__
+    if any("__slots__" not in klass.__dict__ for klass in cls.__mro__[:-1]):
+        return None
+    slots = _slot_names(cls)
+    if not slots or "__dict__" in slots:
+        return None
+    return _slots_accessor(slots)
+
+
+def _getter_accessor(names: tuple) -> Callable[[Any], dict]:
+    if not names:
+        return lambda obj: {}
+    if len(names) == 1:
+        name = names[0]
+        return lambda obj: {name: getattr(obj, name)}
+    getter = attrgetter(*names)
+    return lambda obj: dict(zip(names, getter(obj)))
+
+
+def _slots_accessor(names: tuple) -> Callable[[Any], dict]:
+    def accessor(obj: Any) -> dict:
+        result = {}
+        for name in names:
+            # Unassigned slots are left out, like missing dict keys
+            value = getattr(obj, name, _MISSING)
+            if value is not _MISSING:
+                result[name] = value
+        return result
+    return accessor
+
+
+def _slot_names(cls: type) -> tuple:
+    """Slot names declared along the MRO, base classes first."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name == "__weakref__" or name in names:
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                # Private slots are stored under their mangled name
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            names.append(name)
+    return tuple(names)
@@ -0,0 +1,145 @@
+"""Streaming file I/O with transparent compression."""
+
+import os
+from operator import itemgetter
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Union
+
+from .core import _build_key_aliases, _iter_toon_chunks, _numbered_lines, _parse_lines, json_to_toon
+from .objects import to_container
+
+# Compression suffix -> codec name
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
+# Lines per write when streaming TOON output
+CHUNK_LINES = 4096
+
+
+def split_compression(path: Union[str, os.PathLike]) -> tuple:
+    """Split a path into (path without compression suffix, codec or None).
+
+    Example:
+        >>> split_compression("archive.toon.gz")
+        ('archive.toon', 'gzip')
+    """
+    path = os.fspath(path)
+    root, ext = os.path.splitext(path)
+    codec = COMPRESSION_SUFFIXES.get(ext.lower())
+    if codec is None:
+        return path, None
+    return root, codec
+
+
+def open_compressed(path: Union[str, os.PathLike], mode: str = "r") -> IO[str]:
+    """Open a text file, compressing or decompressing by its suffix.
+
+    ``.gz``, ``.bz2`` and ``.xz`` use the standard library. ``.zst``
+    uses ``compression.zstd`` (Python 3.14+) or the optional
+    ``zstandard`` package. Other paths are opened as plain text.
+
+    Args:
+        path: File path
+        mode: "r", "w", "a" or "x" (text mode is implied)
+
+    Returns:
+        Text file object (UTF-8)
+
+    Raises:
+        ImportError: For ``.zst`` files when no zstd implementation is installed
+    """
+    mode = mode.replace("t", "") + "t"
+    _, codec = split_compression(path)
+    if codec is None:
+        return open(path, mode, encoding="utf-8")
+    if codec == "gzip":
+        import gzip
+        return gzip.open(path, mode, encoding="utf-8")
+    if codec == "bz2":
+        import bz2
+        return bz2.open(path, mode, encoding="utf-8")
+    if codec == "xz":
+        import lzma
+        return lzma.open(path, mode, encoding="utf-8")
+
+    try:
+        from compression import zstd
+    except ImportError:
+        try:
+            import zstandard as zstd
+        except ImportError:
+            raise ImportError(
+                "Reading or writing .zst files requires Python 3.14+ or the 'zstandard' package"
+            ) from None
+    return zstd.open(path, mode, encoding="utf-8")
+
+
+def dump_toon(
+    data: Union[dict, list],
+    fp: IO[str],
+    indent: int = 2,
+    compact: bool = False,
+    indent_char: str = " ",
+    key_aliases: Optional[bool] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+    fidelity: bool = False,
+) -> None:
+    """Write ``data`` as TOON to a text file in chunks.
+
+    Output is identical to ``json_to_toon`` with the same options, but
+    only a few thousand lines are held in memory at a time, so it can be
+    written straight into a compressed stream.
+
+    Args:
+        data: JSON data (dict or list)
+        fp: Writable text file object
+        indent: Number of spaces for indentation
+        compact: Use the compact profile
+        indent_char: Character used for indentation (" " or "\\t")
+        key_aliases: Emit a "@key" header; defaults to ``compact``
+        default: Hook for objects the encoder cannot convert itself
+        fidelity: Quote strings that would not parse back unchanged
+    """
+    if not isinstance(data, (dict, list)):
+        data = to_container(data, default)
+    if not isinstance(data, (dict, list)) or not data:
+        fp.write(json_to_toon(data, indent, compact, indent_char, key_aliases, default=default, fidelity=fidelity))
+        return
+
+    if compact:
+        indent = 1
+    if key_aliases is None:
+        key_aliases = compact
+    aliases = _build_key_aliases(data, default) if key_aliases else {}
+    for chunk in _iter_toon_chunks(data, indent, indent_char, aliases, CHUNK_LINES, default, fidelity):
+        fp.write(chunk)
+
+
+def load_toon(fp: IO[str], into: Any = None) -> Any:
+    """Parse TOON from a text file, reading it line by line.
+
+    Equivalent to ``toon_to_json(fp.read(), into=into)`` without holding
+    the whole text in memory.
+
+    Args:
+        fp: Readable text file object
+        into: Optional type to decode into (see ``toon_to_json``)
+
+    Returns:
+        Parsed JSON data, or an instance of ``into``
+    """
+    aliases: Dict[str, str] = {}
+    if into is not None:
+        from .typed import decode_lines
+        return decode_lines(_numbered_lines(fp, aliases), aliases, into)
+    # The header is read lazily, so the alias table doubles as the key table
+    return _parse_lines(_content_lines(fp, aliases), aliases, aliases)
+
+
+def _content_lines(fp: IO[str], aliases: Dict[str, str]) -> Iterator[str]:
+    """Yield non-blank lines, collecting the "@key" header into ``aliases``."""
+    return map(itemgetter(1), _numbered_lines(fp, aliases))
+
@@ -0,0 +1,319 @@
+"""Decode TOON straight into typed objects.
+
+``toon_to_json(src, into=Model)`` parses with a decoder compiled once
+per type from its type hints. Objects are built as their indentation
+blocks close, so no intermediate dicts are kept, and each scalar is
+converted by its declared field type rather than by ``_parse_value``'s
+guessing: a ``str`` field keeps "007" and "true" as text.
+
+Supported types: dataclasses, NamedTuples, ``str``, ``int``, ``float``,
+``bool``, ``Any``, ``Optional[T]``, ``List[T]``/``Sequence[T]``,
+``Tuple[T, ...]``, ``Set[T]``, ``FrozenSet[T]`` and ``Dict[str, T]``.
+Other unions decode like ``Any``.
+"""
+
+import collections.abc
+import threading
+import types
+import typing
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .core import _container_type_of, _parse_value, _split_key_value, _unquote
+from .exceptions import TOONParseError
+
+_OBJECT = "object"
+_LIST = "list"
+_SCALAR = "scalar"
+
+_NONE_TYPE = type(None)
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
+_LIST_ORIGINS = {
+    list: list,
+    tuple: tuple,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Iterable: list,
+    collections.abc.Set: frozenset,
+    collections.abc.MutableSet: set,
+}
+_DICT_ORIGINS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+_BOOLEANS = {"true": True, "false": False}
+_MISSING = object()
+
+# Compiled decoders by type hint; only complete decoders are published
+_DECODERS: Dict[Any, "_Decoder"] = {}
+# Decoders of the compile in progress, published when it succeeds. Models
+# are added before their fields compile, so recursive models resolve
+_PENDING: Optional[Dict[Any, "_Decoder"]] = None
+_COMPILE_LOCK = threading.RLock()
+
+
+class _Decoder:
+    """How to build one type from TOON lines."""
+
+    __slots__ = ("kind", "name", "convert", "build", "fields", "item", "optional", "empty")
+
+    def __init__(self, kind, name, convert=None, build=None, fields=None, item=None):
+        self.kind = kind
+        self.name = name
+        # Scalar text -> value; raises ValueError or KeyError on bad input
+        self.convert = convert
+        # Finished dict/list -> value (objects and lists only)
+        self.build = build
+        # Field name -> decoder; None accepts any key with ``item``
+        self.fields = fields
+        # Decoder for list items and dict values
+        self.item = item
+        self.optional = False
+        # Value of a key with neither a value nor a nested block
+        self.empty = _MISSING
+
+    def field(self, key: str) -> "_Decoder":
+        if self.fields is None:
+            return self.item
+        return self.fields.get(key, _ANY)
+
+    def accepts(self, key: str) -> bool:
+        return self.fields is None or key in self.fields
+
+
+class _Frame:
+    """Open container on the typed parser stack."""
+
+    __slots__ = ("decoder", "container", "indent", "key", "line_number")
+
+    def __init__(self, decoder, indent, key, line_number):
+        self.decoder = decoder
+        self.container = {} if decoder.kind is _OBJECT else []
+        self.indent = indent
+        self.key = key
+        self.line_number = line_number
+
+
+_ANY = _Decoder(_SCALAR, "Any", _parse_value)
+_ANY.optional = True
+_ANY.empty = None
+_ANY_OBJECT = _Decoder(_OBJECT, "dict", build=dict, item=_ANY)
+_ANY_LIST = _Decoder(_LIST, "list", build=list, item=_ANY)
+
+
+def decode_lines(lines: Iterable[Tuple[int, str]], aliases: Dict[str, str], into: Any) -> Any:
+    """Parse ``(line number, line)`` pairs of non-empty TOON lines into ``into``.
+
+    Line numbers are reported in errors, so they should be the
+    document's own (see ``core._numbered_lines``).
+
+    Raises:
+        TypeError: If ``into`` is not a supported container type
+        TOONParseError: If the document does not match ``into``
+    """
+    decoder = compile_decoder(into)
+    if decoder.kind is _SCALAR:
+        raise TypeError(f"Cannot decode a document into {decoder.name}")
+    root = _Frame(decoder, -1, None, 1)
+    stack = [root]
+
+    lines = iter(lines)
+    next_pair = next(lines, None)
+    while next_pair is not None:
+        line_number, line = next_pair
+        next_pair = next(lines, None)
+        next_line = None if next_pair is None else next_pair[1]
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+
+        while len(stack) > 1 and indent <= stack[-1].indent:
+            _close(stack.pop(), stack[-1])
+
+        frame = stack[-1]
+        decoder = frame.decoder
+
+        if decoder.kind is _LIST:
+            item = decoder.item
+            if stripped == "-":
+                if item.kind is not _OBJECT:
+                    item = _expect_block(item, dict, line_number)
+                stack.append(_Frame(item, indent, None, line_number))
+            else:
+                # Scalar items are taken whole, even if they contain ":"
+                frame.container.append(_convert(item, stripped, line_number))
+            continue
+
+        key, value_str, has_colon = _split_key_value(stripped)
+        if not has_colon:
+            raise TOONParseError(f"Expected 'key: value' in {decoder.name}", line_number)
+        if aliases:
+            key = aliases.get(key, key)
+        child = decoder.field(key)
+
+        if value_str:
+            value = _convert(child, value_str, line_number)
+        else:
+            next_type = _container_type_of(next_line, indent)
+            if next_type is not None:
+                if child.kind is _SCALAR or (child.kind is _OBJECT and next_type is list):
+                    child = _expect_block(child, next_type, line_number)
+                stack.append(_Frame(child, indent, key, line_number))
+                continue
+            value = child.empty
+            if value is _MISSING:
+                raise TOONParseError(f"Missing value for {key!r}, expected {child.name}", line_number)
+        if decoder.accepts(key):
+            frame.container[key] = value
+
+    while len(stack) > 1:
+        _close(stack.pop(), stack[-1])
+    return _build(root)
+
+
+def compile_decoder(hint: Any) -> _Decoder:
+    """Return the cached decoder for a type hint, compiling it on first use."""
+    global _PENDING
+    try:
+        return _DECODERS[hint]
+    except KeyError:
+        cacheable = True
+    except TypeError:
+        # Unhashable hint
+        cacheable = False
+    with _COMPILE_LOCK:
+        if _PENDING is not None:
+            # Nested in another compile: its pending decoders are ours
+            if cacheable and hint in _PENDING:
+                return _PENDING[hint]
+            decoder = _compile(hint)
+            if cacheable:
+                _PENDING[hint] = decoder
+            return decoder
+        if cacheable and hint in _DECODERS:
+            return _DECODERS[hint]
+        _PENDING = {}
+        try:
+            decoder = _compile(hint)
+            if cacheable:
+                _PENDING[hint] = decoder
+            # A failed compile publishes nothing, not even partial models
+            _DECODERS.update(_PENDING)
+        finally:
+            _PENDING = None
+    return decoder
+
+
+def _compile(hint: Any) -> _Decoder:
+    if hint is Any or hint is object:
+        return _ANY
+    if hint is str:
+        return _scalar("str", str, empty="")
+    if hint is bool:
+        return _scalar("bool", _BOOLEANS.__getitem__)
+    if hint is int:
+        return _scalar("int", int)
+    if hint is float:
+        return _scalar("float", float)
+    if hint is dict:
+        return _ANY_OBJECT
+    if hint is list:
+        return _ANY_LIST
+
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+    if origin in _UNION_TYPES:
+        members = [arg for arg in args if arg is not _NONE_TYPE]
+        if len(members) != 1:
+            return _ANY
+        inner = compile_decoder(members[0])
+        if len(members) == len(args):
+            return inner
+        decoder = _Decoder(inner.kind, f"Optional[{inner.name}]", inner.convert, inner.build, inner.fields, inner.item)
+        decoder.optional = True
+        decoder.empty = None
+        return decoder
+    if origin in _LIST_ORIGINS:
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            raise TypeError(f"Only variable-length tuples can be decoded, not {hint!r}")
+        item = compile_decoder(args[0]) if args else _ANY
+        return _container(_LIST, f"{origin.__name__}[{item.name}]", _LIST_ORIGINS[origin], item=item)
+    if origin in _DICT_ORIGINS:
+        if args and args[0] is not str:
+            raise TypeError(f"Dictionary keys must be str, not {args[0]!r}")
+        item = compile_decoder(args[1]) if args else _ANY
+        return _container(_OBJECT, f"dict[str, {item.name}]", dict, item=item)
+
+    if isinstance(hint, type):
+        if hasattr(hint, "__dataclass_fields__"):
+            from dataclasses import fields
+            names = [field.name for field in fields(hint) if field.init]
+            return _model(hint, names)
+        if issubclass(hint, tuple) and hasattr(hint, "_fields"):
+            return _model(hint, list(hint._fields))
+    raise TypeError(f"Cannot decode TOON into {hint!r}")
+
+
+def _scalar(name: str, convert: Callable[[str], Any], empty: Any = _MISSING) -> _Decoder:
+    decoder = _Decoder(_SCALAR, name, convert)
+    decoder.empty = empty
+    return decoder
+
+
+def _container(kind: str, name: str, build: Callable, fields=None, item=None) -> _Decoder:
+    empty_text = "{}" if kind is _OBJECT else "[]"
+
+    def convert(raw: str) -> Any:
+        if raw != empty_text:
+            raise ValueError(raw)
+        return build({} if kind is _OBJECT else [])
+
+    return _Decoder(kind, name, convert, build, fields, item)
+
+
+def _model(cls: type, names: list) -> _Decoder:
+    def build(values: dict) -> Any:
+        return cls(**values)
+
+    decoder = _container(_OBJECT, cls.__name__, build, fields={})
+    # Pending before the fields compile, so recursive models resolve to it
+    _PENDING[cls] = decoder
+    hints = typing.get_type_hints(cls)
+    for name in names:
+        decoder.fields[name] = compile_decoder(hints.get(name, Any))
+    return decoder
+
+
+def _convert(decoder: _Decoder, raw: str, line_number: int) -> Any:
+    if raw[0] == '"' and len(raw) > 1 and raw[-1] == '"':
+        # Quoted text is a string for Any and raw input for typed fields
+        raw = _unquote(raw)
+        if decoder is _ANY:
+            return raw
+    elif raw == "null" and decoder.optional:
+        return None
+    try:
+        return decoder.convert(raw)
+    except (ValueError, KeyError):
+        raise TOONParseError(f"Expected {decoder.name}, got {raw!r}", line_number) from None
+
+
+def _expect_block(decoder: _Decoder, block_type: type, line_number: int) -> _Decoder:
+    """Decoder for a nested block, which must match ``decoder`` unless it is Any."""
+    if decoder is not _ANY:
+        found = "an object" if block_type is dict else "a list"
+        raise TOONParseError(f"Expected {decoder.name}, found {found}", line_number)
+    return _ANY_OBJECT if block_type is dict else _ANY_LIST
+
+
+def _build(frame: _Frame) -> Any:
+    try:
+        return frame.decoder.build(frame.container)
+    except TypeError as exc:
+        raise TOONParseError(f"Cannot build {frame.decoder.name}: {exc}", frame.line_number) from None
+
+
+def _close(frame: _Frame, parent: _Frame) -> None:
+    """Build a finished container and store it in its parent."""
+    value = _build(frame)
+    if frame.key is None:
+        parent.container.append(value)
+    elif parent.decoder.accepts(frame.key):
+        parent.container[frame.key] = value
@@ -2,6 +2,8 @@
 
 import json
 from typing import Tuple
+from .core import KEY_ALIAS_PREFIX, _split_key_value
+from .deepjson import loads
 from .exceptions import JSONValidationError, TOONValidationError
 
 
@@ -15,7 +17,7 @@ def validate_json(data: str) -> Tuple[bool, str]:
         Tuple of (is_valid, error_message)
     """
     try:
-        json.loads(data)
+        loads(data)
         return True, ""
     except json.JSONDecodeError as e:
         return False, f"Invalid JSON at line {e.lineno}, column {e.colno}: {e.msg}"
@@ -23,11 +25,12 @@ def validate_json(data: str) -> Tuple[bool, str]:
         return False, f"JSON validation error: {str(e)}"
 
 
-def validate_toon(data: str) -> Tuple[bool, str]:
+def validate_toon(data: str, indent: int = 2) -> Tuple[bool, str]:
     """Validate TOON string.
     
     Args:
         data: TOON string to validate
+        indent: Expected indentation width (1 for compact output)
         
     Returns:
         Tuple of (is_valid, error_message)
@@ -39,38 +42,54 @@ def validate_toon(data: str) -> Tuple[bool, str]:
         lines = data.strip().split("\n")
         
         prev_indent = 0
+        # Indentation of every open block; each dedent must return to one
         indent_stack = [0]
+        # Whether the previous line can own an indented block
+        prev_opens = False
         
         for line_num, line in enumerate(lines, 1):
             if not line.strip():
                 continue
             
-            indent = len(line) - len(line.lstrip())
+            # Key alias header written by compact mode
+            if line.startswith(KEY_ALIAS_PREFIX):
+                continue
+            
+            line_indent = len(line) - len(line.lstrip())
             
-            # Check indent is multiple of 2
-            if indent % 2 != 0:
-                return False, f"Line {line_num}: Invalid indentation (must be multiple of 2 spaces)"
+            # Check indent is multiple of the indentation width
+            if line_indent % indent != 0:
+                return False, (
+                    f"Line {line_num}: Invalid indentation "
+                    f"(must be multiple of {indent} spaces)"
+                )
             
             # Check indent doesn't jump more than one level
-            if indent > prev_indent and indent - prev_indent > 2:
+            if line_indent > prev_indent and line_indent - prev_indent > indent:
                 return False, f"Line {line_num}: Indentation jumps more than one level"
             
             # Update indent stack
-            while indent_stack and indent < indent_stack[-1]:
-                indent_stack.pop()
+            if line_indent > prev_indent:
+                if not prev_opens:
+                    return False, f"Line {line_num}: Unexpected indentation under a value"
+                indent_stack.append(line_indent)
+            else:
+                while line_indent < indent_stack[-1]:
+                    indent_stack.pop()
+                if line_indent != indent_stack[-1]:
+                    return False, f"Line {line_num}: Dedent does not match any outer level"
             
-            if indent > prev_indent:
-                indent_stack.append(indent)
-            
-            prev_indent = indent
+            prev_indent = line_indent
             
             stripped = line.strip()
+            key, value, has_colon = _split_key_value(stripped)
+            
+            # Check for valid key-value format; a quoted empty key ("") is fine
+            if has_colon and (key is None or stripped[0] == ":"):
+                return False, f"Line {line_num}: Empty key before colon"
             
-            # Check for valid key-value format
-            if ":" in stripped:
-                key, _, value = stripped.partition(":")
-                if not key.strip():
-                    return False, f"Line {line_num}: Empty key before colon"
+            # Only "-" and "key:" without a value open a block
+            prev_opens = stripped == "-" or (has_colon and not value)
         
         return True, ""
         
@@ -0,0 +1 @@
+"""Golden TOON corpus and its conformance harness."""
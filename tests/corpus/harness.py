@@ -0,0 +1,253 @@
+"""Conformance and timing harness for the golden TOON corpus.
+
+Each corpus version lives in its own directory (``v1``, ...) with a
+``manifest.json`` listing cases: a JSON input, the ``json_to_toon``
+options, and the golden TOON output produced by the reference encoder.
+Files ending in ``.gz`` are gzip-compressed. Goldens are compared as
+bytes (UTF-8, no trailing newline), so they can be checked by
+implementations in any language.
+
+    python -m tests.corpus.harness                    # check every encoder/decoder, print timings
+    python -m tests.corpus.harness -e Encoder --json timings.json
+    python -m tests.corpus.harness --version v2 --update   # rewrite goldens of a copy
+
+Goldens only change on purpose: after an intended output change,
+regenerate them into a new version directory so older versions stay
+comparable.
+"""
+
+import argparse
+import gzip
+import io
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from toon_converter import Decoder, Encoder, columns_to_toon, dump_toon, json_to_toon, load_toon, toon_to_json
+from toon_converter.deepjson import loads
+
+CORPUS_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_VERSION = "v1"
+
+
+def _stream_encode(data: Any, **options: Any) -> str:
+    out = io.StringIO()
+    dump_toon(data, out, **options)
+    return out.getvalue()
+
+
+def _codec_encode(data: Any, **options: Any) -> str:
+    # Encoder keeps caches between calls, so reuse one per option set
+    key = tuple(sorted(options.items()))
+    encoder = _ENCODERS.get(key)
+    if encoder is None:
+        encoder = _ENCODERS[key] = Encoder(**options)
+    return encoder.encode(data)
+
+
+def _columnar_encode(data: Any, indent: int = 2, indent_char: str = " ", **options: Any) -> Optional[str]:
+    # Only records with the same fields, alone under one key (or at the top level)
+    if options:
+        return None
+    if isinstance(data, dict) and len(data) == 1:
+        (key, records), = data.items()
+    else:
+        key, records = None, data
+    if not isinstance(records, list) or not records or not all(isinstance(r, dict) and r for r in records):
+        return None
+    names = list(records[0])
+    if any(list(record) != names for record in records):
+        return None
+    columns = {name: [record[name] for record in records] for name in names}
+    return columns_to_toon(columns, key=key, indent=indent, indent_char=indent_char)
+
+
+_ENCODERS: Dict[tuple, Encoder] = {}
+_DECODER = Decoder()
+
+# Implementations checked against the goldens; alternative fast paths go here.
+# An encoder returns None for cases it cannot encode.
+ENCODERS: Dict[str, Callable[..., str]] = {
+    "json_to_toon": json_to_toon,
+    "dump_toon": _stream_encode,
+    "Encoder": _codec_encode,
+    "columns_to_toon": _columnar_encode,
+}
+DECODERS: Dict[str, Callable[[str], Any]] = {
+    "toon_to_json": toon_to_json,
+    "load_toon": lambda text: load_toon(io.StringIO(text)),
+    "Decoder": _DECODER.decode,
+}
+
+
+def read_bytes(path: str) -> bytes:
+    """Read a corpus file, decompressing ``.gz`` files."""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        return f.read()
+
+
+def write_bytes(path: str, data: bytes) -> None:
+    """Write a corpus file; gzip output has no timestamp, so it is reproducible."""
+    if path.endswith(".gz"):
+        with open(path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0, filename="") as f:
+            f.write(data)
+    else:
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+def load_cases(version: str = CORPUS_VERSION) -> List[dict]:
+    """Cases of a corpus version, with ``input``/``output`` as absolute paths."""
+    directory = os.path.join(CORPUS_DIR, version)
+    with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    cases = []
+    for case in manifest["cases"]:
+        case = dict(case)
+        case["input"] = os.path.join(directory, case["input"])
+        case["output"] = os.path.join(directory, case["output"])
+        case.setdefault("options", {})
+        case.setdefault("round_trip", True)
+        cases.append(case)
+    return cases
+
+
+def run_case(
+    case: dict,
+    encoder: str = "json_to_toon",
+    decoder: str = "toon_to_json",
+    repeat: int = 1,
+) -> dict:
+    """Encode and decode one case, checking it against its golden output.
+
+    Returns:
+        Result record: case and implementation names, ``encode_s`` and
+        ``decode_s`` (best of ``repeat`` runs), input and output sizes,
+        ``match`` (byte-exact encoder output, or None when the encoder
+        does not apply to the case) and ``round_trip`` (decoded
+        golden equals the input, or None when the case is lossy by design)
+    """
+    data = loads(read_bytes(case["input"]))
+    golden = read_bytes(case["output"])
+    encode = ENCODERS[encoder]
+    decode = DECODERS[decoder]
+
+    encode_s = decode_s = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = encode(data, **case["options"])
+        encode_s = min(encode_s, time.perf_counter() - start)
+    text = golden.decode("utf-8")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decoded = decode(text)
+        decode_s = min(decode_s, time.perf_counter() - start)
+
+    return {
+        "case": case["name"],
+        "encoder": encoder,
+        "decoder": decoder,
+        "encode_s": encode_s,
+        "decode_s": decode_s,
+        "input_bytes": len(read_bytes(case["input"])),
+        "output_bytes": len(golden),
+        "match": None if output is None else output.encode("utf-8") == golden,
+        "round_trip": decoded == data if case["round_trip"] else None,
+    }
+
+
+def update_goldens(version: str = CORPUS_VERSION) -> None:
+    """Rewrite every golden output with the reference encoder."""
+    for case in load_cases(version):
+        data = loads(read_bytes(case["input"]))
+        write_bytes(case["output"], json_to_toon(data, **case["options"]).encode("utf-8"))
+
+
+def generate_inputs(version: str = CORPUS_VERSION) -> None:
+    """Rebuild the large generated inputs (seeded, so the files are stable)."""
+    directory = os.path.join(CORPUS_DIR, version)
+    for name, data in _generated().items():
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        write_bytes(os.path.join(directory, name), text.encode("utf-8"))
+
+
+def _generated() -> Dict[str, Any]:
+    rng = random.Random(20240501)
+    cities = ["London", "Paris", "Tōkyō", "São Paulo", "New York", "Zürich"]
+    tags = ["admin", "beta", "staff", "trial", "vip"]
+    records = [
+        {
+            "id": i,
+            "name": f"user{i}",
+            "email": f"user{i}@example.com",
+            "active": rng.random() < 0.8,
+            "score": round(rng.uniform(0, 100), 2),
+            "balance": rng.randint(-10 ** 6, 10 ** 9),
+            "ratio": rng.choice([None, round(rng.random(), 4), 1.5e-07]),
+            "tags": rng.sample(tags, rng.randint(0, 3)),
+            "address": {"city": rng.choice(cities), "street": f"{rng.randint(1, 999)} Main St"},
+            "note": rng.choice(["n/a", "line one\nline two", " padded ", "see: docs", 'say "hi"']),
+        }
+        for i in range(5000)
+    ]
+    deep: Any = {"leaf": True}
+    for level in range(300):
+        deep = {f"level{level}": deep} if level % 3 else {"items": [deep, level]}
+    wide = {f"k{i:05d}": rng.choice([i, -i * 0.5, f"v{i}", True, None, [i, i + 1]]) for i in range(5000)}
+    return {
+        "large_records.json.gz": {"records": records},
+        "deep.json.gz": deep,
+        "wide.json.gz": wide,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Check encoders and decoders against the golden TOON corpus")
+    parser.add_argument("--version", default=CORPUS_VERSION, help=f"Corpus version (default: {CORPUS_VERSION})")
+    parser.add_argument("-e", "--encoder", action="append", choices=sorted(ENCODERS),
+                        help="Encoder to check (repeatable; default: all)")
+    parser.add_argument("-d", "--decoder", action="append", choices=sorted(DECODERS),
+                        help="Decoder to check (repeatable; default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case, best is kept (default: 3)")
+    parser.add_argument("--json", help="Write result records to this file")
+    parser.add_argument("--generate", action="store_true", help="Rebuild the generated inputs")
+    parser.add_argument("--update", action="store_true", help="Rewrite goldens with the reference encoder")
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        generate_inputs(args.version)
+    if args.update:
+        update_goldens(args.version)
+    if args.generate or args.update:
+        return 0
+
+    encoders = args.encoder or sorted(ENCODERS)
+    decoders = args.decoder or sorted(DECODERS)
+    results = []
+    failed = False
+    print(f"{'case':<28} {'encoder':<16} {'decoder':<13} {'encode s':>9} {'decode s':>9}  result")
+    for case in load_cases(args.version):
+        for encoder, decoder in itertools.product(encoders, decoders):
+            result = run_case(case, encoder, decoder, args.repeat)
+            results.append(result)
+            ok = result["match"] is not False and result["round_trip"] is not False
+            failed |= not ok
+            if not ok:
+                status = "output differs" if result["match"] is False else "round trip differs"
+            else:
+                status = "ok" if result["match"] else "n/a"
+            print(f"{result['case']:<28} {encoder:<16} {decoder:<13} "
+                  f"{result['encode_s']:>9.4f} {result['decode_s']:>9.4f}  {status}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Tests for asyncio stream conversion.
+
+Set TOON_STRESS=1 to also assert how long the event loop is blocked.
+"""
+
+import asyncio
+import os
+import socket
+import time
+
+from toon_converter import adecode, aencode, json_to_toon, toon_to_json
+from toon_converter import aio
+
+DATA = {
+    "users": [{"id": i, "name": f"user {i}", "tags": ["a", "b: c"], "note": "multi\nline"} for i in range(3000)],
+    "meta": {"count": 3000, "empty": {}, "nested": {"deep": [1, 2, 3]}},
+}
+
+
+class BufferWriter:
+    """Minimal StreamWriter stand-in that keeps what is written."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(data)
+
+    async def drain(self):
+        pass
+
+
+async def _decode(data, block=None):
+    """Decode ``data`` fed to a StreamReader in blocks of ``block`` bytes."""
+    block = block or max(len(data), 1)
+    reader = asyncio.StreamReader()
+    for start in range(0, len(data), block):
+        reader.feed_data(data[start:start + block])
+    reader.feed_eof()
+    saved, aio.AIO_READ_SIZE = aio.AIO_READ_SIZE, block
+    try:
+        return await adecode(reader)
+    finally:
+        aio.AIO_READ_SIZE = saved
+
+
+def test_round_trip_over_socket():
+    """Test encoding into a real socket stream and decoding from it"""
+    async def run():
+        left, right = socket.socketpair()
+        _, writer = await asyncio.open_connection(sock=left)
+        reader, _ = await asyncio.open_connection(sock=right)
+
+        async def send():
+            await aencode(DATA, writer, compact=True)
+            writer.close()
+
+        _, decoded = await asyncio.gather(send(), adecode(reader))
+        return decoded
+
+    assert asyncio.run(run()) == DATA
+
+
+def test_output_matches_sync_functions():
+    """Test aencode/adecode agree with json_to_toon/toon_to_json"""
+    for options in ({}, {"compact": True}, {"fidelity": True}):
+        writer = BufferWriter()
+        asyncio.run(aencode(DATA, writer, **options))
+        text = b"".join(writer.parts).decode("utf-8")
+        assert text == json_to_toon(DATA, **options)
+
+    text = json_to_toon(DATA, compact=True).encode("utf-8")
+    # Block boundaries inside lines and inside multi-byte characters
+    for block in (7, 4096):
+        decoded = asyncio.run(_decode(text + "\nключ: é".encode("utf-8"), block))
+        assert decoded == toon_to_json(text.decode("utf-8") + "\nключ: é")
+
+
+def test_small_and_empty_inputs():
+    """Test scalars, empty documents and single lines"""
+    writer = BufferWriter()
+    asyncio.run(aencode({}, writer))
+    assert b"".join(writer.parts) == json_to_toon({}).encode()
+    assert asyncio.run(_decode(b"")) == {}
+    assert asyncio.run(_decode(b"a:\n  b: 1")) == {"a": {"b": 1}}
+
+
+def test_conversions_interleave_with_other_tasks():
+    """Test the event loop keeps running while large documents convert"""
+    big = {"rows": [{"id": i, "name": f"row {i}", "values": [i, i + 1]} for i in range(40000)]}
+    text = json_to_toon(big).encode("utf-8")
+
+    async def run():
+        gaps = []
+        done = asyncio.Event()
+
+        async def ticker():
+            last = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(0)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        async def convert():
+            start = time.perf_counter()
+            await aencode(big, BufferWriter())
+            decoded = await _decode(text, aio.AIO_READ_SIZE)
+            done.set()
+            return decoded, time.perf_counter() - start
+
+        (decoded, elapsed), _ = await asyncio.gather(convert(), ticker())
+        return decoded, elapsed, gaps
+
+    decoded, elapsed, gaps = asyncio.run(run())
+    assert decoded == big
+    # Hundreds of turns for the other task, one or more per chunk or block
+    assert len(gaps) > 100
+    if os.environ.get("TOON_STRESS"):
+        # None longer than a small slice (wall-clock, so opt-in)
+        assert max(gaps) < elapsed / 10
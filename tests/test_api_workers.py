@@ -0,0 +1,171 @@
+"""Tests for the API conversion pool and request limits."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api.limits import RequestLimitMiddleware
+from api.workers import ConversionPool, PoolSaturated, convert_json_to_toon, convert_toon_to_json
+
+
+def test_process_pool_converts():
+    """Test conversions run in worker processes"""
+    pool = ConversionPool(workers=2)
+    try:
+        async def run():
+            return await asyncio.gather(
+                pool.run(convert_json_to_toon, {"a": [1, 2]}, 2),
+                pool.run(convert_toon_to_json, "a: 1"),
+            )
+        toon, data = asyncio.run(run())
+    finally:
+        pool.shutdown()
+    assert toon == "a:\n  1\n  2"
+    assert json.loads(data) == {"a": 1}
+
+
+def test_inline_pool():
+    """Test workers=0 converts on the event loop"""
+    pool = ConversionPool(workers=0)
+    assert asyncio.run(pool.run(convert_json_to_toon, {"a": 1}, 2)) == "a: 1"
+    assert pool.pending == 0
+
+
+def test_saturated_pool_rejects():
+    """Test requests beyond the queue depth raise PoolSaturated"""
+    release = threading.Event()
+    executor = ThreadPoolExecutor(1)
+    pool = ConversionPool(workers=1, queue_depth=2, executor=executor)
+
+    async def run():
+        running = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(PoolSaturated) as info:
+            await pool.run(release.wait)
+        assert info.value.retry_after >= 1
+        release.set()
+        await asyncio.gather(*running)
+        # Capacity is back once the queue drains
+        assert await pool.run(len, "ab") == 2
+
+    try:
+        asyncio.run(run())
+    finally:
+        executor.shutdown()
+    assert pool.pending == 0
+
+
+def _request(app, headers, chunks):
+    """Send a request through an ASGI app; return (status, body)."""
+    sent = []
+    messages = [{"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+                for i, chunk in enumerate(chunks)]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": headers}
+    asyncio.run(app(scope, receive, send))
+    return sent[0]["status"], b"".join(m.get("body", b"") for m in sent[1:])
+
+
+async def _echo(scope, receive, send):
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+def test_body_limit_by_content_length():
+    """Test declared oversized bodies are rejected before reading"""
+    app = RequestLimitMiddleware(_echo, max_bytes=10)
+    status, body = _request(app, [(b"content-length", b"11")], [b"x" * 11])
+    assert status == 413
+    assert "10 bytes" in json.loads(body)["detail"]["error"]
+
+
+def test_body_limit_streamed():
+    """Test undeclared bodies are cut off once they exceed the limit"""
+    app = RequestLimitMiddleware(_echo, max_bytes=10)
+    assert _request(app, [], [b"x" * 6, b"x" * 6])[0] == 413
+    assert _request(app, [], [b"x" * 5, b"x" * 5]) == (200, b"x" * 10)
+
+
+def test_json_shape_limits():
+    """Test deep or large JSON bodies are rejected while streaming"""
+    app = RequestLimitMiddleware(_echo, max_bytes=1000, max_depth=3, max_nodes=10)
+    headers = [(b"content-type", b"application/json")]
+    assert _request(app, headers, [b'{"data": [[', b'1]]}'])[0] == 200
+    status, body = _request(app, headers, [b'{"data": [[[', b'1]]]}'])
+    assert status == 422
+    assert "max_depth" in json.loads(body)["detail"]["error"]
+    assert _request(app, headers, [b"[" + b"1," * 20 + b"1]"])[0] == 422
+    # Brackets inside strings are not structure
+    assert _request(app, headers, [b'{"data": "[[[[[[\\"[["}'])[0] == 200
+
+
+def test_zero_disables_limit(monkeypatch):
+    """Test an explicit 0 disables a limit instead of reading the environment"""
+    monkeypatch.setenv("TOON_API_MAX_BODY_BYTES", "10")
+    monkeypatch.setenv("TOON_API_MAX_DEPTH", "3")
+    app = RequestLimitMiddleware(_echo, max_bytes=0, max_depth=0, max_nodes=0)
+    assert (app.max_bytes, app.max_depth, app.max_nodes) == (None, None, None)
+    headers = [(b"content-type", b"application/json")]
+    body = b"[" * 20 + b"]" * 20
+    assert _request(app, headers, [body]) == (200, body)
+    assert RequestLimitMiddleware(_echo).max_bytes == 10
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """TestClient for api.app:app with small request limits and inline workers."""
+    testclient = pytest.importorskip("fastapi.testclient")
+    from api.app import app
+
+    monkeypatch.setenv("TOON_API_WORKERS", "0")
+    monkeypatch.setenv("TOON_API_MAX_BODY_BYTES", "100")
+    monkeypatch.setenv("TOON_API_MAX_DEPTH", "5")
+    # The middleware reads its limits when the stack is built
+    app.middleware_stack = None
+    try:
+        with testclient.TestClient(app) as client:
+            yield client
+    finally:
+        app.middleware_stack = None
+
+
+def test_app_body_limit(client):
+    """Test the app answers 413 for oversized bodies, declared or streamed"""
+    body = json.dumps({"data": {"text": "x" * 100}}).encode("utf-8")
+    response = client.post("/convert/json-to-toon", content=body, headers={"content-type": "application/json"})
+    assert response.status_code == 413
+
+    def chunks():
+        yield body[:60]
+        yield body[60:]
+
+    response = client.post("/convert/json-to-toon", content=chunks(), headers={"content-type": "application/json"})
+    assert response.status_code == 413
+    assert "100 bytes" in response.json()["detail"]["error"]
+
+    response = client.post("/convert/json-to-toon", json={"data": {"a": 1}})
+    assert response.status_code == 200
+    assert response.json()["result"] == "a: 1"
+
+
+def test_app_depth_limit(client):
+    """Test the app answers 422 for JSON nested past the limit"""
+    response = client.post("/convert/json-to-toon", json={"data": {"a": [[[[1]]]]}})
+    assert response.status_code == 422
+    assert "max_depth" in response.json()["detail"]["error"]
+    assert client.post("/convert/json-to-toon", json={"data": {"a": [[1]]}}).status_code == 200
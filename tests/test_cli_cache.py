@@ -0,0 +1,90 @@
+"""Tests for the CLI's on-disk conversion cache."""
+
+import gzip
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from cli.main import _cache_entries, _cache_usage, _cached_convert
+
+ROOT = Path(__file__).resolve().parent.parent
+ENV = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), str(ROOT)]))
+
+
+def _convert(tmp_path, *args):
+    result = subprocess.run([sys.executable, "-m", "cli.main", "convert", *args, "--cache-dir", "cache"],
+                            env=ENV, cwd=tmp_path, check=True, capture_output=True, text=True)
+    return result.stdout
+
+
+def test_cli_serves_unchanged_inputs_from_cache(tmp_path):
+    """Test a second conversion of the same content is a cache hit"""
+    (tmp_path / "a.json").write_text('{"a": [1, 2]}', encoding="utf-8")
+    assert "(cached)" not in _convert(tmp_path, "a.json")
+    (tmp_path / "a.toon").unlink()
+
+    assert "(cached)" in _convert(tmp_path, "a.json")
+    assert (tmp_path / "a.toon").read_text(encoding="utf-8") == "a:\n  1\n  2"
+
+    # Same content under another name hits; other content or options miss
+    (tmp_path / "b.json").write_text('{"a": [1, 2]}', encoding="utf-8")
+    assert "(cached)" in _convert(tmp_path, "b.json")
+    assert "(cached)" not in _convert(tmp_path, "a.json", "-o", "a.toon.gz")
+    with gzip.open(tmp_path / "a.toon.gz", "rt", encoding="utf-8") as f:
+        assert f.read() == "a:\n  1\n  2"
+    (tmp_path / "a.json").write_text('{"a": 3}', encoding="utf-8")
+    assert "(cached)" not in _convert(tmp_path, "a.json")
+    assert (tmp_path / "a.toon").read_text(encoding="utf-8") == "a: 3"
+
+
+def test_watch_uses_cache(tmp_path):
+    """Test a fresh output directory is filled from the cache"""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.json").write_text('{"a": 1}', encoding="utf-8")
+    for out in ("out1", "out2"):
+        result = subprocess.run(
+            [sys.executable, "-m", "cli.main", "watch", "src", "--out", out, "--once", "--cache-dir", "cache"],
+            env=ENV, cwd=tmp_path, check=True, capture_output=True, text=True,
+        )
+    assert "(cached)" in result.stdout
+    assert (tmp_path / "out2" / "a.toon").read_text(encoding="utf-8") == "a: 1"
+
+
+def test_lru_eviction(tmp_path):
+    """Test the least recently used entries go once the cache is full"""
+    cache = str(tmp_path / "cache")
+    _cache_usage.pop(cache, None)
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"{i}.json"
+        path.write_text('{"value": "%s"}' % (str(i) * 100), encoding="utf-8")
+        paths.append(path)
+
+    for path in paths[:3]:
+        assert not _cached_convert(str(path), str(tmp_path / "out.toon"), "json", cache)
+    # Make entry 0 the most recently used
+    for _, _, entry in _cache_entries(cache):
+        os.utime(entry, (time.time() - 100, time.time() - 100))
+    assert _cached_convert(str(paths[0]), str(tmp_path / "out.toon"), "json", cache)
+
+    entry_size = max(size for _, size, _ in _cache_entries(cache))
+    assert not _cached_convert(str(paths[3]), str(tmp_path / "out.toon"), "json", cache, cache_size=3 * entry_size)
+    assert len(_cache_entries(cache)) == 2
+    assert _cached_convert(str(paths[0]), str(tmp_path / "out.toon"), "json", cache)
+    assert _cached_convert(str(paths[3]), str(tmp_path / "out.toon"), "json", cache)
+    assert not _cached_convert(str(paths[1]), str(tmp_path / "out.toon"), "json", cache)
+
+
+def test_format_version_in_key(tmp_path, monkeypatch):
+    """Test entries written for another output format version are not served"""
+    import toon_converter
+
+    cache = str(tmp_path / "cache")
+    path = tmp_path / "a.json"
+    path.write_text('{"a": 1}', encoding="utf-8")
+    assert not _cached_convert(str(path), str(tmp_path / "out.toon"), "json", cache)
+    assert _cached_convert(str(path), str(tmp_path / "out.toon"), "json", cache)
+    monkeypatch.setattr(toon_converter, "FORMAT_VERSION", toon_converter.FORMAT_VERSION + 1)
+    assert not _cached_convert(str(path), str(tmp_path / "out.toon"), "json", cache)
@@ -0,0 +1,107 @@
+"""Tests for the reusable Encoder and Decoder.
+
+Set TOON_STRESS=1 to also assert the benchmark's memory savings.
+"""
+
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from toon_converter import Decoder, Encoder, json_to_toon, toon_to_json
+
+
+@dataclass
+class Item:
+    sku: str
+    qty: int
+
+
+def _doc(i):
+    return {
+        "id": i,
+        "user": {"name": f"n{i}", "email": f"e{i}@example.com", "roles": ["a", "b"]},
+        "status": "ok",
+        "items": [{"sku": f"s{j}", "qty": j, "price": 1.5 * j} for j in range(5)],
+    }
+
+
+DOCS = [_doc(i) for i in range(1000)]
+
+
+def test_encoder_matches_json_to_toon():
+    """Test Encoder output equals json_to_toon across options"""
+    samples = DOCS[:3] + [{}, [], '"text"', '{"a": [1, 2]}', {"a:b": " x", "n": "12"}, [Item("x", 1)]]
+    for options in ({}, {"indent": 4}, {"compact": True}, {"fidelity": True}, {"indent_char": "\t", "indent": 1}):
+        encoder = Encoder(**options)
+        for data in samples + samples:
+            assert encoder.encode(data) == json_to_toon(data, **options)
+
+
+def test_decoder_matches_toon_to_json():
+    """Test Decoder output equals toon_to_json, with and without aliases"""
+    decoder = Decoder()
+    for data in DOCS[:3]:
+        for compact in (False, True):
+            text = json_to_toon(data, compact=compact)
+            assert decoder.decode(text) == toon_to_json(text) == data
+    assert Decoder(into=Item).decode("sku: a\nqty: 2") == Item("a", 2)
+
+
+def test_decoder_shares_keys_between_documents():
+    """Test keys decoded from separate documents are the same objects"""
+    decoder = Decoder()
+    first, second = (decoder.decode(json_to_toon(doc)) for doc in DOCS[:2])
+    assert [key for key in first["user"]] == [key for key in second["user"]]
+    assert all(a is b for a, b in zip(first["user"], second["user"]))
+
+
+def test_shared_instances_across_threads():
+    """Test one Encoder and one Decoder used from many threads"""
+    encoder, decoder = Encoder(), Decoder()
+    expected = [json_to_toon(doc) for doc in DOCS[:200]]
+    errors = []
+
+    def work(offset):
+        for i in range(offset, 200, 8):
+            text = encoder.encode(DOCS[i])
+            if text != expected[i] or decoder.decode(text) != DOCS[i]:
+                errors.append(i)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def _measure(func, items):
+    start = time.perf_counter()
+    tracemalloc.start()
+    results = [func(item) for item in items]
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return results, time.perf_counter() - start, retained, peak
+
+
+def test_benchmark_reuse():
+    """Test reused instances give the same results, and report their cost"""
+    encoder, decoder = Encoder(), Decoder()
+    encoder.encode(DOCS[0])
+
+    texts, t_func, _, peak_func = _measure(json_to_toon, DOCS)
+    reused, t_encoder, _, peak_encoder = _measure(encoder.encode, DOCS)
+    assert reused == texts
+
+    plain, t_parse, kept_func, _ = _measure(toon_to_json, texts)
+    shared, t_decoder, kept_decoder, _ = _measure(decoder.decode, texts)
+    assert shared == plain
+
+    print()
+    print(f"json_to_toon {t_func:.3f} s peak {peak_func} B | Encoder {t_encoder:.3f} s peak {peak_encoder} B")
+    print(f"toon_to_json {t_parse:.3f} s kept {kept_func} B | Decoder {t_decoder:.3f} s kept {kept_decoder} B")
+    if os.environ.get("TOON_STRESS"):
+        # Results hold one copy of each key instead of one per document
+        assert kept_decoder < kept_func * 0.9
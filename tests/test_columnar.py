@@ -0,0 +1,153 @@
+"""Tests for columnar decoding."""
+
+from array import array
+
+import pytest
+from toon_converter import columns_to_toon, json_to_toon, toon_to_columns
+from toon_converter.exceptions import TOONParseError
+
+
+def test_numeric_and_string_columns():
+    """Test numeric fields become arrays and strings become lists."""
+    data = {"items": [{"id": i, "score": i / 2, "name": f"user{i}"} for i in range(5)]}
+    columns = toon_to_columns(json_to_toon(data), backend="array")
+    assert list(columns) == ["id", "score", "name"]
+    assert columns["id"] == array("q", range(5))
+    assert columns["score"] == array("d", [i / 2 for i in range(5)])
+    assert columns["name"] == [f"user{i}" for i in range(5)]
+
+
+def test_nested_path():
+    """Test dotted paths reach nested arrays."""
+    toon = json_to_toon({"data": {"rows": [{"x": 1}, {"x": 2}]}, "rows": "other"})
+    columns = toon_to_columns(toon, path="data.rows", backend="array")
+    assert columns == {"x": array("q", [1, 2])}
+
+
+def test_missing_fields_and_mixed_types():
+    """Test missing fields are filled with None and mixed columns demote to lists."""
+    toon = json_to_toon({"items": [{"a": 1, "b": 2}, {"a": "x"}, {"a": 3, "c": True}]})
+    columns = toon_to_columns(toon, backend="array")
+    assert columns["a"] == [1, "x", 3]
+    assert columns["b"] == [2, None, None]
+    assert columns["c"] == [None, None, True]
+
+
+def test_int_column_promotes_to_float():
+    """Test an int column widens to float when a float appears."""
+    toon = json_to_toon({"items": [{"v": 1}, {"v": 2.5}, {"v": "007"}]})
+    assert toon_to_columns(toon, backend="array")["v"] == [1.0, 2.5, "007"]
+    toon = json_to_toon({"items": [{"v": 1}, {"v": 2.5}]})
+    assert toon_to_columns(toon, backend="array")["v"] == array("d", [1.0, 2.5])
+
+
+def test_nested_field_values():
+    """Test nested fields are parsed into Python objects."""
+    toon = json_to_toon({"items": [{"id": 1, "tags": ["a", "b"], "meta": {"k": 1}}]})
+    columns = toon_to_columns(toon, backend="array")
+    assert columns["tags"] == [["a", "b"]]
+    assert columns["meta"] == [{"k": 1}]
+
+
+def test_compact_input():
+    """Test aliased keys are expanded."""
+    data = {"items": [{"customer_identifier": i} for i in range(10)]}
+    columns = toon_to_columns(json_to_toon(data, compact=True), backend="array")
+    assert columns == {"customer_identifier": array("q", range(10))}
+
+
+def test_numpy_backend():
+    """Test numeric columns become NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+    toon = json_to_toon({"items": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]})
+    columns = toon_to_columns(toon, backend="numpy")
+    assert isinstance(columns["id"], numpy.ndarray)
+    assert columns["id"].tolist() == [1, 2]
+    assert columns["name"] == ["a", "b"]
+
+
+def test_missing_path():
+    """Test a missing path raises TOONParseError."""
+    with pytest.raises(TOONParseError):
+        toon_to_columns("name: Alice", path="items")
+
+
+def test_not_records():
+    """Test an array of scalars is rejected."""
+    with pytest.raises(TOONParseError):
+        toon_to_columns(json_to_toon({"items": [1, 2, 3]}))
+
+
+def test_object_path():
+    """Test a path to an object is rejected rather than read as one record."""
+    with pytest.raises(TOONParseError, match="not an array of records"):
+        toon_to_columns(json_to_toon({"items": {"id": 1, "name": "a"}}))
+
+
+def test_empty_array():
+    """Test an inline empty array gives no columns."""
+    assert toon_to_columns("items: []", backend="array") == {}
+    assert toon_to_columns(columns_to_toon({"id": []}), backend="array") == {}
+    with pytest.raises(TOONParseError):
+        toon_to_columns("items: []", path="items.rows")
+
+
+def test_columns_to_toon_matches_encoder():
+    """Test column encoding is byte-identical to json_to_toon on records."""
+    records = [
+        {"id": i, "score": i * 1.5, "name": f"user{i}", "active": i % 2 == 0, "note": None}
+        for i in range(4)
+    ]
+    columns = {
+        "id": array("q", [r["id"] for r in records]),
+        "score": array("d", [r["score"] for r in records]),
+        "name": [r["name"] for r in records],
+        "active": [r["active"] for r in records],
+        "note": [r["note"] for r in records],
+    }
+    assert columns_to_toon(columns) == json_to_toon({"items": records})
+    assert columns_to_toon(columns, key=None, indent=4) == json_to_toon(records, indent=4)
+
+
+def test_columns_to_toon_nested_values():
+    """Test nested and empty values match the encoder."""
+    records = [
+        {"id": 1, "tags": ["a", "b"], "meta": {"k": {"deep": 1}}, "empty": {}},
+        {"id": 2, "tags": [], "meta": {"k": 2}, "empty": []},
+    ]
+    columns = {name: [r[name] for r in records] for name in records[0]}
+    assert columns_to_toon(columns, key="rows") == json_to_toon({"rows": records})
+
+
+def test_columns_to_toon_quotes_keys_like_encoder():
+    """Test field names and the key are quoted as the encoder quotes them."""
+    records = [{"@k": 1, "a:b": 2, " pad": 3, "-": 4}]
+    columns = {name: [r[name] for r in records] for name in records[0]}
+    for key in ("r", "@key a", "a:b", None):
+        expected = json_to_toon(records if key is None else {key: records})
+        assert columns_to_toon(columns, key=key) == expected
+
+
+def test_columns_round_trip():
+    """Test columns survive encode/decode."""
+    columns = {"id": array("q", [1, 2, 3]), "name": ["a", "b", "c"]}
+    assert toon_to_columns(columns_to_toon(columns), backend="array") == columns
+
+
+def test_columns_to_toon_empty():
+    """Test empty columns produce an empty array."""
+    assert columns_to_toon({"id": []}) == json_to_toon({"items": []})
+
+
+def test_columns_to_toon_length_mismatch():
+    """Test columns of different lengths are rejected."""
+    with pytest.raises(ValueError):
+        columns_to_toon({"a": [1, 2], "b": [1]})
+
+
+def test_columns_to_toon_numpy():
+    """Test NumPy columns encode like Python values."""
+    numpy = pytest.importorskip("numpy")
+    columns = {"x": numpy.arange(3), "y": numpy.array([0.5, 1.5, 2.5])}
+    expected = json_to_toon({"items": [{"x": i, "y": i + 0.5} for i in range(3)]})
+    assert columns_to_toon(columns) == expected
@@ -0,0 +1,73 @@
+"""Tests for the binary-framed TOON container."""
+
+import pytest
+
+from toon_converter import json_to_toon, pack_toon, shape_hash, toon_to_json, unpack_toon
+from toon_converter.container import CONTAINER_VERSION, read_header
+from toon_converter.exceptions import TOONParseError
+from toon_converter.lazy import LazyMapping
+
+DATA = {
+    "name": "Zoë",
+    "users": [{"id": i, "name": f"user{i}", "roles": ["admin", "dev"]} for i in range(20)],
+    "config": {"debug": True, "ratio": 0.5, "empty": {}},
+}
+
+
+def test_round_trip():
+    """Test unpacking gives the same data as toon_to_json"""
+    for options in ({}, {"compact": True}):
+        text = json_to_toon(DATA, **options)
+        assert unpack_toon(pack_toon(text)) == toon_to_json(text)
+
+
+def test_lazy_round_trip():
+    """Test the lazy view uses the stored tables"""
+    text = json_to_toon(DATA, compact=True)
+    doc = unpack_toon(pack_toon(text), lazy=True)
+    assert isinstance(doc, LazyMapping)
+    assert doc["users"][3]["name"] == "user3"
+    assert doc.to_dict() == toon_to_json(text)
+
+
+def test_body_stays_readable():
+    """Test the TOON text is stored verbatim after the tables"""
+    text = json_to_toon(DATA)
+    blob = pack_toon(text)
+    assert blob.endswith(text.encode("utf-8"))
+
+
+def test_header():
+    """Test the header is readable without the body"""
+    text = json_to_toon(DATA)
+    header = read_header(pack_toon(text))
+    assert header["version"] == CONTAINER_VERSION
+    assert header["length"] == len(text.encode("utf-8"))
+    assert header["lines"] == len(text.split("\n"))
+    assert header["shape_hash"] == shape_hash(text)
+
+
+def test_shape_hash_ignores_values():
+    """Test shape hashes change with structure, not scalar values"""
+    assert shape_hash("a: 1\nb:\n  1\n  2") == shape_hash("a: 5\nb:\n  x\n  y")
+    assert shape_hash("a: 1") != shape_hash("b: 1")
+    assert shape_hash("a:\n  1\n  2") != shape_hash("a:\n  1")
+
+
+def test_empty_document():
+    """Test packing an empty document"""
+    assert unpack_toon(pack_toon("")) == {}
+    assert unpack_toon(pack_toon(""), lazy=True).to_dict() == {}
+
+
+def test_invalid_containers():
+    """Test malformed blobs raise TOONParseError"""
+    blob = pack_toon(json_to_toon(DATA))
+    with pytest.raises(TOONParseError, match="Not a TOON container"):
+        unpack_toon(b"XXXX" + blob[4:])
+    with pytest.raises(TOONParseError, match="version"):
+        unpack_toon(blob[:4] + b"\x63\x00" + blob[6:])
+    with pytest.raises(TOONParseError):
+        unpack_toon(blob[:-1])
+    with pytest.raises(TOONParseError):
+        unpack_toon(blob[:10])
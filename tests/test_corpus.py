@@ -0,0 +1,36 @@
+"""Tests checking every encoder and decoder against the golden corpus."""
+
+import os
+
+import pytest
+
+from tests.corpus.harness import CORPUS_DIR, CORPUS_VERSION, DECODERS, ENCODERS, load_cases, run_case
+
+CASES = load_cases()
+
+
+@pytest.mark.parametrize("encoder", sorted(ENCODERS))
+@pytest.mark.parametrize("case", CASES, ids=[case["name"] for case in CASES])
+def test_encoder_matches_golden(case, encoder):
+    """Test encoder output is byte-identical to the golden file"""
+    result = run_case(case, encoder=encoder)
+    if result["match"] is None:
+        pytest.skip(f"{encoder} does not apply to this case")
+    assert result["match"], f"{encoder} output differs from {os.path.basename(case['output'])}"
+
+
+@pytest.mark.parametrize("decoder", sorted(DECODERS))
+@pytest.mark.parametrize("case", [case for case in CASES if case["round_trip"]],
+                         ids=[case["name"] for case in CASES if case["round_trip"]])
+def test_golden_round_trips(case, decoder):
+    """Test the golden file decodes back to the input"""
+    assert run_case(case, decoder=decoder)["round_trip"]
+
+
+def test_manifest_covers_corpus():
+    """Test every corpus file belongs to a case and every case has its files"""
+    directory = os.path.join(CORPUS_DIR, CORPUS_VERSION)
+    used = {"manifest.json"}
+    for case in CASES:
+        used.update(os.path.basename(case[key]) for key in ("input", "output"))
+    assert used == set(os.listdir(directory))
@@ -0,0 +1,115 @@
+"""Stress tests for deeply nested documents.
+
+Set TOON_STRESS=1 to run the benchmark at larger depths and check its scaling.
+"""
+
+import os
+import time
+import tracemalloc
+
+from toon_converter import json_to_toon, toon_to_json, validate_json, validate_toon
+from toon_converter.deepjson import dumps, loads
+
+DEEP = 100_000
+
+
+def _nested_objects(depth):
+    return '{"a":' * depth + "1" + "}" * depth
+
+
+def test_json_ingest_beyond_recursion_limit():
+    """Test JSON 100k levels deep parses and serializes"""
+    for text in (_nested_objects(DEEP), "[" * DEEP + "1" + "]" * DEEP):
+        data = loads(text)
+        assert dumps(data) == text.replace(":", ": ")
+        assert validate_json(text) == (True, "")
+
+
+def test_deep_json_errors_still_reported():
+    """Test invalid deep JSON raises JSONDecodeError, not RecursionError"""
+    text = "[" * DEEP + "1," + "]" * DEEP
+    is_valid, error = validate_json(text)
+    assert not is_valid
+    assert "Expecting value" in error
+
+
+def test_pipeline_deep_mixed():
+    """Test alternating object/array nesting round-trips exactly"""
+    # TOON indents every level, so its size grows with depth squared;
+    # a few thousand levels is as deep as a TOON document gets in practice
+    depth = 2000
+    text = '{"a":[' * depth + "1" + "]}" * depth
+    toon = json_to_toon(text, compact=True)
+    assert validate_toon(toon, indent=1) == (True, "")
+    assert dumps(toon_to_json(toon)) == dumps(loads(text))
+
+
+def test_pipeline_deep_objects():
+    """Test deeply nested objects round-trip exactly"""
+    depth = 3000
+    text = _nested_objects(depth)
+    toon = json_to_toon(text, compact=True)
+    assert validate_toon(toon, indent=1) == (True, "")
+    assert dumps(toon_to_json(toon)) == text.replace(":", ": ")
+
+
+def test_validator_rejects_children_of_values():
+    """Test the validator enforces block structure"""
+    assert validate_toon("a: 1\n  b: 2") == (False, "Line 2: Unexpected indentation under a value")
+    assert validate_toon("a:\n  1\n    2")[0] is False
+    assert validate_toon("a:\n  -\n    b: 1\n  -\n    b: 2") == (True, "")
+
+
+def _measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def test_stress_benchmark():
+    """Test time and memory grow linearly with document size as depth grows
+
+    The scaling ratios depend on wall-clock time, so they are only
+    asserted with TOON_STRESS=1; the default run checks the results.
+    """
+    if os.environ.get("TOON_STRESS"):
+        depths = (2000, 4000, 8000)
+    else:
+        depths = (500, 1000, 2000)
+
+    rows = []
+    for depth in depths:
+        text = _nested_objects(depth)
+        data, t_ingest, _ = _measure(loads, text)
+        toon, t_encode, m_encode = _measure(json_to_toon, data, 1, True)
+        valid, t_validate, m_validate = _measure(validate_toon, toon, 1)
+        back, t_decode, m_decode = _measure(toon_to_json, toon)
+        assert valid == (True, "")
+        assert dumps(back) == dumps(data)
+
+        # Output size grows with depth squared (one indent per level),
+        # so costs are normalized per byte of TOON
+        size = len(toon)
+        rows.append({
+            "depth": depth,
+            "bytes": size,
+            "seconds": t_ingest + t_encode + t_validate + t_decode,
+            "peak": max(m_encode, m_validate, m_decode),
+        })
+
+    print()
+    for row in rows:
+        print("depth {depth:>6}  toon {bytes:>10} B  {seconds:8.3f} s  peak {peak:>11} B".format(**row))
+
+    if not os.environ.get("TOON_STRESS"):
+        return
+    first, last = rows[0], rows[-1]
+    time_per_byte = (last["seconds"] / last["bytes"]) / (first["seconds"] / first["bytes"])
+    memory_per_byte = (last["peak"] / last["bytes"]) / (first["peak"] / first["bytes"])
+    # Linear work keeps the per-byte cost flat; quadratic work would grow it 4x
+    assert time_per_byte < 3, rows
+    assert memory_per_byte < 2, rows
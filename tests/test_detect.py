@@ -0,0 +1,93 @@
+"""Tests for format detection from a content sample."""
+
+import gzip
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from api.workers import convert_auto
+from toon_converter import TOONError, detect_format, json_to_toon
+from toon_converter.detect import SNIFF_SIZE, detect_file
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("sample, expected", [
+    ('{"a": 1}', "json"),
+    ('{\n  "a": [\n    {"b": 1},\n    {"b": 2}\n  ]\n}', "json"),
+    ('[\n  {"a": 1},\n  {"a": 2}\n]', "json"),
+    ('  \n[1, 2]', "json"),
+    ('42', "json"),
+    ('"text"', "json"),
+    ('null\n', "json"),
+    ('{"a": 1}\n{"a": 2}\n', "ndjson"),
+    ('[1, 2]\n[3]\n', "ndjson"),
+    ('{"a": "x"}\r\n{"a": "y"}', "ndjson"),
+    ('name: Alice\nage: 30', "toon"),
+    ('users:\n  -\n    id: 1', "toon"),
+    ('@key a=name\na: Alice', "toon"),
+    ('"a b": 1', "toon"),
+    ('"a\\"b": 1', "toon"),
+    ('\ufeffname: x', "toon"),
+    (b'{"a": 1}\n{"a": 2}', "ndjson"),
+])
+def test_detect_format(sample, expected):
+    """Test structural hints in the sample decide the format"""
+    assert detect_format(sample) == expected
+
+
+def test_truncated_sample():
+    """Test a sample cut inside a record or a character still detects"""
+    ndjson = "".join(json.dumps({"id": i, "name": "é" * 20}) + "\n" for i in range(500))
+    assert detect_format(ndjson[:SNIFF_SIZE]) == "ndjson"
+    assert detect_format(ndjson.encode("utf-8")[:SNIFF_SIZE + 1]) == "ndjson"
+    document = json.dumps([{"id": i} for i in range(500)], indent=2)
+    assert detect_format(document[:SNIFF_SIZE]) == "json"
+    toon = json_to_toon({"items": [{"id": i} for i in range(500)]})
+    assert detect_format(toon[:SNIFF_SIZE]) == "toon"
+
+
+def test_empty_input():
+    """Test empty input is rejected"""
+    with pytest.raises(TOONError):
+        detect_format(" \n")
+
+
+def test_detect_file(tmp_path):
+    """Test files are sniffed after decompression"""
+    path = tmp_path / "records.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write('{"a": 1}\n{"a": 2}\n')
+    assert detect_file(path) == "ndjson"
+
+
+def test_convert_auto_worker():
+    """Test the API worker converts by detected format"""
+    assert convert_auto('{"id": 1}\n{"id": 2}\n', 2) == ("ndjson", "-\n  id: 1\n-\n  id: 2", "toon")
+    assert convert_auto('{"a": [1, 2]}', 2) == ("json", "a:\n  1\n  2", "toon")
+    detected, result, output_format = convert_auto("a: 1", 2)
+    assert (detected, json.loads(result), output_format) == ("toon", {"a": 1}, "json")
+
+
+def test_cli_from_auto(tmp_path):
+    """Test the CLI converts extensionless files with --from auto"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), str(ROOT)]))
+    (tmp_path / "blob").write_text('{"a": 1}\n{"a": 2}\n', encoding="utf-8")
+    subprocess.run([sys.executable, "-m", "cli.main", "convert", "--from", "auto", "blob"],
+                   env=env, cwd=tmp_path, check=True, capture_output=True)
+    assert (tmp_path / "blob.toon").read_text(encoding="utf-8") == "-\n  a: 1\n-\n  a: 2"
+
+    (tmp_path / "data").write_text("a: 1", encoding="utf-8")
+    subprocess.run([sys.executable, "-m", "cli.main", "convert", "--from", "auto", "data", "-o", "out.json"],
+                   env=env, cwd=tmp_path, check=True, capture_output=True)
+    assert json.loads((tmp_path / "out.json").read_text(encoding="utf-8")) == {"a": 1}
+
+    # Without --from, an unknown extension is an error
+    result = subprocess.run([sys.executable, "-m", "cli.main", "convert", "data"],
+                            env=env, cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode != 0
+    assert "--from auto" in result.stdout + result.stderr
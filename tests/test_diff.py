@@ -0,0 +1,90 @@
+"""Tests for streaming TOON diffs."""
+
+import io
+
+from toon_converter import diff_toon, json_to_toon
+from toon_converter.diff import iter_leaves
+
+OLD = {
+    "name": "report",
+    "users": [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}],
+    "config": {"debug": False, "paths": ["/a", "/b"]},
+}
+
+
+def test_identical_documents():
+    """Test identical documents produce no records."""
+    toon = json_to_toon(OLD)
+    assert list(diff_toon(toon, toon)) == []
+
+
+def test_changed_values():
+    """Test changed scalars are reported by path."""
+    new = {
+        "name": "report",
+        "users": [{"name": "Alice", "age": 31}, {"name": "Bob", "age": 25}],
+        "config": {"debug": True, "paths": ["/a", "/b"]},
+    }
+    records = list(diff_toon(json_to_toon(OLD), json_to_toon(new)))
+    assert records == [
+        {"op": "change", "path": "/users/0/age", "old": 30, "new": 31},
+        {"op": "change", "path": "/config/debug", "old": False, "new": True},
+    ]
+
+
+def test_added_and_removed():
+    """Test added and removed leaves are reported."""
+    new = {
+        "name": "report",
+        "users": [{"name": "Alice", "age": 30}, {"name": "Bob"}],
+        "config": {"debug": False, "paths": ["/a", "/b", "/c"], "level/x": 1},
+    }
+    records = list(diff_toon(json_to_toon(OLD), json_to_toon(new)))
+    assert {"op": "remove", "path": "/users/1/age", "old": 25} in records
+    assert {"op": "add", "path": "/config/paths/2", "new": "/c"} in records
+    assert {"op": "add", "path": "/config/level~1x", "new": 1} in records
+    assert len(records) == 3
+
+
+def test_type_sensitive():
+    """Test values that render differently are changes."""
+    records = list(diff_toon("a: 1", "a: 1.0"))
+    assert records == [{"op": "change", "path": "/a", "old": 1, "new": 1.0}]
+
+
+def test_file_objects_and_compact_input():
+    """Test file objects and alias headers are streamed."""
+    data = {"items": [{"long_field_name": i} for i in range(10)]}
+    changed = {"items": [{"long_field_name": i * (i != 3)} for i in range(10)]}
+    old = io.StringIO(json_to_toon(data, compact=True))
+    new = io.StringIO(json_to_toon(changed))
+    assert list(diff_toon(old, new)) == [
+        {"op": "change", "path": "/items/3/long_field_name", "old": 3, "new": 0}
+    ]
+
+
+def test_small_window_flushes():
+    """Test leaves evicted from a full buffer are reported as add/remove."""
+    old = json_to_toon({f"k{i}": i for i in range(5)})
+    new = json_to_toon({f"j{i}": i for i in range(5)})
+    records = list(diff_toon(old, new, window=1))
+    assert sorted(r["op"] for r in records) == ["add"] * 5 + ["remove"] * 5
+
+
+def test_iter_leaves():
+    """Test leaf paths follow the document structure."""
+    toon = json_to_toon({"a": {"b": [1, {"c": None}]}, "d": "x"})
+    assert list(iter_leaves(toon)) == [
+        (("a", "b", 0), 1),
+        (("a", "b", 1, "c"), None),
+        (("d",), "x"),
+    ]
+
+
+def test_quoted_list_items():
+    """Test lists of quoted strings are walked as lists."""
+    changed = [{"op": "change", "path": "/a/1", "old": "y", "new": "z"}]
+    assert list(diff_toon(json_to_toon({"a": [" x", "y"]}), json_to_toon({"a": [" x", "z"]}))) == changed
+    old, new = ({"a": ["1", value]} for value in ("y", "z"))
+    assert list(diff_toon(json_to_toon(old, fidelity=True), json_to_toon(new, fidelity=True))) == changed
+    assert list(iter_leaves(json_to_toon({"a": ["a: b", "-"]}))) == [(("a", 0), "a: b"), (("a", 1), "-")]
@@ -181,3 +181,25 @@ def test_nested_empty_objects():
     toon = json_to_toon(data)
     # Empty objects may not round-trip perfectly
     assert "outer:" in toon
+
+
+def test_round_trip_compact():
+    """Test round-trip through the compact profile."""
+    original = {
+        "users": [
+            {"display_name": "Alice", "permissions": {"can_edit": True, "can_delete": False}},
+            {"display_name": "Bob", "permissions": {"can_edit": False, "can_delete": False}},
+            {"display_name": "Carol", "permissions": {"can_edit": True, "can_delete": True}},
+        ],
+        "settings": {"retry:count": 3},
+    }
+    toon = json_to_toon(original, compact=True)
+    assert toon.startswith("@key ")
+    assert toon_to_json(toon) == original
+
+
+def test_round_trip_tabs():
+    """Test round-trip with tab indentation."""
+    original = {"outer": {"inner": {"value": 1}}, "items": ["a", "b"]}
+    toon = json_to_toon(original, indent=1, indent_char="\t")
+    assert toon_to_json(toon) == original
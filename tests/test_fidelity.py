@@ -0,0 +1,95 @@
+"""Round-trip property tests for fidelity mode and escaped strings."""
+
+import io
+import random
+
+import pytest
+
+from toon_converter import dump_toon, json_to_toon, load_toon, toon_to_json, validate_toon
+
+TRICKY_STRINGS = [
+    "", " ", " lead", "trail ", "123", "-5", "1.5", "1e3", "007", "-05", "0", "+1", ".5",
+    "null", "true", "false", "{}", "[]", "-", "a:b", "a: b", "http://x.y", '"', '"q"',
+    'say "hi"', "back\\slash", '\\"', "@key a=b", "x", "naïve", "日本語", "nan", "- item",
+    "line1\nline2", "\n", "trailing\n", "\r\n", "tab\there", "\x00\x1f\x7f", "\u2028", "\\n", "a\n  b: c",
+]
+TRICKY_KEYS = ["id", "a:b", '"q"', " pad", "pad ", "-", "@key", "null", "123", "ключ", "a b", "multi\nline"]
+
+
+def _scalar(rng):
+    roll = rng.random()
+    if roll < 0.5:
+        return rng.choice(TRICKY_STRINGS)
+    if roll < 0.6:
+        return "".join(rng.choice('ab :-"\\ 0\n\t') for _ in range(rng.randint(1, 6)))
+    if roll < 0.7:
+        return rng.randint(-10 ** 12, 10 ** 12)
+    if roll < 0.8:
+        return rng.choice([0.5, -2.25, 1e-05, -1e-05, 1e20, 3.0, rng.uniform(-1e6, 1e6)])
+    if roll < 0.9:
+        return rng.choice([True, False])
+    return None
+
+
+def _object(rng, depth):
+    return {rng.choice(TRICKY_KEYS) + str(i % 3 or ""): _value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+def _value(rng, depth):
+    roll = rng.random()
+    if depth > 4 or roll < 0.5:
+        return _scalar(rng)
+    if roll < 0.75:
+        return _object(rng, depth)
+    # Lists hold scalars and objects; directly nested lists have no TOON form
+    return [_object(rng, depth) if rng.random() < 0.3 else _scalar(rng) for _ in range(rng.randint(0, 4))]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_round_trip_property(seed):
+    """Test random documents with ambiguous strings round-trip exactly"""
+    rng = random.Random(seed)
+    data = _object(rng, 0)
+    compact = bool(seed % 2)
+    toon = json_to_toon(data, compact=compact, fidelity=True)
+    assert toon_to_json(toon) == data, toon
+    if data:
+        assert validate_toon(toon, indent=1 if compact else 2) == (True, ""), toon
+    out = io.StringIO()
+    dump_toon(data, out, compact=compact, fidelity=True)
+    assert out.getvalue() == toon
+    assert load_toon(io.StringIO(toon)) == data
+
+
+def test_only_ambiguous_strings_quoted():
+    """Test plain strings stay unquoted and ambiguous ones are quoted"""
+    toon = json_to_toon({"a": "hello", "b": "123", "c": ["x: y", "z"], "d:e": "", "f": "a: b"}, fidelity=True)
+    assert toon == 'a: hello\nb: "123"\nc:\n  "x: y"\n  z\n"d:e": ""\nf: a: b'
+
+
+def test_default_mode_guesses():
+    """Test default mode is unchanged apart from quote-wrapped strings"""
+    assert toon_to_json(json_to_toon({"a": "123", "b": '"q"'})) == {"a": 123, "b": '"q"'}
+    assert toon_to_json("a: {}\nb: []") == {"a": {}, "b": []}
+    assert toon_to_json("a: -1e-05") == {"a": -1e-05}
+
+
+def test_multiline_strings_default_mode():
+    """Test line breaks, padding and colons survive without fidelity mode"""
+    data = {
+        "text": "first line\nsecond: line\n",
+        "padded": "  x  ",
+        "items": ["a: b", "-", "plain", "tab\tand\r\nbreak"],
+        "key\nwith break": "v",
+    }
+    toon = json_to_toon(data)
+    assert toon.count("\n") == 7
+    assert 'text: "first line\\nsecond: line\\n"' in toon
+    assert toon_to_json(toon) == data
+    assert validate_toon(toon) == (True, "")
+
+
+def test_escapes_decode_in_one_pass():
+    """Test JSON-style escapes in quoted tokens"""
+    assert toon_to_json('a: "\\u00e9\\t\\\\n\\""') == {"a": '\u00e9\t\\n"'}
+    assert toon_to_json('"k\\"ey": 1') == {'k"ey': 1}
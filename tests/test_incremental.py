@@ -0,0 +1,98 @@
+"""Tests for incremental re-encoding."""
+
+import copy
+
+import pytest
+from toon_converter import IncrementalEncoder, json_to_toon
+from toon_converter.exceptions import TOONError
+
+DOCUMENT = {
+    "name": "report",
+    "users": [{"name": "Alice", "tags": ["a"]}, {"name": "Bob", "tags": []}],
+    "config": {"depth": 2, "flags": {"x": True}},
+}
+
+
+def test_initial_encode_matches_encoder():
+    """Test the first encode is identical to json_to_toon."""
+    encoder = IncrementalEncoder(indent=4)
+    assert encoder.encode(DOCUMENT) == json_to_toon(DOCUMENT, indent=4)
+
+
+def test_in_place_changes_are_detected():
+    """Test mutating the same object re-renders the changed field."""
+    data = copy.deepcopy(DOCUMENT)
+    encoder = IncrementalEncoder()
+    encoder.encode(data)
+    data["users"][1]["tags"].append("b")
+    data["config"]["depth"] = 3.0
+    data["users"].append({"name": "Carol"})
+    del data["config"]["flags"]
+    assert encoder.encode(data) == json_to_toon(data)
+
+
+def test_unchanged_subtrees_are_reused():
+    """Test untouched siblings keep their cached nodes."""
+    data = copy.deepcopy(DOCUMENT)
+    encoder = IncrementalEncoder()
+    encoder.encode(data)
+    users_node = encoder._root.children["users"]
+    users_text = users_node.text
+    data["config"]["depth"] = 5
+    encoder.encode(data)
+    assert encoder._root.children["users"] is users_node
+    assert users_node.text is users_text
+
+
+def test_type_changes():
+    """Test values changing between scalars and containers."""
+    encoder = IncrementalEncoder()
+    encoder.encode({"a": [{"x": 1}, 2], "b": 1})
+    for data in ({"a": [2, {"x": 1}], "b": True}, {"a": {}, "b": [1]}, {"a": [{}], "b": {"c": None}}):
+        assert encoder.encode(data) == json_to_toon(data)
+
+
+def test_apply_patch():
+    """Test JSON Patch operations splice into the cached output."""
+    encoder = IncrementalEncoder()
+    encoder.encode(DOCUMENT)
+    result = encoder.apply_patch([
+        {"op": "replace", "path": "/users/0/name", "value": "Alicia"},
+        {"op": "add", "path": "/users/-", "value": {"name": "Dan"}},
+        {"op": "add", "path": "/users/1/tags/0", "value": "new"},
+        {"op": "remove", "path": "/config/flags/x"},
+        {"op": "copy", "from": "/name", "path": "/title"},
+        {"op": "move", "from": "/config/depth", "path": "/depth"},
+        {"op": "test", "path": "/title", "value": "report"},
+    ])
+    expected = {
+        "name": "report",
+        "users": [{"name": "Alicia", "tags": ["a"]}, {"name": "Bob", "tags": ["new"]}, {"name": "Dan"}],
+        "config": {"flags": {}},
+        "title": "report",
+        "depth": 2,
+    }
+    assert result == json_to_toon(expected)
+    assert encoder.output == result
+
+
+def test_apply_patch_errors():
+    """Test invalid patches raise TOONError."""
+    encoder = IncrementalEncoder()
+    with pytest.raises(TOONError):
+        encoder.apply_patch([{"op": "remove", "path": "/a"}])
+    encoder.encode({"a": [1]})
+    with pytest.raises(TOONError):
+        encoder.apply_patch([{"op": "replace", "path": "/missing", "value": 1}])
+    with pytest.raises(TOONError):
+        encoder.apply_patch([{"op": "add", "path": "/a/5", "value": 1}])
+    with pytest.raises(TOONError):
+        encoder.apply_patch([{"op": "test", "path": "/a/0", "value": 2}])
+
+
+def test_remove_last_key():
+    """Test removing every key yields an empty document."""
+    encoder = IncrementalEncoder()
+    encoder.encode({"a": 1})
+    assert encoder.apply_patch([{"op": "remove", "path": "/a"}]) == ""
+    assert encoder.apply_patch([{"op": "add", "path": "/b", "value": 2}]) == "b: 2"
@@ -0,0 +1,100 @@
+"""Tests for indexed random access into TOON files."""
+
+import os
+
+import pytest
+from toon_converter import IndexedToonFile, build_index, json_to_toon, toon_to_json
+from toon_converter.exceptions import TOONParseError
+
+DOCUMENT = {
+    "meta": {"version": 2, "owner": "ops", "tags": ["a", "b"]},
+    "users": [{"name": f"user{i}", "roles": ["admin"] if i % 2 else []} for i in range(20)],
+    "numbers": [1, 2, 3],
+    "title": "Archive ünïcode",
+    "nothing": None,
+}
+
+
+@pytest.fixture
+def toon_file(tmp_path):
+    path = tmp_path / "archive.toon"
+    path.write_text(json_to_toon(DOCUMENT), encoding="utf-8")
+    return path
+
+
+def test_top_level_lookup(toon_file):
+    """Test top-level keys parse only their slice."""
+    archive = IndexedToonFile(toon_file)
+    assert list(archive) == list(DOCUMENT)
+    assert archive["title"] == "Archive ünïcode"
+    assert archive["nothing"] is None
+    assert archive["meta"] == toon_to_json(toon_file.read_text(encoding="utf-8"))["meta"]
+
+
+def test_element_lookup(toon_file):
+    """Test array elements and object keys are reachable directly."""
+    archive = IndexedToonFile(toon_file)
+    assert archive.lookup("users", 7) == {"name": "user7", "roles": ["admin"]}
+    assert archive.lookup("users", -1)["name"] == "user19"
+    assert archive.lookup("numbers", 1) == 2
+    assert archive.lookup("meta", "tags") == ["a", "b"]
+    with pytest.raises(IndexError):
+        archive.lookup("users", 20)
+
+
+def test_sidecar_written_and_reused(toon_file):
+    """Test the sidecar is written next to the file and reused."""
+    IndexedToonFile(toon_file)
+    sidecar = str(toon_file) + ".idx"
+    assert os.path.exists(sidecar)
+    mtime = os.stat(sidecar).st_mtime_ns
+    IndexedToonFile(toon_file)
+    assert os.stat(sidecar).st_mtime_ns == mtime
+
+
+def test_index_invalidated_on_change(toon_file):
+    """Test the index is rebuilt when the file changes."""
+    archive = IndexedToonFile(toon_file)
+    assert archive["numbers"] == [1, 2, 3]
+    toon_file.write_text(json_to_toon({"numbers": [9, 8], "extra": 1}), encoding="utf-8")
+    assert archive.lookup("numbers", 0) == 9
+    assert archive["extra"] == 1
+
+
+def test_compact_file(tmp_path):
+    """Test aliased keys are indexed by their full name."""
+    path = tmp_path / "compact.toon"
+    data = {"records": [{"customer_identifier": i} for i in range(10)]}
+    path.write_text(json_to_toon(data, compact=True), encoding="utf-8")
+    archive = IndexedToonFile(path)
+    assert archive.lookup("records", 4) == {"customer_identifier": 4}
+
+
+def test_build_index_spans(toon_file):
+    """Test index entries record byte spans and children."""
+    index = build_index(toon_file)
+    raw = toon_file.read_bytes()
+    users = index["keys"]["users"]
+    assert users["kind"] == "list"
+    assert len(users["children"]) == 20
+    assert raw[users["start"]:users["end"]].startswith(b"users:")
+
+
+def test_build_index_rejects_nesting_under_value(tmp_path):
+    """Test lines nested under a scalar are reported."""
+    path = tmp_path / "bad.toon"
+    path.write_text("a: 1\n  b: 2", encoding="utf-8")
+    with pytest.raises(TOONParseError):
+        build_index(path)
+
+
+def test_quoted_list_items(tmp_path):
+    """Test lists of quoted or colon-bearing scalars are indexed per item."""
+    items = ["x: y", " padded ", "a:b", 'say "hi"', "-1: b"]
+    path = tmp_path / "quoted.toon"
+    path.write_text(json_to_toon({"items": items, "after": 1}), encoding="utf-8")
+    entry = build_index(path)["keys"]["items"]
+    assert entry["kind"] == "list"
+    assert len(entry["children"]) == len(items)
+    archive = IndexedToonFile(path)
+    assert [archive.lookup("items", i) for i in range(len(items))] == items
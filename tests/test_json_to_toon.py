@@ -157,3 +157,48 @@ def test_mixed_array():
     assert "42" in result
     assert "true" in result
     assert "null" in result
+
+
+def test_compact_indentation():
+    """Test compact mode uses single-space indentation."""
+    data = {"parent": {"child": {"leaf": "value"}}}
+    result = json_to_toon(data, compact=True)
+    assert result.split("\n") == ["parent:", " child:", "  leaf: value"]
+
+
+def test_tab_indentation():
+    """Test tab indentation."""
+    data = {"parent": {"child": "value"}}
+    result = json_to_toon(data, indent=1, indent_char="\t")
+    assert result.split("\n") == ["parent:", "\tchild: value"]
+
+
+def test_key_alias_header():
+    """Test repeated long keys are replaced by aliases."""
+    data = {"records": [{"customer_identifier": i, "id": i} for i in range(10)]}
+    result = json_to_toon(data, compact=True)
+    lines = result.split("\n")
+    assert lines[0] == "@key a=customer_identifier"
+    assert "customer_identifier:" not in result
+    # Short keys are not worth an alias
+    assert "id: 3" in result
+
+
+def test_key_aliases_avoid_existing_keys():
+    """Test aliases never shadow keys already in the document."""
+    data = {"a": 1, "items": [{"long_repeated_key": i} for i in range(10)]}
+    result = json_to_toon(data, key_aliases=True)
+    assert "@key b=long_repeated_key" in result
+
+
+def test_compact_is_smaller():
+    """Test compact output is measurably smaller than the default."""
+    data = {
+        "orders": [
+            {"order_identifier": i, "shipping": {"destination_country": "DE", "carrier_name": "DHL"}}
+            for i in range(50)
+        ]
+    }
+    default = json_to_toon(data)
+    compact = json_to_toon(data, compact=True)
+    assert len(compact) < len(default) * 0.7
@@ -0,0 +1,77 @@
+"""Tests for lazy document proxies."""
+
+import io
+
+from toon_converter import LazyMapping, LazySequence, json_to_toon, lazy_load, toon_to_json
+
+DOCUMENT = {
+    "name": "service",
+    "port": 8080,
+    "database": {"host": "localhost", "options": {"timeout": 30, "ssl": True}},
+    "features": ["auth", "logging", 3],
+    "users": [{"name": "Alice", "roles": ["admin"]}, {"name": "Bob", "roles": []}],
+    "empty": None,
+}
+
+
+def test_top_level_access():
+    """Test scalar access on the root proxy."""
+    doc = lazy_load(json_to_toon(DOCUMENT))
+    assert isinstance(doc, LazyMapping)
+    assert list(doc) == list(DOCUMENT)
+    assert doc["name"] == "service"
+    assert doc["port"] == 8080
+    assert doc["empty"] is None
+
+
+def test_nested_proxies():
+    """Test nested blocks are returned as proxies."""
+    doc = lazy_load(json_to_toon(DOCUMENT))
+    database = doc["database"]
+    assert isinstance(database, LazyMapping)
+    assert database["options"]["timeout"] == 30
+    users = doc["users"]
+    assert isinstance(users, LazySequence)
+    assert len(users) == 2
+    assert users[-1]["name"] == "Bob"
+    assert users[0]["roles"] == ["admin"]
+
+
+def test_values_are_cached():
+    """Test repeated access returns the same object."""
+    doc = lazy_load(json_to_toon(DOCUMENT))
+    assert doc["database"] is doc["database"]
+    assert doc["users"][0] is doc["users"][0]
+
+
+def test_matches_full_parse():
+    """Test the proxy compares equal to the full parse."""
+    toon = json_to_toon(DOCUMENT)
+    doc = lazy_load(toon)
+    assert doc == toon_to_json(toon)
+    assert doc.to_dict() == toon_to_json(toon)
+    assert type(doc.to_dict()["users"]) is list
+
+
+def test_compact_and_file_input():
+    """Test alias headers and file objects are supported."""
+    data = {"items": [{"long_field_name": i} for i in range(10)]}
+    doc = lazy_load(io.StringIO(json_to_toon(data, compact=True)))
+    assert doc["items"][9]["long_field_name"] == 9
+
+
+def test_missing_key():
+    """Test missing keys raise KeyError."""
+    doc = lazy_load("a: 1")
+    assert "b" not in doc
+    assert doc.get("b") is None
+
+
+def test_irregular_layout_falls_back():
+    """Test layouts only the full parser understands still parse."""
+    toon = """items:
+  -
+    id: 0
+  id: 1
+  id: 2"""
+    assert lazy_load(toon) == toon_to_json(toon)
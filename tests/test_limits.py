@@ -0,0 +1,55 @@
+"""Tests for depth and size limits."""
+
+import json
+
+import pytest
+
+from toon_converter import TOONLimitError, json_to_toon, toon_to_json
+from toon_converter.limits import JSONShapeScanner, check_data
+
+NESTED = {"a": {"b": {"c": [1, 2, 3]}}}
+
+
+def test_json_to_toon_limits():
+    """Test json_to_toon rejects documents over its limits"""
+    assert json_to_toon(NESTED, max_depth=4, max_nodes=7) == json_to_toon(NESTED)
+    with pytest.raises(TOONLimitError, match="max_depth"):
+        json_to_toon(NESTED, max_depth=3)
+    with pytest.raises(TOONLimitError, match="max_nodes"):
+        json_to_toon(NESTED, max_nodes=6)
+
+
+def test_json_to_toon_limits_on_strings():
+    """Test JSON strings are scanned before they are parsed"""
+    text = json.dumps(NESTED)
+    assert json_to_toon(text, max_depth=4) == json_to_toon(NESTED)
+    with pytest.raises(TOONLimitError):
+        json_to_toon("[" * 100000 + "]" * 100000, max_depth=100)
+
+
+def test_toon_to_json_limits():
+    """Test toon_to_json rejects documents over its limits"""
+    text = json_to_toon(NESTED)
+    assert toon_to_json(text, max_depth=4, max_nodes=7) == NESTED
+    with pytest.raises(TOONLimitError, match="max_depth"):
+        toon_to_json(text, max_depth=3)
+    with pytest.raises(TOONLimitError, match="max_nodes"):
+        toon_to_json(text, max_nodes=6)
+
+
+def test_check_data_fails_before_walking_wide_lists():
+    """Test the node limit trips on a wide list without visiting it"""
+    with pytest.raises(TOONLimitError):
+        check_data({"items": list(range(10 ** 6))}, max_nodes=100)
+
+
+def test_scanner_chunk_boundaries():
+    """Test escapes and strings split across chunks"""
+    body = b'{"a": "x\\\\", "b": "[\\"]", "c": [[1]]}'
+    assert json.loads(body) == {"a": "x\\", "b": '["]', "c": [[1]]}
+    for split in range(len(body)):
+        scanner = JSONShapeScanner()
+        scanner.feed(body[:split])
+        scanner.feed(body[split:])
+        assert scanner.depth == 0
+        assert scanner.nodes == 6
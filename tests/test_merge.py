@@ -0,0 +1,59 @@
+"""Tests for merging TOON fragments."""
+
+import io
+
+import pytest
+from toon_converter import json_to_toon, merge_toon, toon_to_json
+from toon_converter.exceptions import TOONError
+
+
+def test_disjoint_fragments_are_concatenated():
+    """Test fragments without shared keys are merged as text."""
+    a = json_to_toon({"system": {"role": "assistant"}, "rules": ["be brief"]})
+    b = json_to_toon({"context": {"user": "Alice"}})
+    assert merge_toon([a, b]) == a + "\n" + b
+
+
+def test_reindents_fragments():
+    """Test fragments with other indentation widths are normalized."""
+    a = json_to_toon({"a": {"b": {"c": 1}}}, indent=4)
+    b = json_to_toon({"d": [1, 2]}, indent=1, indent_char="\t")
+    assert merge_toon([a, b]) == json_to_toon({"a": {"b": {"c": 1}}, "d": [1, 2]})
+
+
+def test_deep_merge_conflicts():
+    """Test conflicting objects are merged recursively."""
+    a = json_to_toon({"config": {"db": {"host": "a", "port": 1}, "debug": False}, "x": 1})
+    b = json_to_toon({"config": {"db": {"host": "b"}, "cache": True}})
+    result = toon_to_json(merge_toon([a, b]))
+    assert result == {
+        "config": {"db": {"host": "b", "port": 1}, "debug": False, "cache": True},
+        "x": 1,
+    }
+
+
+def test_first_last_strategies():
+    """Test first/last keep one fragment's block."""
+    a, b = "k: 1\nx: a", "k: 2"
+    assert toon_to_json(merge_toon([a, b], strategy="last")) == {"k": 2, "x": "a"}
+    assert toon_to_json(merge_toon([a, b], strategy="first")) == {"k": 1, "x": "a"}
+
+
+def test_error_strategy():
+    """Test conflicts raise with strategy 'error', identical blocks do not."""
+    assert merge_toon(["k: 1", "k: 1"], strategy="error") == "k: 1"
+    with pytest.raises(TOONError):
+        merge_toon(["k: 1", "k: 2"], strategy="error")
+    with pytest.raises(ValueError):
+        merge_toon(["k: 1"], strategy="union")
+
+
+def test_compact_fragments_and_files():
+    """Test alias headers are expanded and file objects are read."""
+    a = json_to_toon({"items": [{"long_field_name": i} for i in range(10)]}, compact=True)
+    b = io.StringIO("extra: true")
+    result = merge_toon([a, b])
+    assert toon_to_json(result) == {
+        "items": [{"long_field_name": i} for i in range(10)],
+        "extra": True,
+    }
@@ -0,0 +1,121 @@
+"""Tests for encoding dataclasses, NamedTuples and slotted objects."""
+
+import datetime
+import io
+from dataclasses import asdict, dataclass, field
+from typing import List, NamedTuple
+
+from toon_converter import dump_toon, json_to_toon, register_encoder, toon_to_json
+
+
+@dataclass
+class Address:
+    city: str
+    zip: str
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    address: Address
+    tags: List[str] = field(default_factory=list)
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Base:
+    __slots__ = ("id",)
+
+
+class Item(Base):
+    __slots__ = ("name", "__secret")
+
+    def __init__(self, id, name, secret=None):
+        self.id = id
+        self.name = name
+        if secret is not None:
+            self.__secret = secret
+
+
+class Money:
+    def __init__(self, amount, currency):
+        self.amount = amount
+        self.currency = currency
+
+
+USERS = [User(1, "Ada", Address("London", "N1"), ["admin"]), User(2, "Bob", Address("Paris", "75001"))]
+
+
+def test_dataclasses_match_asdict():
+    """Test dataclasses encode like their asdict() form"""
+    data = {"users": USERS}
+    expected = {"users": [asdict(user) for user in USERS]}
+    assert json_to_toon(data) == json_to_toon(expected)
+    assert json_to_toon(USERS[0]) == json_to_toon(asdict(USERS[0]))
+    assert json_to_toon(USERS, compact=True) == json_to_toon([asdict(u) for u in USERS], compact=True)
+
+
+def test_namedtuples():
+    """Test NamedTuples encode as objects"""
+    assert toon_to_json(json_to_toon({"points": [Point(1, 2), Point(3, 4)]})) == {
+        "points": [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+    }
+    # Plain tuples keep their previous encoding
+    assert json_to_toon({"t": (1, 2)}) == "t: (1, 2)"
+
+
+def test_slotted_objects():
+    """Test slots along the MRO, private slots and unset slots"""
+    assert toon_to_json(json_to_toon({"items": [Item(1, "a", "s"), Item(2, "b")]})) == {
+        "items": [{"id": 1, "name": "a", "_Item__secret": "s"}, {"id": 2, "name": "b"}]
+    }
+
+
+def test_default_hook():
+    """Test default= converts unknown objects, like json.dumps"""
+    data = {"when": datetime.date(2024, 1, 2), "price": Money(5, "EUR")}
+
+    def default(obj):
+        if isinstance(obj, Money):
+            return {"amount": obj.amount, "currency": obj.currency}
+        return obj.isoformat()
+
+    assert toon_to_json(json_to_toon(data, default=default)) == {
+        "when": "2024-01-02",
+        "price": {"amount": 5, "currency": "EUR"},
+    }
+    # Without a hook, unknown objects fall back to str()
+    assert json_to_toon({"when": datetime.date(2024, 1, 2)}) == "when: 2024-01-02"
+
+
+def test_register_encoder():
+    """Test registered accessors are used for a class"""
+    class Temperature:
+        def __init__(self, celsius):
+            self.celsius = celsius
+
+    register_encoder(Temperature, lambda t: {"c": t.celsius})
+    assert json_to_toon([Temperature(20)]) == "-\n  c: 20"
+
+
+def test_compact_aliases_see_object_fields():
+    """Test key aliases are built from object fields"""
+    points = [Point(i, i) for i in range(3)]
+    users = [User(i, "u", Address("c", "z"), ["t"]) for i in range(10)]
+    toon = json_to_toon({"users": users, "points": points}, compact=True)
+    assert "=address" in toon.splitlines()[0]
+    assert toon_to_json(toon) == {
+        "users": [asdict(user) for user in users],
+        "points": [p._asdict() for p in points],
+    }
+
+
+def test_dump_toon_objects():
+    """Test the streaming writer encodes objects"""
+    out = io.StringIO()
+    dump_toon(USERS, out)
+    assert out.getvalue() == json_to_toon([asdict(user) for user in USERS])
@@ -0,0 +1,172 @@
+"""Tests for import cost and the persistent CLI worker."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+ENV = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), str(ROOT)]))
+
+DEFERRED = [
+    "re",
+    "argparse",
+    "toon_converter.validator",
+    "toon_converter.columnar",
+    "toon_converter.lazy",
+    "toon_converter.index",
+    "toon_converter.incremental",
+    "toon_converter.diff",
+    "toon_converter.merge",
+    "toon_converter.stream",
+    "toon_converter.container",
+    "toon_converter.typed",
+    "toon_converter.codec",
+    "toon_converter.aio",
+    "toon_converter.detect",
+    "asyncio",
+]
+
+
+def _imported_modules(statement):
+    """Return {module: cumulative microseconds} from ``-X importtime``.
+
+    ``site`` is skipped, so ``.pth`` hooks of the environment don't count.
+    """
+    result = subprocess.run(
+        [sys.executable, "-S", "-X", "importtime", "-c", statement],
+        env=ENV, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _eager(modules, names):
+    """Names in ``modules`` that ``typing`` itself does not import.
+
+    The core needs ``typing``, which imports ``re`` on older Pythons.
+    """
+    floor = _imported_modules("import typing")
+    return [name for name in names if name in modules and name not in floor]
+
+
+def test_package_import_defers_optional_modules():
+    """Test importing the package loads only the core converter"""
+    modules = _imported_modules("import toon_converter")
+    total = modules["toon_converter"]
+    assert _eager(modules, DEFERRED + ["json"]) == [], f"imported eagerly ({total}us total)"
+
+
+def test_lazy_attributes_resolve():
+    """Test lazily exported names are importable from the package"""
+    import toon_converter
+    for name in toon_converter.__all__:
+        assert getattr(toon_converter, name) is not None
+    assert "merge_toon" in dir(toon_converter)
+    with pytest.raises(AttributeError):
+        toon_converter.missing_name
+
+
+def test_cli_import_defers_argparse():
+    """Test importing the CLI does not pay for argparse or pathlib"""
+    modules = _imported_modules("import cli.main")
+    assert _eager(modules, DEFERRED + ["json", "pathlib"]) == []
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix sockets")
+def test_daemon_round_trip(tmp_path):
+    """Test commands sent with --daemon run in the warm worker"""
+    sock = str(tmp_path / "toon.sock")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "cli.main", "serve", "--socket", sock],
+        env=ENV, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(100):
+            if os.path.exists(sock):
+                break
+            time.sleep(0.05)
+        (tmp_path / "data.json").write_text('{"name": "Alice"}', encoding="utf-8")
+
+        result = subprocess.run(
+            [sys.executable, "-m", "cli.main", "--daemon", "--socket", sock, "convert", "data.json"],
+            env=ENV, cwd=tmp_path, capture_output=True, text=True,
+        )
+        assert result.returncode == 0
+        assert "Converted" in result.stdout
+        assert (tmp_path / "data.toon").read_text(encoding="utf-8") == "name: Alice"
+
+        result = subprocess.run(
+            [sys.executable, "-m", "cli.main", "--daemon", "--socket", sock, "validate", "missing.toon"],
+            env=ENV, cwd=tmp_path, capture_output=True, text=True,
+        )
+        assert result.returncode == 1
+        assert "not found" in result.stdout
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def test_daemon_falls_back_without_worker(tmp_path):
+    """Test --daemon runs locally when no worker is listening"""
+    (tmp_path / "data.json").write_text('{"a": 1}', encoding="utf-8")
+    result = subprocess.run(
+        [sys.executable, "-m", "cli.main", "--daemon", "--socket", str(tmp_path / "none.sock"),
+         "convert", "data.json"],
+        env=ENV, cwd=tmp_path, capture_output=True, text=True,
+    )
+    assert result.returncode == 0
+    assert (tmp_path / "data.toon").read_text(encoding="utf-8") == "a: 1"
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="requires Unix users")
+def test_default_socket_is_private(tmp_path):
+    """Test the default socket lives in a 0700 directory and others are refused"""
+    env = dict(ENV, TMPDIR=str(tmp_path))
+    env.pop("XDG_RUNTIME_DIR", None)
+    env.pop("TOON_SOCKET", None)
+    sock_dir = tmp_path / f"toon-{os.getuid()}"
+    server = subprocess.Popen([sys.executable, "-m", "cli.main", "serve"], env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        for _ in range(100):
+            if (sock_dir / "toon.sock").exists():
+                break
+            time.sleep(0.05)
+        assert (sock_dir / "toon.sock").exists()
+        assert sock_dir.stat().st_mode & 0o777 == 0o700
+    finally:
+        server.terminate()
+        server.wait()
+
+    # A directory others can write to is neither served on nor trusted
+    sock_dir.chmod(0o777)
+    result = subprocess.run([sys.executable, "-m", "cli.main", "serve"], env=env, capture_output=True, text=True)
+    assert result.returncode == 1
+    assert "not a directory only you can access" in result.stdout
+    (tmp_path / "data.json").write_text('{"a": 1}', encoding="utf-8")
+    result = subprocess.run([sys.executable, "-m", "cli.main", "--daemon", "convert", "data.json"],
+                            env=env, cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == 0
+    assert (tmp_path / "data.toon").read_text(encoding="utf-8") == "a: 1"
+
+
+def test_serve_keeps_other_files(tmp_path):
+    """Test serve refuses to replace a path that is not its own socket"""
+    path = tmp_path / "not-a-socket"
+    path.write_text("keep", encoding="utf-8")
+    result = subprocess.run([sys.executable, "-m", "cli.main", "serve", "--socket", str(path)],
+                            env=ENV, capture_output=True, text=True)
+    assert result.returncode == 1
+    assert "not a socket owned by you" in result.stdout
+    assert path.read_text(encoding="utf-8") == "keep"
@@ -0,0 +1,108 @@
+"""Tests for streaming and compressed file I/O."""
+
+import gzip
+import io
+import lzma
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from toon_converter import dump_toon, json_to_toon, load_toon, open_compressed, toon_to_json
+from toon_converter import stream
+from toon_converter.stream import split_compression
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DATA = {
+    "name": "archive",
+    "users": [{"id": i, "name": f"user{i}", "tags": ["a", "b"], "meta": {}} for i in range(50)],
+    "empty": [],
+}
+
+
+def test_dump_matches_json_to_toon(monkeypatch):
+    """Test chunked output is identical to json_to_toon"""
+    monkeypatch.setattr(stream, "CHUNK_LINES", 7)
+    for options in ({}, {"compact": True}, {"indent": 4, "indent_char": "\t"}):
+        out = io.StringIO()
+        dump_toon(DATA, out, **options)
+        assert out.getvalue() == json_to_toon(DATA, **options)
+
+
+def test_dump_scalars_and_empty():
+    """Test documents json_to_toon special-cases"""
+    for value in ({}, [], 5, None):
+        out = io.StringIO()
+        dump_toon(value, out)
+        assert out.getvalue() == json_to_toon(value)
+
+
+def test_load_matches_toon_to_json():
+    """Test line-by-line parsing agrees with toon_to_json"""
+    for text in (json_to_toon(DATA), json_to_toon(DATA, compact=True), "\n\n  a: 1\nb:\n  - \n", ""):
+        assert load_toon(io.StringIO(text)) == toon_to_json(text)
+
+
+def test_load_reads_lazily():
+    """Test the parser consumes its input as it goes"""
+    consumed = []
+
+    def lines():
+        for i in range(3):
+            consumed.append(i)
+            yield f"k{i}: {i}\n"
+
+    assert load_toon(lines()) == {"k0": 0, "k1": 1, "k2": 2}
+    assert consumed == [0, 1, 2]
+
+
+def test_split_compression():
+    """Test compression suffix detection"""
+    assert split_compression("a.toon.gz") == ("a.toon", "gzip")
+    assert split_compression("a.json.XZ") == ("a.json", "xz")
+    assert split_compression("a.json") == ("a.json", None)
+
+
+@pytest.mark.parametrize("suffix,opener", [(".gz", gzip.open), (".xz", lzma.open)])
+def test_compressed_round_trip(tmp_path, suffix, opener):
+    """Test writing and reading compressed TOON files"""
+    path = tmp_path / f"data.toon{suffix}"
+    with open_compressed(path, "w") as f:
+        dump_toon(DATA, f)
+    with opener(path, "rt", encoding="utf-8") as f:
+        assert f.read() == json_to_toon(DATA)
+    with open_compressed(path) as f:
+        assert load_toon(f) == toon_to_json(json_to_toon(DATA))
+
+
+def test_zstd_requires_implementation(tmp_path):
+    """Test .zst files either work or fail with a clear ImportError"""
+    path = tmp_path / "data.toon.zst"
+    try:
+        with open_compressed(path, "w") as f:
+            dump_toon({"a": 1}, f)
+    except ImportError as e:
+        assert "zstandard" in str(e)
+    else:
+        with open_compressed(path) as f:
+            assert load_toon(f) == {"a": 1}
+
+
+def test_cli_converts_compressed(tmp_path):
+    """Test the CLI keeps the input's compression on conversion"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), str(ROOT)]))
+    with gzip.open(tmp_path / "data.json.gz", "wt", encoding="utf-8") as f:
+        f.write('{"a": [1, 2], "b": {"c": true}}')
+
+    subprocess.run([sys.executable, "-m", "cli.main", "convert", "data.json.gz"],
+                   env=env, cwd=tmp_path, check=True, capture_output=True)
+    with gzip.open(tmp_path / "data.toon.gz", "rt", encoding="utf-8") as f:
+        assert f.read() == "a:\n  1\n  2\nb:\n  c: true"
+
+    subprocess.run([sys.executable, "-m", "cli.main", "convert", "data.toon.gz", "-o", "out.json.xz"],
+                   env=env, cwd=tmp_path, check=True, capture_output=True)
+    with lzma.open(tmp_path / "out.json.xz", "rt", encoding="utf-8") as f:
+        assert f.read() == '{\n  "a": [\n    1,\n    2\n  ],\n  "b": {\n    "c": true\n  }\n}'
@@ -172,3 +172,58 @@ def test_negative_numbers():
 balance: -100.50"""
     result = toon_to_json(toon)
     assert result == {"temperature": -5, "balance": -100.50}
+
+
+def test_object_pairs_hook_order():
+    """Test object_pairs_hook receives pairs in document order."""
+    toon = """zeta: 1
+alpha: 2
+user:
+  name: Alice
+  age: 30"""
+    result = toon_to_json(toon, object_pairs_hook=tuple)
+    assert result == (("zeta", 1), ("alpha", 2), ("user", (("name", "Alice"), ("age", 30))))
+
+
+def test_object_pairs_hook_duplicates():
+    """Test duplicate keys are passed through to the hook."""
+    toon = """name: Alice
+name: Bob"""
+    result = toon_to_json(toon, object_pairs_hook=list)
+    assert result == [("name", "Alice"), ("name", "Bob")]
+
+
+def test_object_pairs_hook_matches_dict():
+    """Test object_pairs_hook=dict matches the default parser."""
+    toon = """users:
+  -
+    name: Alice
+    roles:
+      admin
+      user
+  -
+    name: Bob
+    roles:
+      user
+config:
+  enabled: true
+  empty:"""
+    assert toon_to_json(toon, object_pairs_hook=dict) == toon_to_json(toon)
+
+
+def test_object_pairs_hook_legacy_records():
+    """Test records without '-' are split when a key repeats."""
+    toon = """items:
+  -
+    id: 0
+  id: 1
+  name: a
+  id: 2
+  name: b"""
+    result = toon_to_json(toon, object_pairs_hook=dict)
+    assert result == {"items": [{"id": 0}, {"id": 1, "name": "a"}, {"id": 2, "name": "b"}]}
+
+
+def test_object_pairs_hook_empty():
+    """Test empty input calls the hook with no pairs."""
+    assert toon_to_json("", object_pairs_hook=tuple) == ()
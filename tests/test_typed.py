@@ -0,0 +1,133 @@
+"""Tests for decoding TOON into typed objects."""
+
+import io
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pytest
+
+from toon_converter import TOONParseError, json_to_toon, load_toon, toon_to_json
+
+
+@dataclass
+class Address:
+    city: str
+    zip: str
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    score: float
+    active: bool
+    address: Optional[Address] = None
+    tags: List[str] = field(default_factory=list)
+    meta: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class Team:
+    users: List[User]
+
+
+@dataclass
+class Node:
+    name: str
+    children: List["Node"] = field(default_factory=list)
+
+
+class Point(NamedTuple):
+    x: float
+    y: float
+
+
+USERS = [
+    User(1, "007", 2.0, True, Address("a:b", "01234"), ["true", "x: y"], {"a": 1}),
+    User(2, "", 1.5, False),
+]
+
+
+def test_round_trip_dataclasses():
+    """Test nested dataclasses decode directly from TOON"""
+    assert toon_to_json(json_to_toon({"users": USERS}), into=Team) == Team(USERS)
+    assert toon_to_json(json_to_toon({"users": USERS}, compact=True), into=Team) == Team(USERS)
+
+
+def test_field_types_drive_scalars():
+    """Test strings that look like numbers or booleans stay strings"""
+    user = toon_to_json(json_to_toon(USERS[0]), into=User)
+    assert user.name == "007"
+    assert user.score == 2.0 and isinstance(user.score, float)
+    assert user.address.zip == "01234"
+    assert user.tags == ["true", "x: y"]
+    # Without a type the same text is guessed
+    assert toon_to_json(json_to_toon(USERS[0]))["tags"] == [True, "x: y"]
+
+
+def test_root_list_and_generics():
+    """Test list roots, recursive models and NamedTuples"""
+    assert toon_to_json(json_to_toon(USERS), into=List[User]) == USERS
+    tree = Node("root", [Node("a", [Node("b")]), Node("c")])
+    assert toon_to_json(json_to_toon(tree), into=Node) == tree
+    points = {"p": Point(1, 2), "q": Point(3.5, 4)}
+    assert toon_to_json(json_to_toon(points), into=Dict[str, Point]) == points
+    assert toon_to_json("a:\n  1\n  2", into=Dict[str, Tuple[int, ...]]) == {"a": (1, 2)}
+
+
+def test_load_toon_into():
+    """Test the streaming reader decodes into types"""
+    assert load_toon(io.StringIO(json_to_toon({"users": USERS})), into=Team) == Team(USERS)
+
+
+def test_unknown_fields_ignored():
+    """Test keys without a matching field are skipped"""
+    assert toon_to_json("city: x\nzip: 1\nextra:\n  nested: 1", into=Address) == Address("x", "1")
+
+
+def test_mismatches_raise_with_line_numbers():
+    """Test values that do not fit the declared type are reported"""
+    with pytest.raises(TOONParseError, match="Line 3: Expected int, got 'x'"):
+        toon_to_json("users:\n  -\n    id: x", into=Team)
+    with pytest.raises(TOONParseError, match="Expected bool"):
+        toon_to_json("id: 1\nname: a\nscore: 1\nactive: yes", into=User)
+    with pytest.raises(TOONParseError, match="Cannot build Address"):
+        toon_to_json("city: x", into=Address)
+    with pytest.raises(TOONParseError, match="found an object"):
+        toon_to_json("city:\n  a: 1\nzip: 1", into=Address)
+    with pytest.raises(TypeError):
+        toon_to_json("a: 1", into=int)
+
+
+def test_line_numbers_count_blank_lines_and_header():
+    """Test errors report the document's own line numbers"""
+    text = "@key a=values\n\na:\n\n  1\n\n  x\n"
+    with pytest.raises(TOONParseError, match="Line 7: Expected int"):
+        toon_to_json(text, into=Dict[str, List[int]])
+    with pytest.raises(TOONParseError, match="Line 7: Expected int"):
+        load_toon(io.StringIO(text), into=Dict[str, List[int]])
+    with pytest.raises(TOONParseError, match="Line 3: Expected int"):
+        toon_to_json("\n\n  id: x\nname: a", into=User)
+
+
+@dataclass
+class Pending:
+    id: int
+    later: "LaterType"
+
+
+@dataclass
+class Unsupported:
+    children: List["Unsupported"]
+    value: complex
+
+
+def test_failed_compile_is_not_cached(monkeypatch):
+    """Test a model whose hints fail to compile is not left half-built"""
+    for _ in range(2):
+        with pytest.raises(NameError):
+            toon_to_json("id: 1\nlater: 2", into=Pending)
+        with pytest.raises(TypeError):
+            toon_to_json("value: 1", into=Unsupported)
+    monkeypatch.setitem(globals(), "LaterType", int)
+    assert toon_to_json("id: 1\nlater: 2", into=Pending) == Pending(1, 2)
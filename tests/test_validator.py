@@ -1,7 +1,7 @@
 """Tests for validation functions."""
 
 import pytest
-from toon_converter import validate_json, validate_toon, get_error_details
+from toon_converter import json_to_toon, validate_json, validate_toon, get_error_details
 from toon_converter.exceptions import TOONParseError
 import json
 
@@ -74,6 +74,12 @@ def test_validate_empty_key():
     assert "Empty key" in error
 
 
+def test_validate_quoted_empty_key():
+    """Test an empty key written by the encoder validates."""
+    assert validate_toon(json_to_toon({"": 1})) == (True, "")
+    assert validate_toon(json_to_toon({"a": {"": [1, 2]}})) == (True, "")
+
+
 def test_get_error_details_json():
     """Test error details extraction from JSON error."""
     try:
@@ -117,3 +123,14 @@ def test_validate_complex_structure():
     retries: 3"""
     is_valid, error = validate_toon(complex_toon)
     assert is_valid is True
+
+
+def test_validate_compact_toon():
+    """Test validation of compact TOON with an alias header."""
+    compact_toon = """@key a=display_name
+users:
+ -
+  a: Alice"""
+    is_valid, error = validate_toon(compact_toon, indent=1)
+    assert is_valid is True
+    assert error == ""
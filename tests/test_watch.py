@@ -0,0 +1,103 @@
+"""Tests for 'toon watch' directory mirroring."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ENV = dict(os.environ, PYTHONPATH=os.pathsep.join([str(ROOT / "src"), str(ROOT)]))
+
+
+def _watch_once(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-m", "cli.main", "watch", "src", "--out", "out", "--once", "--workers", "2"],
+        env=ENV, cwd=tmp_path, check=True, capture_output=True, text=True,
+    )
+    return result.stdout
+
+
+def test_watch_once_converts_only_changes(tmp_path):
+    """Test unchanged and touched files are skipped across runs"""
+    src = tmp_path / "src"
+    (src / "nested").mkdir(parents=True)
+    (src / "a.json").write_text('{"a": 1}', encoding="utf-8")
+    (src / "nested" / "b.toon").write_text("b: 2", encoding="utf-8")
+    (src / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    out = _watch_once(tmp_path)
+    assert out.count("Converted") == 2
+    assert (tmp_path / "out" / "a.toon").read_text(encoding="utf-8") == "a: 1"
+    assert json.loads((tmp_path / "out" / "nested" / "b.json").read_text(encoding="utf-8")) == {"b": 2}
+    assert not (tmp_path / "out" / "notes.toon").exists()
+
+    # Touched but unchanged
+    os.utime(src / "a.json", (time.time() + 10, time.time() + 10))
+    assert "Converted" not in _watch_once(tmp_path)
+
+    (src / "a.json").write_text('{"a": 3}', encoding="utf-8")
+    (src / "nested" / "b.toon").unlink()
+    out = _watch_once(tmp_path)
+    assert out.count("Converted") == 1
+    assert (tmp_path / "out" / "a.toon").read_text(encoding="utf-8") == "a: 3"
+    assert "Removed" in out
+    assert not (tmp_path / "out" / "nested" / "b.json").exists()
+
+
+def test_watch_reports_bad_files(tmp_path):
+    """Test a file that fails to convert does not stop the others"""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "bad.json").write_text("{", encoding="utf-8")
+    (src / "good.json").write_text('{"ok": true}', encoding="utf-8")
+
+    out = _watch_once(tmp_path)
+    assert "Error converting" in out
+    assert (tmp_path / "out" / "good.toon").read_text(encoding="utf-8") == "ok: true"
+
+
+def test_watch_polls_for_changes(tmp_path):
+    """Test files written while watching are converted"""
+    (tmp_path / "src").mkdir()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "cli.main", "watch", "src", "--out", "out", "--interval", "0.05", "--workers", "1"],
+        env=ENV, cwd=tmp_path, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        output = tmp_path / "out" / "late.toon"
+        (tmp_path / "src" / "late.json").write_text('{"late": 1}', encoding="utf-8")
+        deadline = time.time() + 10
+        while not (output.exists() and output.read_text(encoding="utf-8")) and time.time() < deadline:
+            time.sleep(0.05)
+        assert output.read_text(encoding="utf-8") == "late: 1"
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def test_watch_rejects_output_in_place(tmp_path):
+    """Test an output directory that is or contains the source is refused"""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.json").write_text('{"id": "123"}', encoding="utf-8")
+    for out in ("src", ".", "src/"):
+        result = subprocess.run(
+            [sys.executable, "-m", "cli.main", "watch", "src", "--out", out, "--once"],
+            env=ENV, cwd=tmp_path, capture_output=True, text=True,
+        )
+        assert result.returncode == 1
+        assert "must not be or contain" in result.stdout
+    assert (src / "a.json").read_text(encoding="utf-8") == '{"id": "123"}'
+    assert sorted(os.listdir(src)) == ["a.json"]
+
+
+def test_watch_skips_hidden_files(tmp_path):
+    """Test hidden files in the source, such as a manifest, are not converted"""
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / ".toon-watch.json").write_text('{"version": "0", "files": {}}', encoding="utf-8")
+    (src / "a.json").write_text('{"a": 1}', encoding="utf-8")
+    assert _watch_once(tmp_path).count("Converted") == 1
+    assert sorted(os.listdir(tmp_path / "out")) == [".toon-watch.json", "a.toon"]